@@ -0,0 +1,127 @@
+from typing import Callable, Dict
+
+from paisy_ui import PUIComponentABC
+from paisy_ui.components import (
+    PUIHTML,
+    PUIAlert,
+    PUIAvatar,
+    PUIBadge,
+    PUIButton,
+    PUICard,
+    PUICheckbox,
+    PUICollapse,
+    PUICountdown,
+    PUIDateInput,
+    PUIDateTimeLocalInput,
+    PUIDiv,
+    PUIDivider,
+    PUIEmailInput,
+    PUIFileInput,
+    PUIFilter,
+    PUIHover3dCard,
+    PUIHover3dCardImg,
+    PUIImg,
+    PUIImgCarousel,
+    PUIKbd,
+    PUIList,
+    PUILoading,
+    PUIModal,
+    PUINumberInput,
+    PUIPasswordInput,
+    PUIProgress,
+    PUIRadialProgress,
+    PUIRadio,
+    PUIRange,
+    PUISearchInput,
+    PUISelect,
+    PUISidebarLayout,
+    PUIStat,
+    PUIStatus,
+    PUISwap,
+    PUISymbol,
+    PUITable,
+    PUITableBody,
+    PUITelephoneInput,
+    PUIText,
+    PUITextInput,
+    PUITextRotate,
+    PUIThemeController,
+    PUITimeInput,
+    PUITitle,
+    PUIToast,
+    PUIToggle,
+    PUIUrlInput,
+)
+
+FACTORIES: Dict[str, Callable[[], PUIComponentABC]] = {
+    "PUIHTML": lambda: PUIHTML(),
+    "PUIDiv": lambda: PUIDiv(),
+    "PUIText": lambda: PUIText(),
+    "PUITitle": lambda: PUITitle(),
+    "PUIImg": lambda: PUIImg(src="https://example.com/img.png"),
+    "PUISymbol": lambda: PUISymbol(symbol="home"),
+    "PUIButton": lambda: PUIButton(),
+    "PUIModal": lambda: PUIModal(id="modal"),
+    "PUISwap": lambda: PUISwap(on="ON", off="OFF"),
+    "PUIThemeController": lambda: PUIThemeController(value="dark"),
+    "PUIAvatar": lambda: PUIAvatar(src="https://example.com/avatar.png"),
+    "PUIBadge": lambda: PUIBadge(),
+    "PUICard": lambda: PUICard(),
+    "PUICollapse": lambda: PUICollapse(title="Title"),
+    "PUIImgCarousel": lambda: PUIImgCarousel(
+        img_srcs=["https://example.com/1.png", "https://example.com/2.png"]
+    ),
+    "PUICountdown": lambda: PUICountdown(
+        id="countdown",
+        values=[PUICountdown.Value(value=10, sufix="h"), PUICountdown.Value(value=5)],
+    ),
+    "PUIHover3dCard": lambda: PUIHover3dCard(),
+    "PUIHover3dCardImg": lambda: PUIHover3dCardImg(img_src="https://example.com/3d.png"),
+    "PUIKbd": lambda: PUIKbd(),
+    "PUIList": lambda: PUIList(title="Title"),
+    "PUIStat": lambda: PUIStat(
+        title="Title", value="R$ 10,00", desc="Desc", symbol="paid"
+    ),
+    "PUIStatus": lambda: PUIStatus(),
+    "PUITable": lambda: PUITable(
+        columns=["Date", "Value"], rows=[["15/12/2025", "20.00"], ["14/12/2025", "-34.00"]]
+    ),
+    "PUITableBody": lambda: PUITableBody(rows=[["15/12/2025", "20.00"]]),
+    "PUITextRotate": lambda: PUITextRotate(),
+    "PUIAlert": lambda: PUIAlert(symbol="info", message="Message", close_button=True),
+    "PUILoading": lambda: PUILoading(),
+    "PUIProgress": lambda: PUIProgress(value=10, max=100),
+    "PUIRadialProgress": lambda: PUIRadialProgress(value=10, max=100),
+    "PUIToast": lambda: PUIToast(
+        messages=[PUIToast.Message(variant="info", content="Message")]
+    ),
+    "PUIDivider": lambda: PUIDivider(content="Divider"),
+    "PUISidebarLayout": lambda: PUISidebarLayout(
+        title="Title",
+        menu_items=[
+            PUISidebarLayout.MenuItem(href="/", content="Home", symbol="home"),
+            PUISidebarLayout.MenuItem(href="/about", content="About"),
+        ],
+    ),
+    "PUICheckbox": lambda: PUICheckbox(name="field", id="field", label="Label"),
+    "PUIFileInput": lambda: PUIFileInput(name="field", id="field", label="Label"),
+    "PUIRadio": lambda: PUIRadio(name="field", id="field", label="Label"),
+    "PUIFilter": lambda: PUIFilter(name="field", id="field", options=["A", "B"]),
+    "PUIRange": lambda: PUIRange(name="field", id="field"),
+    "PUISelect": lambda: PUISelect(
+        name="field", id="field", options=["A", "B"], label="Label", legend="Legend"
+    ),
+    "PUITextInput": lambda: PUITextInput(
+        name="field", id="field", datalist=["A", "B"], legend="Legend"
+    ),
+    "PUIDateInput": lambda: PUIDateInput(name="field", id="field"),
+    "PUITimeInput": lambda: PUITimeInput(name="field", id="field"),
+    "PUIDateTimeLocalInput": lambda: PUIDateTimeLocalInput(name="field", id="field"),
+    "PUISearchInput": lambda: PUISearchInput(name="field", id="field"),
+    "PUIEmailInput": lambda: PUIEmailInput(name="field", id="field"),
+    "PUIPasswordInput": lambda: PUIPasswordInput(name="field", id="field"),
+    "PUINumberInput": lambda: PUINumberInput(name="field", id="field"),
+    "PUITelephoneInput": lambda: PUITelephoneInput(name="field", id="field"),
+    "PUIUrlInput": lambda: PUIUrlInput(name="field", id="field"),
+    "PUIToggle": lambda: PUIToggle(name="field", id="field", label="Label"),
+}
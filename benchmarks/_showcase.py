@@ -0,0 +1,28 @@
+import importlib.util
+from pathlib import Path
+
+from paisy_ui import PUIComponentABC
+
+SHOWCASE_PATH = Path(__file__).parent.parent / "examples" / "showcase.py"
+
+
+def build_showcase() -> PUIComponentABC:
+    """Builds a fresh `page` from `examples/showcase.py`"""
+    spec = importlib.util.spec_from_file_location("showcase", SHOWCASE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.page
+
+
+def build_large_page(copies: int = 10) -> PUIComponentABC:
+    """A single `PUIHTML` page holding the body of `copies` showcase pages"""
+    from paisy_ui.components import PUIHTML, PUIDiv
+
+    page = PUIHTML()
+    # The body of a fresh `PUIHTML` only holds its own scripts
+    static = len(page.wrapper.children)
+    for _ in range(copies):
+        section = PUIDiv()
+        section.node.extend(build_showcase().wrapper.children[static:])
+        page[section]
+    return page
@@ -0,0 +1,35 @@
+"""Element lookups of the component properties: `pui-anchor` index vs a `find()` search of the tree
+
+    poetry run python -m benchmarks.anchors
+"""
+
+import timeit
+
+from paisy_ui.components import PUIHTML, PUISelect, PUIStat, PUITextInput
+
+NUMBER = 20_000
+REPEAT = 5
+
+
+def main():
+    stat = PUIStat(title="Title", value="R$ 10,00", desc="Desc", symbol="paid")
+    text_input = PUITextInput(name="field", id="field", legend="Legend", label="Label")
+    select = PUISelect(name="field", id="field", options=["A"] * 20, label="Label")
+    page = PUIHTML()
+    cases = (
+        ("PUIStat.desc", lambda: stat.desc, lambda: stat.find(attrs={"class": "stat-desc"})),
+        ("PUIStat.figure", lambda: stat.figure, lambda: stat.find(attrs={"class": "stat-figure"})),
+        ("PUITextInput.input", lambda: text_input.input, lambda: text_input.find("input")),
+        ("PUISelect.input", lambda: select.input, lambda: select.find("select")),
+        ("PUIHTML body", lambda: page.find("body", anchor="body"), lambda: page.find("body")),
+    )
+    print(f"{'lookup':<22}{'find (us)':>12}{'anchor (us)':>14}{'speedup':>10}")
+    for name, anchored, searched in cases:
+        assert anchored() is searched()
+        before = min(timeit.repeat(searched, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+        after = min(timeit.repeat(anchored, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+        print(f"{name:<22}{before:>12.2f}{after:>14.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Monthly statements for many users: serial render vs `render_batch` on a process pool
+
+    poetry run python -m benchmarks.batch
+"""
+
+import tempfile
+import time
+
+from paisy_ui.batch import PUIBatchReport, render_batch
+from paisy_ui.components import PUIHTML, PUIStat, PUITable
+
+USERS = 400
+TRANSACTIONS = 40
+
+
+def statement(user_id: int) -> PUIHTML:
+    return PUIHTML()[
+        PUIStat(title="Cashback", value=f"R$ {user_id % 97},00", desc="This month", symbol="paid"),
+        PUITable(
+            columns=["Date", "Store", "Cashback"],
+            rows=(
+                (f"{day % 28 + 1:02d}/05/2025", f"Store {user_id * day % 13}", f"R$ {day},00")
+                for day in range(TRANSACTIONS)
+            ),
+        ),
+    ]
+
+
+def main():
+    print(f"{USERS} statements")
+    start = time.perf_counter()
+    for user_id in range(USERS):
+        statement(user_id).render()
+    serial = time.perf_counter() - start
+    print(f"{'serial':<12}{USERS / serial:>10.0f} pages/s")
+
+    report = PUIBatchReport()
+    for _ in render_batch(statement, range(USERS), report=report):
+        pass
+    print(f"{'pool':<12}{report.pages_per_second:>10.0f} pages/s")
+    for pid, worker in sorted(report.workers.items()):
+        print(f"  worker {pid:<8}{worker.pages:>6} pages{worker.pages_per_second:>10.0f} pages/s")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        report = PUIBatchReport()
+        for _ in render_batch(statement, range(USERS), output_dir=output_dir, report=report):
+            pass
+        print(f"{'pool + disk':<12}{report.pages_per_second:>10.0f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Cost of chained mixin properties, and the classes they leave on the node
+
+    poetry run python -m benchmarks.classes
+"""
+
+import timeit
+
+from paisy_ui.components import PUIButton, PUIDiv
+
+NUMBER = 5_000
+REPEAT = 7
+
+
+def chain_div() -> PUIDiv:
+    return PUIDiv().display_flex_row.gap_sm.padding_lg.items_center.justify_between.width_full
+
+
+def chain_button() -> PUIButton:
+    # Variants applied again by a wrapper component, e.g. a themed button factory
+    return PUIButton().primary.soft.sm.primary.soft.sm
+
+
+def main():
+    print(f"{'case':<16}{'us':>10}{'classes':>10}")
+    for name, factory in (("div chain", chain_div), ("button repeat", chain_button)):
+        factory()
+        elapsed = min(timeit.repeat(factory, number=NUMBER, repeat=REPEAT)) / NUMBER
+        classes = len(factory().node.classes)
+        print(f"{name:<16}{elapsed * 1e6:>10.2f}{classes:>10}")
+
+
+if __name__ == "__main__":
+    main()
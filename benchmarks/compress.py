@@ -0,0 +1,37 @@
+"""Gzipped responses: render + gzip of the whole html vs `render_gzip()` splicing the compressed layout shell
+
+    poetry run python -m benchmarks.compress
+"""
+
+import gzip
+import timeit
+
+from paisy_ui.components import PUIHTML, PUIStat, PUIText
+
+NUMBER = 200
+
+
+def build_page(stats: int) -> PUIHTML:
+    stats = tuple(
+        PUIStat(title=f"Balance {index}", value=f"R$ {index},00", desc="Today", symbol="paid")
+        for index in range(stats)
+    )
+    return PUIHTML()[(PUIText()["Welcome back"], *stats)]
+
+
+def main():
+    print(f"{'body':<12}{'render+gzip (ms)':>18}{'render_gzip (ms)':>18}{'gzip (KiB)':>12}{'render_gzip (KiB)':>19}")
+    for stats in (1, 20, 200):
+        page = build_page(stats)
+        whole = min(timeit.repeat(lambda: gzip.compress(page.render().encode(), mtime=0), number=NUMBER, repeat=3))
+        spliced = min(timeit.repeat(lambda: b"".join(page.render_gzip()), number=NUMBER, repeat=3))
+        whole_size = len(gzip.compress(page.render().encode(), mtime=0))
+        spliced_size = len(b"".join(page.render_gzip()))
+        print(
+            f"{f'{stats} stats':<12}{whole / NUMBER * 1e3:>18.3f}{spliced / NUMBER * 1e3:>18.3f}"
+            f"{whole_size / 1024:>12.1f}{spliced_size / 1024:>19.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Refreshing a live dashboard: full re-render vs `diff()` + out-of-band fragments
+
+    poetry run python -m benchmarks.diff
+"""
+
+import timeit
+
+from paisy_ui.components import PUIHTML, PUIBadge, PUIDiv, PUIStat, PUIText
+from paisy_ui.diff import PUISnapshot, diff
+from paisy_ui.nodes import PUIElement, PUITextNode
+
+ROWS = 1_000
+NUMBER = 10
+
+
+def build_dashboard(balance: str, changed_rows=()) -> PUIHTML:
+    rows = PUIDiv(id="rows").display_flex_col
+    for index in range(ROWS):
+        status = "paid" if index in changed_rows else "pending"
+        rows[
+            PUIDiv(id=f"row-{index}").display_flex_row.gap_sm[
+                PUIText()[f"Order #{index}"], PUIBadge().primary[status]
+            ]
+        ]
+    return PUIHTML()[
+        PUIDiv().display_flex_row[
+            PUIStat(id="balance", title="Balance", value=balance, desc="Today"),
+            PUIStat(id="orders", title="Orders", value=str(ROWS), desc="Today"),
+        ],
+        rows,
+    ]
+
+
+def check_equal_values():
+    """Equal python values rendering differently (`-1`/`-2` hash alike, `1 == True == 1.0`) count as changes"""
+    for old, new in ((-1, -2), (1, True), (1, 1.0)):
+        before, after = (
+            PUIElement("main", {}, [], [PUIElement("div", {"id": "a", "tabindex": value}, [], [PUITextNode("x")])])
+            for value in (old, new)
+        )
+        assert diff(before, after).changed, (old, new)
+
+
+def main():
+    check_equal_values()
+    before = build_dashboard("R$ 10,00")
+    cases = (
+        ("one stat", build_dashboard("R$ 12,00")),
+        ("stat + 5 rows", build_dashboard("R$ 12,00", changed_rows=range(0, 500, 100))),
+    )
+    # The snapshot of the previous refresh, as kept by a live view between two updates
+    snapshot = PUISnapshot(before)
+    print(f"{'update':<16}{'full (ms)':>11}{'full (KiB)':>12}{'diff (ms)':>11}{'oob (KiB)':>11}{'fragments':>11}")
+    for name, after in cases:
+        full = timeit.timeit(lambda: after.render(pretty=False), number=NUMBER) / NUMBER
+        full_size = len(after.render(pretty=False).encode())
+        update = timeit.timeit(lambda: diff(snapshot, after).render_oob(), number=NUMBER) / NUMBER
+        changes = diff(snapshot, after)
+        oob_size = len(changes.render_oob().encode())
+        print(
+            f"{name:<16}{full * 1e3:>11.2f}{full_size / 1024:>12.1f}{update * 1e3:>11.2f}"
+            f"{oob_size / 1024:>11.1f}{len(changes.fragments):>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
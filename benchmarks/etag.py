@@ -0,0 +1,50 @@
+"""Conditional requests of a rarely changing page (a FAQ of `PUICollapse`s) with `paisy_ui.http.html_response`
+
+    poetry run python -m benchmarks.etag
+"""
+
+import timeit
+
+from starlette.requests import Request
+
+from paisy_ui.components import PUIHTML, PUICollapse
+from paisy_ui.http import PUIRenderCache, html_response
+
+QUESTIONS = 100
+NUMBER = 50
+
+
+def build_faq() -> PUIHTML:
+    return PUIHTML()[
+        tuple(
+            PUICollapse(title=f"Question {index}?")[f"Answer {index}."]
+            for index in range(QUESTIONS)
+        )
+    ]
+
+
+def request(if_none_match: str = "") -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/faq", "headers": headers, "query_string": b""})
+
+
+def main():
+    cache = PUIRenderCache()
+    content_etag = html_response(request(), build_faq).headers["etag"]
+    version_etag = html_response(request(), build_faq, version=1).headers["etag"]
+    html_response(request(), build_faq, version=1, cache=cache)
+    cases = (
+        ("render, no etag", lambda: build_faq().render()),
+        ("content etag, 200", lambda: html_response(request(), build_faq)),
+        ("content etag, 304", lambda: html_response(request(content_etag), build_faq)),
+        ("version, cached 200", lambda: html_response(request(), build_faq, version=1, cache=cache)),
+        ("version, 304", lambda: html_response(request(version_etag), build_faq, version=1)),
+    )
+    print(f"{'request':<22}{'ms':>10}")
+    for name, handle in cases:
+        elapsed = min(timeit.repeat(handle, number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:<22}{elapsed * 1e3:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
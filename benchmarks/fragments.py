@@ -0,0 +1,61 @@
+"""Serving one part of a page: build the full page + `find()` vs a registered fragment
+
+    poetry run python -m benchmarks.fragments
+"""
+
+import timeit
+
+from paisy_ui.components import (
+    PUIHTML,
+    PUIButton,
+    PUIModal,
+    PUISidebarLayout,
+    PUITable,
+    PUITextInput,
+)
+from paisy_ui.fragments import PUIFragments
+from paisy_ui.render import iter_render
+
+ROWS = 500
+NUMBER = 20
+
+page = PUIFragments()
+
+
+@page.fragment("modal-edit")
+def edit_modal(user: dict) -> PUIModal:
+    return PUIModal(id="modal-edit")[
+        PUITextInput(name="name", id="name", legend="Name", value=user["name"]),
+        PUIButton().primary["Save"],
+    ]
+
+
+@page.fragment("orders")
+def orders_table(user: dict) -> PUITable:
+    rows = [[f"#{index}", f"{index * 1.5:.2f}"] for index in range(ROWS)]
+    return PUITable(columns=["Order", "Value"], rows=rows)
+
+
+def build_page(user: dict) -> PUIHTML:
+    menu = [PUISidebarLayout.MenuItem(href="/", content="Home", symbol="home")]
+    return PUIHTML()[
+        PUISidebarLayout(title=user["name"], menu_items=menu)[
+            orders_table(user), edit_modal(user)
+        ]
+    ]
+
+
+def main():
+    user = {"name": "Maria"}
+    cases = (
+        ("page + find()", lambda: "".join(iter_render(build_page(user).find(attrs={"id": "modal-edit"})))),
+        ("fragment", lambda: page.render("modal-edit", user)),
+    )
+    print(f"{'modal-edit':<16}{'ms':>10}")
+    for name, render in cases:
+        elapsed = min(timeit.repeat(render, number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:<16}{elapsed * 1e3:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Pages sharing a sidebar, a theme controller and alerts: build them for every request vs frozen once at startup
+
+    poetry run python -m benchmarks.freeze
+"""
+
+import timeit
+
+from paisy_ui.components import (
+    PUIHTML,
+    PUIAlert,
+    PUISidebarLayout,
+    PUIStat,
+    PUIThemeController,
+)
+
+NUMBER = 200
+MENU_ITEMS = [
+    PUISidebarLayout.MenuItem(href=f"/page-{i}", content=f"Page {i}", symbol="home")
+    for i in range(8)
+]
+
+
+def sidebar() -> PUISidebarLayout:
+    return PUISidebarLayout(title="Dashboard", menu_items=MENU_ITEMS)
+
+
+def chrome():
+    return (
+        PUIThemeController(value="dark"),
+        PUIAlert(symbol="info", message="Maintenance on sunday").info,
+        PUIAlert(symbol="warning", message="Confirm your e-mail", close_button=True).warning,
+    )
+
+
+def content() -> PUIStat:
+    return PUIStat(title="Balance", value="R$ 10,00", desc="Today", symbol="paid")
+
+
+SIDEBAR = sidebar().freeze()
+CHROME = tuple(component.freeze() for component in chrome())
+
+
+def build_each_request() -> PUIHTML:
+    return PUIHTML()[sidebar()[(*chrome(), content())]]
+
+
+def build_frozen() -> PUIHTML:
+    return PUIHTML()[SIDEBAR[(*CHROME, content())]]
+
+
+def main():
+    assert build_each_request().render() == build_frozen().render()
+    print(f"{'components':<12}{'build (ms)':>12}{'build + render (ms)':>22}")
+    for name, build in (("each request", build_each_request), ("frozen", build_frozen)):
+        built = min(timeit.repeat(build, number=NUMBER, repeat=3)) / NUMBER
+        rendered = min(timeit.repeat(lambda: build().render(), number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:<12}{built * 1e3:>12.3f}{rendered * 1e3:>22.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Cold import time of the package (`python -X importtime`), and whether bs4 is loaded by the import alone
+
+    poetry run python -m benchmarks.importtime
+"""
+
+import os
+import subprocess
+import sys
+from typing import Tuple
+
+STATEMENTS = (
+    "import paisy_ui",
+    "from paisy_ui.components import PUIDiv",
+    "from paisy_ui.components import *",
+    "from paisy_ui.components import PUIDiv; PUIDiv().render()",
+)
+RUNS = 5
+
+
+def import_time(statement: str) -> Tuple[int, bool]:
+    """Runs `statement` in a fresh interpreter, returning the time (us) of all its imports and whether bs4 was one"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    total = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        modules.add(module.strip())
+        # Nested imports are indented and already counted in their parent's cumulative time
+        if not module[1:].startswith(" "):
+            total += int(cumulative)
+    return total, "bs4" in modules
+
+
+def main():
+    # Imports done by the interpreter startup alone
+    startup = min(import_time("pass")[0] for _ in range(RUNS))
+    print(f"{'statement':<58}{'import (ms)':>12}{'bs4':>6}")
+    for statement in STATEMENTS:
+        runs = [import_time(statement) for _ in range(RUNS)]
+        best = min(total for total, _ in runs) - startup
+        print(f"{statement:<58}{best / 1e3:>12.1f}{'yes' if runs[0][1] else 'no':>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Subtree memoization: a table repeating the same stat, alert and status in every row
+
+    poetry run python -m benchmarks.memo
+"""
+
+import timeit
+
+from paisy_ui.components import PUIAlert, PUIStat, PUIStatus, PUITable
+from paisy_ui.nodes import PUIElement, PUITextNode
+from paisy_ui.render import PUIRenderMemo, iter_render
+
+NUMBER = 10
+ROWS = 2_000
+
+
+def build_table() -> PUITable:
+    return PUITable(
+        columns=["ID", "Balance", "Alert", "Status"],
+        rows=(
+            (
+                i,
+                PUIStat(title="Balance", value="R$ 10,00", desc="Today", symbol="paid"),
+                PUIAlert(symbol="info", message="Pending", close_button=True),
+                PUIStatus().success,
+            )
+            for i in range(ROWS)
+        ),
+    )
+
+
+def check_equal_values():
+    """Equal python values rendering differently (`-1`/`-2` hash alike, `1 == True == 1.0`) are not shared"""
+    values = [("tabindex", -1), ("tabindex", -2), ("data-x", 1), ("data-x", True), ("data-x", 1.0)]
+    section = PUIElement(
+        "section", {}, [], [PUIElement("div", {name: value}, [], [PUITextNode("x")]) for name, value in values * 2]
+    )
+    for pretty in (True, False):
+        expected = "".join(iter_render(section, pretty=pretty))
+        assert "".join(iter_render(section, pretty=pretty, memo=PUIRenderMemo())) == expected
+
+
+def main():
+    check_equal_values()
+    table = build_table()
+    print(f"{ROWS} rows")
+    print(f"{'mode':<10}{'memo':<8}{'time (ms)':>12}{'hit rate':>10}")
+    for mode, pretty in (("pretty", True), ("compact", False)):
+        plain = timeit.timeit(lambda: table.render(pretty=pretty), number=NUMBER)
+        print(f"{mode:<10}{'off':<8}{plain / NUMBER * 1e3:>12.2f}")
+        memo = PUIRenderMemo()
+        memoized = timeit.timeit(lambda: table.render(pretty=pretty, memo=memo), number=NUMBER)
+        print(f"{mode:<10}{'on':<8}{memoized / NUMBER * 1e3:>12.2f}{memo.hit_rate:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""`PUIElement` node tree vs the equivalent `bs4.Tag` tree: memory per 10k components and render throughput
+
+    poetry run python -m benchmarks.nodes
+"""
+
+import timeit
+import tracemalloc
+
+from paisy_ui.components import PUIBadge, PUIDiv, PUIText
+
+from ._showcase import build_showcase
+
+COMPONENTS = 10_000
+NUMBER = 20
+
+
+def build_component():
+    return PUIDiv().display_flex_row.gap_sm[PUIBadge().primary["New"], PUIText()["Label"]]
+
+
+def traced_size(build) -> int:
+    """Returns the memory still allocated by the objects `build()` returns, in bytes"""
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    components = [build_component() for _ in range(COMPONENTS)]
+    nodes = traced_size(lambda: [c.node.clone() for c in components])
+    tags = traced_size(lambda: [c.node.to_tag() for c in components])
+    print(f"memory per {COMPONENTS} components")
+    print(f"  {'nodes':<8}{nodes / 1024 / 1024:>10.2f} MiB")
+    print(f"  {'bs4':<8}{tags / 1024 / 1024:>10.2f} MiB")
+
+    page = build_showcase()
+    tag = page.node.to_tag()
+    size = len(page.render().encode())
+    print(f"render throughput ({size} bytes page)")
+    for name, render in (
+        ("nodes", page.render),
+        ("bs4", lambda: tag.prettify(formatter="html5")),
+    ):
+        elapsed = timeit.timeit(render, number=NUMBER) / NUMBER
+        print(f"  {name:<8}{1 / elapsed:>10.1f} pages/s{size / elapsed / 1024 / 1024:>10.2f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Conformance and throughput of the `parse_html` backends (`paisy_ui.parsers`)
+
+    poetry run python -m benchmarks.parsers
+
+Every component is built under every installed backend and its node tree compared to the `html.parser` one,
+the exit status is 1 on any difference
+"""
+
+import sys
+import timeit
+from contextlib import contextmanager
+from typing import Callable, List, Tuple
+from unittest import mock
+
+from paisy_ui import PUIComponentABC, parsers, utils
+from paisy_ui.batch import compiled_templates
+from paisy_ui.exceptions import PUIBuildError
+from paisy_ui.nodes import PUIElement, PUINode
+
+from ._components import FACTORIES
+
+NUMBER = 200
+# Markup the components do not use, but a template might
+SAMPLES = (
+    "<div><!-- comment --><span>a &amp; b &copy; &#169;</span></div>",
+    "<a href=/path/to rel='nofollow  noopener'>link</a>",
+    '<p class=" a  b ">text <b>bold</b> <i>italic</i></p>',
+    "<fieldset><legend>L</legend><input type=checkbox checked/><br><label>x</label></fieldset>",
+    "<ul>\n    <li>one</li>\n    <li>two</li>\n</ul>",
+    "<div><script>if (a < b && c > d) { run() }</script><style>a > b { }</style></div>",
+    "<table><tbody><tr><td headers='a  b'>1</td></tr></tbody></table>",
+    "<div><div>[[content]]</div>[[content]]</div>",
+)
+
+
+def dump(node: PUINode) -> tuple:
+    """Returns the whole tree under `node` as nested tuples"""
+    if isinstance(node, PUIElement):
+        return (
+            node.name,
+            tuple(sorted(node.attrs.items())),
+            tuple(node.classes),
+            tuple(dump(child) for child in node.children),
+        )
+    return (node.__class__.__name__, node.text)
+
+
+def installed_parsers() -> List[str]:
+    names = []
+    for name in parsers.available_parsers():
+        try:
+            parsers.check_parser(name)
+        except PUIBuildError:
+            print(f"{name}: not installed, skipped")
+            continue
+        names.append(name)
+    return names
+
+
+@contextmanager
+def using_parser(name: str):
+    """Compiles every template again with the `name` backend"""
+    previous = parsers.get_parser()
+    parsers.set_parser(name)
+    templates = compiled_templates()
+    for cls, _ in templates:
+        del cls._template
+    try:
+        yield
+    finally:
+        parsers.set_parser(previous)
+        for cls, template in templates:
+            cls._template = template
+
+
+def build(factory: Callable[[], PUIComponentABC]) -> tuple:
+    # Generated ids must not tell the backends apart
+    with mock.patch.object(utils, "uuid4", return_value="fixed"):
+        return dump(factory().node)
+
+
+def conformance(names: List[str]) -> List[Tuple[str, str]]:
+    """Returns the (parser, case) pairs whose tree differs from the `html.parser` one"""
+    expected = {case: build(factory) for case, factory in FACTORIES.items()}
+    for index, sample in enumerate(SAMPLES):
+        node, wrapper = utils.parse_nodes(sample, parser=parsers.DEFAULT_PARSER)
+        expected[f"sample:{index}"] = (dump(node), dump(wrapper) if wrapper else None)
+
+    failures = []
+    for name in names:
+        with using_parser(name):
+            actual = {case: build(factory) for case, factory in FACTORIES.items()}
+        for index, sample in enumerate(SAMPLES):
+            node, wrapper = utils.parse_nodes(sample, parser=name)
+            actual[f"sample:{index}"] = (dump(node), dump(wrapper) if wrapper else None)
+        failures.extend((name, case) for case in expected if actual[case] != expected[case])
+    return failures
+
+
+def throughput(names: List[str]) -> None:
+    docstrings = [cls.__doc__ for cls, _ in compiled_templates()]
+    size = sum(len(doc) for doc in docstrings) / 1024
+    print(f"\n{'parser':<14}{'templates/s':>14}{'KiB/s':>12}{'speedup':>10}")
+    baseline = None
+    for name in names:
+        elapsed = timeit.timeit(
+            lambda: [utils.parse_nodes(doc, parser=name) for doc in docstrings], number=NUMBER // 10
+        ) / (NUMBER // 10)
+        baseline = baseline or elapsed
+        print(
+            f"{name:<14}{len(docstrings) / elapsed:>14.0f}{size / elapsed:>12.0f}{baseline / elapsed:>9.1f}x"
+        )
+
+    print(f"\n{'parser':<14}{'fragment (us)':>14}")
+    for name in names:
+        elapsed = timeit.timeit(
+            lambda: utils.parse_nodes('<span class="badge">New</span>', parser=name), number=NUMBER
+        ) / NUMBER
+        print(f"{name:<14}{elapsed * 1e6:>14.1f}")
+
+
+def main() -> int:
+    names = installed_parsers()
+    failures = conformance(names)
+    cases = len(FACTORIES) + len(SAMPLES)
+    for name in names:
+        failed = [case for parser, case in failures if parser == name]
+        print(f"{name}: {cases - len(failed)}/{cases} trees match html.parser {' '.join(failed)}")
+    throughput(names)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
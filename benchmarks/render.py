@@ -0,0 +1,23 @@
+"""Prettified vs compact render of `examples/showcase.py`
+
+    poetry run python -m benchmarks.render
+"""
+
+import timeit
+
+from ._showcase import build_showcase
+
+NUMBER = 50
+
+
+def main():
+    page = build_showcase()
+    print(f"{'mode':<10}{'time (ms)':>12}{'size (bytes)':>16}")
+    for mode, pretty in (("pretty", True), ("compact", False)):
+        size = len(page.render(pretty=pretty).encode())
+        elapsed = timeit.timeit(lambda: page.render(pretty=pretty), number=NUMBER)
+        print(f"{mode:<10}{elapsed / NUMBER * 1e3:>12.2f}{size:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Event loop latency while large pages render: blocking `render()` vs `render_async()` (thread pool and cooperative)
+
+    poetry run python -m benchmarks.render_async
+"""
+
+import asyncio
+import statistics
+import time
+
+from paisy_ui import aio
+
+from ._showcase import build_large_page
+
+RENDERS = 20
+CONCURRENCY = 4
+TICK = 0.001
+
+
+async def probe(latencies: list, stop: asyncio.Event):
+    """Measures how late the loop wakes up a task sleeping for `TICK`"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        latencies.append(time.perf_counter() - start - TICK)
+
+
+async def run(mode: str, page) -> list:
+    async def render():
+        if mode == "blocking":
+            return page.render()
+        return await page.render_async(cooperative=mode == "cooperative")
+
+    async def worker():
+        for _ in range(RENDERS // CONCURRENCY):
+            await render()
+            await asyncio.sleep(0)
+
+    latencies: list = []
+    stop = asyncio.Event()
+    probing = asyncio.create_task(probe(latencies, stop))
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    stop.set()
+    await probing
+    return latencies
+
+
+async def main():
+    page = build_large_page()
+    print(f"{RENDERS} renders, {CONCURRENCY} concurrent")
+    print(f"{'mode':<14}{'p50 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}")
+    for mode in ("blocking", "pool", "cooperative"):
+        latencies = await run(mode, page)
+        p99 = statistics.quantiles(latencies, n=100, method="inclusive")[98] if len(latencies) > 1 else latencies[0]
+        print(
+            f"{mode:<14}{statistics.median(latencies) * 1e3:>10.2f}"
+            f"{p99 * 1e3:>10.2f}{max(latencies) * 1e3:>10.2f}"
+        )
+    stats = aio.get_pool().stats()
+    print(f"\npool: {stats.completed} renders, wait mean {stats.wait_mean * 1e3:.2f} ms, max {stats.wait_max * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,45 @@
+"""Writing `examples/showcase.py` to a binary file: `str()` + `encode()` + `write()` vs `render_to()`
+
+    poetry run python -m benchmarks.render_to
+"""
+
+import os
+import tempfile
+import timeit
+import tracemalloc
+
+from ._showcase import build_showcase
+
+NUMBER = 20
+
+
+def write_str(page, file):
+    file.write(str(page).encode("utf-8"))
+
+
+def write_render_to(page, file):
+    page.render_to(file)
+
+
+def peak_memory(write, page, file) -> int:
+    tracemalloc.start()
+    write(page, file)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    page = build_showcase()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "index.html")
+        print(f"{'write':<12}{'time (ms)':>12}{'peak (KiB)':>14}")
+        for name, write in (("str()", write_str), ("render_to()", write_render_to)):
+            with open(path, "wb") as file:
+                elapsed = min(timeit.repeat(lambda: write(page, file), number=NUMBER, repeat=3))
+                peak = peak_memory(write, page, file)
+            print(f"{name:<12}{elapsed / NUMBER * 1e3:>12.2f}{peak / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Layout shells: `PUIHTML` and `PUISidebarLayout` around a small body, alone and nested (the documented usage),
+with and without the cached shells
+
+    poetry run python -m benchmarks.shell
+"""
+
+import timeit
+
+from paisy_ui.components import PUIHTML, PUISidebarLayout, PUIStat, PUIText
+
+NUMBER = 500
+MENU_ITEMS = [
+    PUISidebarLayout.MenuItem(href=f"/page-{i}", content=f"Page {i}", symbol="home")
+    for i in range(8)
+]
+
+
+def body():
+    return (
+        PUIText()["Welcome back"],
+        PUIStat(title="Balance", value="R$ 10,00", desc="Today", symbol="paid"),
+    )
+
+
+LAYOUTS = {
+    "PUIHTML": lambda: PUIHTML()[body()],
+    "PUISidebarLayout": lambda: PUISidebarLayout(title="Dashboard", menu_items=MENU_ITEMS)[body()],
+    "nested": lambda: PUIHTML()[PUISidebarLayout(title="Dashboard", menu_items=MENU_ITEMS)[body()]],
+}
+
+
+def main():
+    print(f"{'layout':<18}{'shell':<8}{'render (ms)':>14}{'chunks (ms)':>14}")
+    for name, build in LAYOUTS.items():
+        for layout_shell in (False, True):
+            # Set on the classes before building, nested layouts keep the mode they were built with
+            PUIHTML.layout_shell = PUISidebarLayout.layout_shell = layout_shell
+            page = build()
+            render = timeit.timeit(lambda: page.render(), number=NUMBER)
+            chunks = timeit.timeit(lambda: b"".join(page.render_chunks()), number=NUMBER)
+            print(
+                f"{name:<18}{'on' if layout_shell else 'off':<8}"
+                f"{render / NUMBER * 1e3:>14.3f}{chunks / NUMBER * 1e3:>14.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""`paisy-ui build` of a 500 page site: full build, nothing changed, one page edited, a shared module edited
+
+    poetry run python -m benchmarks.site
+"""
+
+import tempfile
+from pathlib import Path
+
+from paisy_ui.site import build_site
+
+PAGES = 500
+
+COMMON = '''
+from paisy_ui.components import PUIHTML, PUIStat, PUIText, PUITitle
+
+
+def layout(title, *content):
+    return PUIHTML()[(PUITitle()[title], *content)]
+'''
+
+PAGE = '''
+from common import PUIStat, PUIText, layout
+
+page = layout(
+    "Page {index}",
+    PUIText()["Version {version}"],
+    *(PUIStat(title=f"Stat {{i}}", value=str({index} * i), desc="Today") for i in range(20)),
+)
+'''
+
+
+def write_page(source: Path, index: int, version: int) -> None:
+    (source / f"page_{index:03d}.py").write_text(PAGE.format(index=index, version=version))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        source, output = Path(directory, "pages"), Path(directory, "site")
+        source.mkdir()
+        (source / "common.py").write_text(COMMON)
+        for index in range(PAGES):
+            write_page(source, index, version=0)
+
+        print(f"{'build':<16}{'built':>8}{'unchanged':>11}{'seconds':>10}")
+
+        def build(name: str) -> None:
+            report = build_site([source], output)
+            print(f"{name:<16}{len(report.built):>8}{len(report.unchanged):>11}{report.seconds:>10.3f}")
+
+        build("full")
+        build("nothing changed")
+        write_page(source, 7, version=1)
+        build("one page")
+        (source / "common.py").write_text(COMMON + "\n# edited\n")
+        build("common.py")
+
+
+if __name__ == "__main__":
+    main()
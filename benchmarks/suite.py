@@ -0,0 +1,149 @@
+"""Micro-benchmarks for every exported component, the core utils and large pages
+
+    poetry run python -m benchmarks.suite                                 # print timings
+    poetry run python -m benchmarks.suite --save benchmarks/baseline.json # record a baseline
+    poetry run python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 0.1
+
+With `--compare` the exit status is 1 when a case got slower than the baseline by more than `--threshold`
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Tuple
+
+from paisy_ui import components
+from paisy_ui.nodes import PUIElement
+from paisy_ui.utils import add_css, parse_attributes_dict, parse_html, parse_nodes
+
+from ._components import FACTORIES
+from ._showcase import build_large_page, build_showcase
+
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_REPEAT = 5
+# Each case runs for at least this long per repetition
+MIN_TIME = 0.05
+
+UTILS_HTML = """
+<div class="card bg-base-100 shadow-sm">
+    <div class="card-body">
+        <h2 class="card-title">Title</h2>
+        [[content]]
+    </div>
+</div>
+"""
+
+
+def cases() -> Iterator[Tuple[str, Callable[[], object]]]:
+    """Yields (name, callable) for every benchmarked case"""
+    for name, factory in FACTORIES.items():
+        yield f"construct:{name}", factory
+    for name, factory in FACTORIES.items():
+        component = factory()
+        yield f"render:{name}", component.render
+
+    yield "utils:parse_html", lambda: parse_html(UTILS_HTML)
+    for parser in ("html.parser", "paisy"):
+        yield f"utils:parse_nodes[{parser}]", lambda parser=parser: parse_nodes(
+            UTILS_HTML, parser=parser
+        )
+    tag, _ = parse_html(UTILS_HTML)
+    yield "utils:add_css[Tag]", lambda: add_css(tag.__copy__(), "btn", "btn-primary")
+    yield "utils:add_css[PUIElement]", lambda: add_css(
+        PUIElement("div", classes=["card"]), "btn", "btn-primary"
+    )
+    attributes = {"id": "main", "_class": "card", "data_tip": "Tip", "hx_get": "/rows"}
+    yield "utils:parse_attributes_dict", lambda: parse_attributes_dict(attributes)
+
+    yield "page:showcase:build", build_showcase
+    showcase = build_showcase()
+    yield "page:showcase:render", showcase.render
+    yield "page:showcase:render_compact", lambda: showcase.render(pretty=False)
+    large = build_large_page()
+    yield "page:large:render", large.render
+    yield "page:large:render_compact", lambda: large.render(pretty=False)
+    # Fresh interpreter importing the package, interpreter startup included (see benchmarks.importtime)
+    for statement in ("import paisy_ui", "from paisy_ui.components import *"):
+        yield f"import:{statement}", lambda statement=statement: subprocess.run(
+            [sys.executable, "-c", statement], check=True
+        )
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """Returns the best mean time of `function()` in microseconds"""
+    timer = timeit.Timer(function)
+    number = 1
+    while (elapsed := timer.timeit(number)) < MIN_TIME:
+        number = max(number * 2, int(number * MIN_TIME / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def run(name_filter: str = "", repeat: int = DEFAULT_REPEAT) -> Dict[str, float]:
+    results = {}
+    for name, function in cases():
+        if name_filter in name:
+            results[name] = measure(function, repeat=repeat)
+            print(f"{name:<40}{results[name]:>14.2f} us", flush=True)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> bool:
+    """Prints each case against the baseline, returns whether any of them regressed"""
+    print(f"\n{'case':<40}{'baseline (us)':>14}{'current (us)':>14}{'change':>10}")
+    regressed = False
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<40}{'-':>14}{current:>14.2f}{'new':>10}")
+            continue
+        change = current / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        print(f"{name:<40}{before:>14.2f}{current:>14.2f}{change:>+10.1%}{flag}")
+    return regressed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", type=Path, help="write the results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="JSON baseline to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown ratio (default 0.1 = 10%%)",
+    )
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    args = parser.parse_args(argv)
+
+    missing = set(components.__all__) - set(FACTORIES)
+    if missing:
+        print(f"No benchmark factory for: {', '.join(sorted(missing))}", file=sys.stderr)
+
+    results = run(name_filter=args.filter, repeat=args.repeat)
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                {"python": platform.python_version(), "results": results}, indent=2
+            )
+            + "\n"
+        )
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        if compare(results, baseline, threshold=args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""`PUITable` fed by a row generator at 1k/10k/100k rows, then a 50 rows window over the same datasets
+
+    poetry run python -m benchmarks.table
+"""
+
+import time
+from datetime import date, timedelta
+
+from paisy_ui.components import PUITable, PUITableBody
+
+SIZES = (1_000, 10_000, 100_000)
+PAGE_SIZE = 50
+COLUMNS = ["ID", "Date", "Description", "Amount"]
+FORMATTERS = [None, date.isoformat, None, lambda cents: f"R$ {cents / 100:,.2f}"]
+
+
+def transactions(count: int):
+    start = date(2024, 1, 1)
+    for i in range(count):
+        yield i, start + timedelta(days=i % 365), f"Purchase #{i}", i * 137 % 100_000
+
+
+def main():
+    print(f"{'rows':>8}{'build (ms)':>14}{'render (ms)':>14}{'rows/s':>12}")
+    for size in SIZES:
+        start = time.perf_counter()
+        table = PUITable(columns=COLUMNS, rows=transactions(size), formatters=FORMATTERS)
+        built = time.perf_counter()
+        table.render(pretty=False)
+        rendered = time.perf_counter()
+        print(
+            f"{size:>8}{(built - start) * 1e3:>14.1f}{(rendered - built) * 1e3:>14.1f}"
+            f"{size / (rendered - start):>12.0f}"
+        )
+
+    print(f"\n{'rows':>8}{'window (ms)':>14}{'fragment (ms)':>16}")
+    for size in SIZES:
+        source = list(transactions(size))
+        offset = size // 2
+        start = time.perf_counter()
+        PUITable(
+            columns=COLUMNS, source=source, offset=offset, limit=PAGE_SIZE, formatters=FORMATTERS
+        ).render(pretty=False)
+        windowed = time.perf_counter()
+        PUITableBody(
+            source=source, offset=offset + PAGE_SIZE, limit=PAGE_SIZE, formatters=FORMATTERS
+        ).render(pretty=False)
+        fragment = time.perf_counter()
+        print(f"{size:>8}{(windowed - start) * 1e3:>14.2f}{(fragment - windowed) * 1e3:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Construction cost per component class, re-parsing `__doc__` (before) vs cloning the compiled template (after)
+
+    poetry run python -m benchmarks.templates
+"""
+
+import timeit
+from contextlib import contextmanager
+
+from paisy_ui import PUIComponentABC
+from paisy_ui.template import PUITemplate
+
+from ._components import FACTORIES
+
+NUMBER = 200
+
+
+@contextmanager
+def uncached_templates():
+    """Compiles the template on every instantiation, as before the template cache"""
+    template = PUIComponentABC.__dict__["template"]
+    PUIComponentABC.template = classmethod(lambda cls: PUITemplate(cls.__doc__))
+    try:
+        yield
+    finally:
+        PUIComponentABC.template = template
+
+
+def measure(factory, number: int = NUMBER) -> float:
+    """Returns the mean time of `factory()` in microseconds"""
+    factory()
+    return timeit.timeit(factory, number=number) / number * 1e6
+
+
+def main():
+    print(f"{'component':<24}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for name, factory in FACTORIES.items():
+        with uncached_templates():
+            before = measure(factory)
+        after = measure(factory)
+        print(f"{name:<24}{before:>14.1f}{after:>14.1f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
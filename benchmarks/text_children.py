@@ -0,0 +1,45 @@
+"""Appending thousands of plain text children to a `PUIDiv`
+
+    poetry run python -m benchmarks.text_children
+"""
+
+import timeit
+
+from paisy_ui.components import PUIDiv
+from paisy_ui.utils import parse_nodes
+
+NUMBER = 20
+CHILDREN = 5_000
+
+
+class ParsedTextDiv(PUIDiv):
+    # Previous behaviour: every text child went through the html parser
+    __doc__ = PUIDiv.__doc__
+
+    def _format_child(self, child):
+        if isinstance(child, (str, int, float)):
+            node, _ = parse_nodes(f"<span>{child}</span>")
+            return node
+        return super()._format_child(child)
+
+
+class BareTextDiv(PUIDiv):
+    __doc__ = PUIDiv.__doc__
+    text_wrapper = None
+
+
+def main():
+    texts = tuple(f"item {i}" for i in range(CHILDREN))
+    print(f"{CHILDREN} text children")
+    print(f"{'mode':<10}{'time (ms)':>12}")
+    for mode, cls in (
+        ("parsed", ParsedTextDiv),
+        ("span", PUIDiv),
+        ("bare", BareTextDiv),
+    ):
+        elapsed = timeit.timeit(lambda: cls()[texts], number=NUMBER)
+        print(f"{mode:<10}{elapsed / NUMBER * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
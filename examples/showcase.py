@@ -382,6 +382,7 @@ page = PUIHTML()[
 ]
 
 
-current_dir = os.path.dirname(os.path.abspath(__file__))
-with open(f"{current_dir}/index.html", "w+") as file:
-    file.write(str(page))
+if __name__ == "__main__":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    with open(f"{current_dir}/index.html", "wb") as file:
+        page.render_to(file)
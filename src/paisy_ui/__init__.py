@@ -1,4 +1,25 @@
-from . import components
-from .core import PUIComponentABC
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import components
+    from .core import PUIComponentABC
 
 __all__ = ["PUIComponentABC", "components"]
+
+
+def __getattr__(name: str):
+    # PEP 562: submodules (and bs4) are only imported on first use
+    if name == "PUIComponentABC":
+        from .core import PUIComponentABC
+
+        globals()[name] = PUIComponentABC
+        return PUIComponentABC
+    if name == "components":
+        # Not `from . import components`, it would look the attribute up here again
+        return import_module(f"{__name__}.components")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,132 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Iterable, Optional
+
+DEFAULT_MAX_WORKERS = 4
+# Pieces (start tags, end tags and texts) rendered between two yields to the event loop in cooperative mode
+DEFAULT_YIELD_EVERY = 500
+
+
+@dataclass
+class PUIRenderPoolStats:
+    queued: int
+    running: int
+    completed: int
+    # Seconds between the submission of a render and its start on a worker
+    wait_total: float
+    wait_max: float
+
+    @property
+    def wait_mean(self) -> float:
+        return self.wait_total / self.completed if self.completed else 0.0
+
+
+class PUIRenderPool:
+    """Bounded thread pool running renders off the event loop, with queue depth and wait time metrics"""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive (received {max_workers})")
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="paisy-ui-render"
+                )
+            return self._executor
+
+    def _run(self, render: Callable[[], str], submitted: float) -> str:
+        wait = perf_counter() - submitted
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+        try:
+            return render()
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    async def run(self, render: Callable[[], str]) -> str:
+        """Runs `render` on a worker thread, the event loop keeps serving other tasks meanwhile"""
+        executor = self._get_executor()
+        with self._lock:
+            self._queued += 1
+        # Same context on the worker, e.g. for an active `profiling.profile()`
+        context = contextvars.copy_context()
+        future = executor.submit(context.run, self._run, render, perf_counter())
+        future.add_done_callback(self._discard_cancelled)
+        # Cancelling the awaiting task cancels the render too, when no worker started it yet
+        return await asyncio.wrap_future(future)
+
+    def _discard_cancelled(self, future: Future) -> None:
+        # A cancelled render never reached `_run`, which leaves the queue
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def stats(self) -> PUIRenderPoolStats:
+        with self._lock:
+            return PUIRenderPoolStats(
+                queued=self._queued,
+                running=self._running,
+                completed=self._completed,
+                wait_total=self._wait_total,
+                wait_max=self._wait_max,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_default_pool: Optional[PUIRenderPool] = None
+
+
+def get_pool() -> PUIRenderPool:
+    """Returns the pool used by `render_async` when none is given"""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = PUIRenderPool()
+    return _default_pool
+
+
+def configure(max_workers: int = DEFAULT_MAX_WORKERS) -> PUIRenderPool:
+    """Replaces the default pool, e.g. on application startup"""
+    global _default_pool
+    if _default_pool is not None:
+        _default_pool.shutdown(wait=False)
+    _default_pool = PUIRenderPool(max_workers=max_workers)
+    return _default_pool
+
+
+async def join_cooperatively(
+    pieces: Iterable[str], yield_every: int = DEFAULT_YIELD_EVERY
+) -> str:
+    """Joins rendered `pieces` on the event loop, letting other tasks run every `yield_every` pieces"""
+    if yield_every <= 0:
+        raise ValueError(f"yield_every must be positive (received {yield_every})")
+
+    output = []
+    for index, piece in enumerate(pieces, start=1):
+        output.append(piece)
+        if index % yield_every == 0:
+            await asyncio.sleep(0)
+    return "".join(output)
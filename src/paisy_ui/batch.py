@@ -0,0 +1,146 @@
+import os
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from . import components
+from .core import PUIComponentABC
+from .exceptions import PUIBuildError
+from .template import PUITemplate
+
+PageFactory = Callable[[Any], PUIComponentABC]
+DEFAULT_CHUNKSIZE = 8
+
+
+@dataclass
+class PUIWorkerStats:
+    pages: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class PUIBatchReport:
+    """Pages rendered by every worker process (by pid), filled while the batch results are consumed"""
+
+    workers: Dict[int, PUIWorkerStats] = field(default_factory=dict)
+    started: float = field(default_factory=perf_counter)
+    finished: Optional[float] = None
+
+    @property
+    def pages(self) -> int:
+        return sum(worker.pages for worker in self.workers.values())
+
+    @property
+    def pages_per_second(self) -> float:
+        elapsed = (self.finished or perf_counter()) - self.started
+        return self.pages / elapsed if elapsed else 0.0
+
+    def add(self, pid: int, seconds: float, size: int) -> None:
+        worker = self.workers.get(pid)
+        if worker is None:
+            worker = self.workers[pid] = PUIWorkerStats()
+        worker.pages += 1
+        worker.seconds += seconds
+        worker.bytes += size
+
+
+def compiled_templates() -> List[Tuple[type, PUITemplate]]:
+    """Compiles the template of every component class defined so far, returning (class, template) pairs"""
+    # The component modules are imported lazily, the exported ones are loaded here
+    for name in components.__all__:
+        getattr(components, name)
+
+    templates = []
+    classes = [PUIComponentABC]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        if cls.__doc__ and cls is not PUIComponentABC:
+            try:
+                templates.append((cls, cls.template()))
+            except PUIBuildError:
+                # Abstract helpers may have a plain text docstring, they are never built
+                continue
+    return templates
+
+
+# Worker process state, set once by `_init_worker`
+_factory: Optional[PageFactory] = None
+_pretty: Optional[bool] = None
+_output_dir: Optional[Path] = None
+_filename: Optional[Callable[[int, Any], str]] = None
+
+
+def _init_worker(
+    factory: PageFactory,
+    templates: List[Tuple[type, PUITemplate]],
+    pretty: Optional[bool],
+    output_dir: Optional[Path],
+    filename: Optional[Callable[[int, Any], str]],
+) -> None:
+    global _factory, _pretty, _output_dir, _filename
+    for cls, template in templates:
+        cls._template = template
+    _factory, _pretty, _output_dir, _filename = factory, pretty, output_dir, filename
+
+
+def _render_page(task: Tuple[int, Any]) -> Tuple[int, float, int, str]:
+    index, item = task
+    start = perf_counter()
+    page = _factory(item)
+    if _output_dir is None:
+        html = page.render(pretty=_pretty)
+        # utf-8 bytes, as `render_to` counts them when writing files
+        return os.getpid(), perf_counter() - start, len(html.encode("utf-8")), html
+
+    path = _output_dir / _filename(index, item)
+    with open(path, "wb") as file:
+        size = page.render_to(file, pretty=_pretty)
+    return os.getpid(), perf_counter() - start, size, str(path)
+
+
+def _default_filename(index: int, item: Any) -> str:
+    return f"{index}.html"
+
+
+def render_batch(
+    factory: PageFactory,
+    items: Iterable[Any],
+    processes: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    pretty: Optional[bool] = None,
+    output_dir: Union[str, Path, None] = None,
+    filename: Callable[[int, Any], str] = _default_filename,
+    report: Optional[PUIBatchReport] = None,
+) -> Iterator[str]:
+    """Renders `factory(item)` for every item on a process pool, yielding the html in the order of `items`
+
+    With an `output_dir` every page is written there by the worker (as `filename(index, item)`) and its path
+    is yielded instead. `factory` and the items must be picklable (e.g. a module level function and plain data),
+    the compiled templates are sent to every worker once, when it starts.
+    """
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+    if report is None:
+        report = PUIBatchReport()
+    report.started = perf_counter()
+
+    with Pool(
+        processes=processes,
+        initializer=_init_worker,
+        initargs=(factory, compiled_templates(), pretty, output_dir, filename),
+    ) as pool:
+        for pid, seconds, size, result in pool.imap(
+            _render_page, enumerate(items), chunksize=chunksize
+        ):
+            report.add(pid, seconds, size)
+            yield result
+    report.finished = perf_counter()
@@ -0,0 +1,54 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from .exceptions import PUIBuildError
+
+
+def _build(args: argparse.Namespace) -> int:
+    from .site import build_site
+
+    try:
+        report = build_site(
+            args.sources,
+            args.output,
+            processes=args.processes,
+            pretty=False if args.compact else None,
+            force=args.force,
+        )
+    except (PUIBuildError, SyntaxError) as error:
+        print(f"paisy-ui: {error}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        for output in report.built:
+            print(f"built {output}")
+        for output in report.removed:
+            print(f"removed {output}")
+    print(
+        f"{len(report.built)} built, {len(report.unchanged)} unchanged, {len(report.removed)} removed "
+        f"in {report.seconds:.2f}s"
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="paisy-ui", description="PaisyUI command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser(
+        "build",
+        help="render the `page` of python modules to html files",
+        description="Renders the `page` (a component, or a function returning one) of every module of the sources, "
+        "only the modules that changed since the last build",
+    )
+    build.add_argument("sources", nargs="+", help="page modules, or directories searched for them")
+    build.add_argument("-o", "--output", default="site", help="output directory (default: site)")
+    build.add_argument("-j", "--processes", type=int, help="worker processes (default: one per CPU)")
+    build.add_argument("--compact", action="store_true", help="render without indentation")
+    build.add_argument("--force", action="store_true", help="rebuild every page")
+    build.add_argument("-q", "--quiet", action="store_true", help="print the summary only")
+    build.set_defaults(handler=_build)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
@@ -1,42 +1,47 @@
-from .actions import PUIButton, PUIModal, PUISwap, PUIThemeController
-from .base import PUIHTML, PUIDiv, PUIImg, PUISymbol, PUIText, PUITitle
-from .data_display import (
-    PUIAvatar,
-    PUIBadge,
-    PUICard,
-    PUICollapse,
-    PUICountdown,
-    PUIHover3dCard,
-    PUIHover3dCardImg,
-    PUIImgCarousel,
-    PUIKbd,
-    PUIList,
-    PUIStat,
-    PUIStatus,
-    PUITable,
-    PUITextRotate,
-)
-from .data_input import (
-    PUICheckbox,
-    PUIDateInput,
-    PUIDateTimeLocalInput,
-    PUIEmailInput,
-    PUIFileInput,
-    PUIFilter,
-    PUINumberInput,
-    PUIPasswordInput,
-    PUIRadio,
-    PUIRange,
-    PUISearchInput,
-    PUISelect,
-    PUITelephoneInput,
-    PUITextInput,
-    PUITimeInput,
-    PUIToggle,
-    PUIUrlInput,
-)
-from .feedback import PUIAlert, PUILoading, PUIProgress, PUIRadialProgress, PUIToast
-from .layout import PUIDivider, PUISidebarLayout
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .actions import PUIButton, PUIModal, PUISwap, PUIThemeController
+    from .base import PUIHTML, PUIDiv, PUIImg, PUISymbol, PUIText, PUITitle
+    from .data_display import (
+        PUIAvatar,
+        PUIBadge,
+        PUICard,
+        PUICollapse,
+        PUICountdown,
+        PUIHover3dCard,
+        PUIHover3dCardImg,
+        PUIImgCarousel,
+        PUIKbd,
+        PUIList,
+        PUIStat,
+        PUIStatus,
+        PUITable,
+        PUITableBody,
+        PUITextRotate,
+    )
+    from .data_input import (
+        PUICheckbox,
+        PUIDateInput,
+        PUIDateTimeLocalInput,
+        PUIEmailInput,
+        PUIFileInput,
+        PUIFilter,
+        PUINumberInput,
+        PUIPasswordInput,
+        PUIRadio,
+        PUIRange,
+        PUISearchInput,
+        PUISelect,
+        PUITelephoneInput,
+        PUITextInput,
+        PUITimeInput,
+        PUIToggle,
+        PUIUrlInput,
+    )
+    from .feedback import PUIAlert, PUILoading, PUIProgress, PUIRadialProgress, PUIToast
+    from .layout import PUIDivider, PUISidebarLayout
 
 __all__ = [
     "PUIHTML",
@@ -62,6 +67,7 @@ __all__ = [
     "PUIStat",
     "PUIStatus",
     "PUITable",
+    "PUITableBody",
     "PUITextRotate",
     "PUIAlert",
     "PUILoading",
@@ -88,3 +94,69 @@ __all__ = [
     "PUIUrlInput",
     "PUIToggle",
 ]
+
+# Component name -> submodule defining it, submodules are imported on first access (PEP 562)
+_MODULES = {
+    "PUIHTML": "base",
+    "PUIDiv": "base",
+    "PUIText": "base",
+    "PUITitle": "base",
+    "PUIImg": "base",
+    "PUISymbol": "base",
+    "PUIButton": "actions",
+    "PUIModal": "actions",
+    "PUISwap": "actions",
+    "PUIThemeController": "actions",
+    "PUIAvatar": "data_display",
+    "PUIBadge": "data_display",
+    "PUICard": "data_display",
+    "PUICollapse": "data_display",
+    "PUIImgCarousel": "data_display",
+    "PUICountdown": "data_display",
+    "PUIHover3dCard": "data_display",
+    "PUIHover3dCardImg": "data_display",
+    "PUIKbd": "data_display",
+    "PUIList": "data_display",
+    "PUIStat": "data_display",
+    "PUIStatus": "data_display",
+    "PUITable": "data_display",
+    "PUITableBody": "data_display",
+    "PUITextRotate": "data_display",
+    "PUIAlert": "feedback",
+    "PUILoading": "feedback",
+    "PUIProgress": "feedback",
+    "PUIRadialProgress": "feedback",
+    "PUIToast": "feedback",
+    "PUIDivider": "layout",
+    "PUISidebarLayout": "layout",
+    "PUICheckbox": "data_input",
+    "PUIFileInput": "data_input",
+    "PUIRadio": "data_input",
+    "PUIFilter": "data_input",
+    "PUIRange": "data_input",
+    "PUISelect": "data_input",
+    "PUITextInput": "data_input",
+    "PUIDateInput": "data_input",
+    "PUITimeInput": "data_input",
+    "PUIDateTimeLocalInput": "data_input",
+    "PUISearchInput": "data_input",
+    "PUIEmailInput": "data_input",
+    "PUIPasswordInput": "data_input",
+    "PUINumberInput": "data_input",
+    "PUITelephoneInput": "data_input",
+    "PUIUrlInput": "data_input",
+    "PUIToggle": "data_input",
+}
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
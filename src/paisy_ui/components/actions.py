@@ -1,8 +1,8 @@
 from typing import Union
 
-from ..core import PUIComponentABC, Tag
+from ..core import PUIComponentABC
 from ..mixins import PUIBorderMixin, PUILayoutMixin, PUITextSizeMixin, PUIVariantMixin
-from ..utils import parse_html
+from ..utils import parse_nodes
 
 
 class PUIButton(PUIComponentABC, PUIVariantMixin, PUILayoutMixin, PUIBorderMixin):
@@ -12,23 +12,19 @@ class PUIButton(PUIComponentABC, PUIVariantMixin, PUILayoutMixin, PUIBorderMixin
 
     @property
     def link(self):
-        self.css("btn-link")
-        return self
+        return self.css("btn-link")
 
     @property
     def active(self):
-        self.css("btn-active")
-        return self
+        return self.css("btn-active")
 
     @property
     def disabled(self):
-        self.css("btn-disabled")
-        return self
+        return self.css("btn-disabled")
 
     @property
     def sm(self):
-        self.css("btn-sm")
-        return self
+        return self.css("btn-sm")
 
 
 # TODO: Implement
@@ -60,20 +56,22 @@ class PUIModal(PUIComponentABC):
 
     @property
     def with_close_button(self):
-        close_form, _ = parse_html(
+        close_form, _ = parse_nodes(
             """<form method="dialog">
             <button class="btn btn-sm btn-circle btn-ghost absolute right-2 top-2">✕</button>
         </form>"""
         )
-        self.wrapper.append(close_form)
+        modal = self.thaw()
+        modal.wrapper.append(close_form)
+        return modal
 
 
 class PUISwap(PUIComponentABC, PUITextSizeMixin):
     """
     <label class="swap">
         <input type="checkbox" />
-        <div class="swap-on"></div>
-        <div class="swap-off"></div>
+        <div class="swap-on" pui-anchor="on"></div>
+        <div class="swap-off" pui-anchor="off"></div>
     </label>
     """
 
@@ -85,16 +83,16 @@ class PUISwap(PUIComponentABC, PUITextSizeMixin):
         **attributes
     ):
         super().__init__(*classes, **attributes)
-        div_on = self.find(attrs={"class": "swap-on"})
-        div_off = self.find(attrs={"class": "swap-off"})
-        div_on.append(on if isinstance(on, str) else on.tag)
-        div_off.append(off if isinstance(off, str) else off.tag)
+        div_on = self.find(attrs={"class": "swap-on"}, anchor="on")
+        div_off = self.find(attrs={"class": "swap-off"}, anchor="off")
+        div_on.append(on if isinstance(on, str) else on.node)
+        div_off.append(off if isinstance(off, str) else off.node)
 
 
 class PUIThemeController(PUIComponentABC):
     """
     <label class="swap swap-rotate">
-        <input type="checkbox" class="theme-controller"/>
+        <input type="checkbox" class="theme-controller" pui-anchor="input"/>
         <svg class="swap-off h-10 w-10 fill-current" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">
             <path d="M5.64,17l-.71.71a1,1,0,0,0,0,1.41,1,1,0,0,0,1.41,0l.71-.71A1,1,0,0,0,5.64,17ZM5,12a1,1,0,0,0-1-1H3a1,1,0,0,0,0,2H4A1,1,0,0,0,5,12Zm7-7a1,1,0,0,0,1-1V3a1,1,0,0,0-2,0V4A1,1,0,0,0,12,5ZM5.64,7.05a1,1,0,0,0,.7.29,1,1,0,0,0,.71-.29,1,1,0,0,0,0-1.41l-.71-.71A1,1,0,0,0,4.93,6.34Zm12,.29a1,1,0,0,0,.7-.29l.71-.71a1,1,0,1,0-1.41-1.41L17,5.64a1,1,0,0,0,0,1.41A1,1,0,0,0,17.66,7.34ZM21,11H20a1,1,0,0,0,0,2h1a1,1,0,0,0,0-2Zm-9,8a1,1,0,0,0-1,1v1a1,1,0,0,0,2,0V20A1,1,0,0,0,12,19ZM18.36,17A1,1,0,0,0,17,18.36l.71.71a1,1,0,0,0,1.41,0,1,1,0,0,0,0-1.41ZM12,6.5A5.5,5.5,0,1,0,17.5,12,5.51,5.51,0,0,0,12,6.5Zm0,9A3.5,3.5,0,1,1,15.5,12,3.5,3.5,0,0,1,12,15.5Z" />
         </svg>
@@ -107,5 +105,5 @@ class PUIThemeController(PUIComponentABC):
     def __init__(self, *classes, value: str, **attributes):
         self.value = value
         super().__init__(*classes, **attributes)
-        input = self.find(attrs={"class": "theme-controller"})
+        input = self.find(attrs={"class": "theme-controller"}, anchor="input")
         input.attrs.update(value=value)
@@ -57,7 +57,7 @@ class PUIHTML(PUIComponentABC):
         </style>
     </head>
 
-    <body>
+    <body pui-anchor="body">
     <script>
         let intervalUpdateCountdowns = null;
 
@@ -133,9 +133,11 @@ class PUIHTML(PUIComponentABC):
     </html>
     """
 
+    layout_shell = True
+
     def __init__(self, *classes, **attributes):
         super().__init__(*classes, **attributes)
-        self._wrapper = self.find("body")
+        self._wrapper = self.find("body", anchor="body")
 
 
 class PUIDiv(
@@ -164,7 +166,7 @@ class PUIImg(PUIComponentABC):
 
     def __init__(self, *classes, src: str, **attributes):
         super().__init__(*classes, **attributes)
-        self.tag.attrs.update(src=src)
+        self.node.attrs.update(src=src)
 
 
 class PUISymbol(PUIComponentABC, PUIColorsMixins, PUILayoutMixin, PUITextSizeMixin):
@@ -172,4 +174,4 @@ class PUISymbol(PUIComponentABC, PUIColorsMixins, PUILayoutMixin, PUITextSizeMix
 
     def __init__(self, *classes, symbol: str, **attributes):
         super().__init__(*classes, **attributes)
-        self.tag.append(symbol)
+        self.node.append(symbol)
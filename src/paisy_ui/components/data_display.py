@@ -1,12 +1,21 @@
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from html import unescape
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
-from ..core import PUIComponentABC, Tag
-from ..exceptions import PUIFindError
+from ..core import PUIComponentABC, format_child
+from ..nodes import PUIElement, PUINode, PUITextNode
 from ..mixins import PUIBorderMixin, PUILayoutMixin, PUITextColorMixin, PUIVariantMixin
-from ..utils import add_css, generate_unique_id, parse_html
+from ..utils import add_css, generate_unique_id, parse_markup, parse_nodes
 from .base import PUISymbol
 
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+TableCell = Union[str, int, float, PUIComponentABC]
+CellFormatter = Callable[[Any], TableCell]
+TableSource = Union[Sequence[Sequence[Any]], Callable[[int, int], Iterable[Sequence[Any]]]]
+
 # TODO: Implement
 # class PUIAccordion(PUIComponentABC):
 #     pass
@@ -17,45 +26,47 @@ class PUIAvatar(PUIComponentABC, PUIBorderMixin):
     <div class="avatar">
         <div class="rounded-full">
             [[content]]
-            <img src="" />
+            <img src="" pui-anchor="img" />
         </div>
     </div>
     """
 
     def __init__(self, *classes, src: str, **attributes):
         super().__init__(*classes, **attributes)
-        img = self.find("img")
+        img = self.find("img", anchor="img")
         img.attrs.update(src=src)
 
     @property
     def sm(self):
-        add_css(self.wrapper, "w-8", "h-8")
-        return self
+        avatar = self.thaw()
+        add_css(avatar.wrapper, "w-8", "h-8")
+        return avatar
 
     @property
     def md(self):
-        add_css(self.wrapper, "w-12", "h-12")
-        return self
+        avatar = self.thaw()
+        add_css(avatar.wrapper, "w-12", "h-12")
+        return avatar
 
     @property
     def lg(self):
-        add_css(self.wrapper, "w-24", "h-24")
-        return self
+        avatar = self.thaw()
+        add_css(avatar.wrapper, "w-24", "h-24")
+        return avatar
 
     @property
     def xl(self):
-        add_css(self.wrapper, "w-48", "h-48")
-        return self
+        avatar = self.thaw()
+        add_css(avatar.wrapper, "w-48", "h-48")
+        return avatar
 
     @property
     def online(self):
-        self.css("avatar-online")
-        return self
+        return self.css("avatar-online")
 
     @property
     def offline(self):
-        self.css("avatar-offline")
-        return self
+        return self.css("avatar-offline")
 
 
 class PUIBadge(PUIComponentABC, PUIBorderMixin, PUILayoutMixin, PUIVariantMixin):
@@ -67,6 +78,7 @@ class PUIBadge(PUIComponentABC, PUIBorderMixin, PUILayoutMixin, PUIVariantMixin)
 class PUICard(PUIComponentABC, PUIBorderMixin, PUILayoutMixin):
     """
     <div class="card card-border bg-base-100 w-96 shadow-sm">
+        [[figure]]
         <div class="card-body">[[content]]</div>
     </div>
     """
@@ -75,16 +87,11 @@ class PUICard(PUIComponentABC, PUIBorderMixin, PUILayoutMixin):
         super().__init__(*classes, **attributes)
 
     def image_full(self, img_src: str) -> "PUICard":
-        self.css("image-full")
-        img, _ = parse_html(
-            f"""
-        <figure>
-            <img src="{img_src}" alt="Shoes" />
-        </figure>
-        """
-        )
-        self.wrapper.insert_before(img)
-        return self
+        card = self.css("image-full")
+        # Entities of the source are decoded, as when it was parsed as markup
+        img = PUIElement("img", {"src": unescape(img_src), "alt": "Shoes"})
+        card.slot("figure").append(PUIElement("figure", children=[img]))
+        return card
 
 
 class PUICarouselABC(PUIComponentABC):
@@ -92,14 +99,18 @@ class PUICarouselABC(PUIComponentABC):
     <div class="carousel w-full rounded">[[content]]</div>
     """
 
-    def __init__(self, *classes, items: List[Tag], **attributes):
+    def __init__(
+        self, *classes, items: List[Union[PUIElement, "Tag"]], **attributes
+    ):
         super().__init__(*classes, **attributes)
         for index, tag in enumerate(items):
             item = self.build_item(tag=tag, index=index)
             self.wrapper.append(item)
 
-    def build_item(self, tag: Tag, index: int = 0) -> Tag:
-        item, _ = parse_html(
+    def build_item(
+        self, tag: Union[PUIElement, "Tag"], index: int = 0
+    ) -> Union[PUIElement, "Tag"]:
+        item, _ = parse_nodes(
             f"""<div id="slide{index}" class="carousel-item relative w-full"></div>"""
         )
         item.append(tag)
@@ -114,7 +125,7 @@ class PUIImgCarousel(PUICarouselABC):
     def __init__(self, *classes, img_srcs: List[str], **attributes):
         items = []
         for index, img_src in enumerate(img_srcs):
-            item, _ = parse_html(
+            item, _ = parse_nodes(
                 f"""
             <div id="slide{index}" class="carousel-item relative w-full">
                 <img src="{img_src}" class="w-full" />
@@ -136,16 +147,15 @@ class PUIImgCarousel(PUICarouselABC):
 class PUICollapse(PUIComponentABC, PUIBorderMixin, PUILayoutMixin):
     """
     <div tabindex="0" class="collapse collapse-arrow">
+        <div class="collapse-title font-semibold">[[title]]</div>
         <div class="collapse-content text-sm">[[content]]</div>
     </div>
     """
 
     def __init__(self, *classes, title: str, **attributes):
         super().__init__(*classes, **attributes)
-        collapse_title, _ = parse_html(
-            f'<div class="collapse-title font-semibold">{title}</div>'
-        )
-        self.wrapper.insert_before(collapse_title)
+        # The title is html, e.g. `Q &amp; <b>A</b>`
+        self.slot("title")[tuple(parse_markup(title))]
 
 
 class PUICountdown(PUIComponentABC):
@@ -166,12 +176,12 @@ class PUICountdown(PUIComponentABC):
         attributes.update(id=id)
         super().__init__(*classes, **attributes)
         for value in values:
-            span, _ = parse_html(
+            span, _ = parse_nodes(
                 f'<span style="--value:{value.value};" aria-live="polite" aria-label="{value.value}">{value.value}</span>'
             )
-            self.tag.append(span)
+            self.node.append(span)
             if value.sufix:
-                self.tag.append(value.sufix)
+                self.node.append(value.sufix)
 
 
 # TODO: Implement
@@ -204,7 +214,7 @@ class PUIHover3dCardImg(PUIComponentABC):
     <div class="hover-3d mx-auto">
         <!-- content -->
         <figure class="max-w-100 rounded-2xl">
-            <img src="" alt="3D card" />
+            <img src="" alt="3D card" pui-anchor="img" />
         </figure>
         <!-- 8 empty divs needed for the 3D effect -->
         <div></div>
@@ -220,7 +230,7 @@ class PUIHover3dCardImg(PUIComponentABC):
 
     def __init__(self, *classes, img_src: str, **attributes):
         super().__init__(*classes, **attributes)
-        img = self.find("img")
+        img = self.find("img", anchor="img")
         img.attrs.update(src=img_src)
 
 
@@ -239,14 +249,19 @@ class PUIList(PUIComponentABC):
     def __init__(self, *classes, title: Optional[str] = None, **attributes):
         super().__init__(*classes, **attributes)
         if title:
-            li_title, _ = parse_html(
+            li_title, _ = parse_nodes(
                 f'<li class="p-4 pb-2 text-xs opacity-60 tracking-wide">{title}</li>'
             )
-            self.tag.append(li_title)
+            self.node.append(li_title)
 
-    def _format_child(self, child: str | int | float | PUIComponentABC) -> Tag:
-        tag = super()._format_child(child)
-        return add_css(tag, "list-row")
+    def _format_child(self, child: str | int | float | PUIComponentABC) -> PUINode:
+        if isinstance(child, PUIComponentABC):
+            # A frozen row is shared, the class goes on a copy of it
+            child = child.thaw()
+        node = super()._format_child(child)
+        if isinstance(node, PUIElement):
+            add_css(node, "list-row")
+        return node
 
 
 class PUIStat(PUIComponentABC, PUIVariantMixin):
@@ -254,9 +269,10 @@ class PUIStat(PUIComponentABC, PUIVariantMixin):
     <div class="stats shadow">
         <div class="stat">
             [[content]]
-            <div class="stat-title"></div>
-            <div class="stat-value"></div>
-            <div class="stat-desc"></div>
+            <div class="stat-title" pui-anchor="title"></div>
+            <div class="stat-value" pui-anchor="value"></div>
+            <div class="stat-desc" pui-anchor="desc"></div>
+            [[figure]]
         </div>
     </div>
     """
@@ -264,26 +280,23 @@ class PUIStat(PUIComponentABC, PUIVariantMixin):
     _variant_prefix = "text"
 
     @property
-    def title(self) -> Tag:
-        _title = self.find(attrs={"class": "stat-title"})
+    def title(self) -> PUIElement:
+        _title = self.find(attrs={"class": "stat-title"}, anchor="title")
         return _title
 
     @property
-    def value(self) -> Tag:
-        _value = self.find(attrs={"class": "stat-value"})
+    def value(self) -> PUIElement:
+        _value = self.find(attrs={"class": "stat-value"}, anchor="value")
         return _value
 
     @property
-    def desc(self) -> Tag:
-        _desc = self.find(attrs={"class": "stat-desc"})
+    def desc(self) -> PUIElement:
+        _desc = self.find(attrs={"class": "stat-desc"}, anchor="desc")
         return _desc
 
     @property
-    def figure(self) -> Optional[Tag]:
-        try:
-            return self.tag.find(attrs={"class": "stat-figure"})
-        except PUIFindError:
-            return None
+    def figure(self) -> Optional[PUIElement]:
+        return self.anchor("figure")
 
     def __init__(
         self,
@@ -296,19 +309,23 @@ class PUIStat(PUIComponentABC, PUIVariantMixin):
     ):
         super().__init__(*classes, **attributes)
         if symbol:
-            _symbol_wrapper, _ = parse_html('<div class="stat-figure"></div>')
-            self.wrapper.append(
-                PUISymbol(symbol=symbol).text_4xl.tag.wrap(_symbol_wrapper)
+            _symbol_wrapper = PUIElement(
+                "div",
+                classes=["stat-figure"],
+                children=[PUISymbol(symbol=symbol).text_4xl.node],
             )
+            self.slot("figure").append(_symbol_wrapper)
+            self.set_anchor("figure", _symbol_wrapper)
         self.title.append(title)
         self.value.append(value)
         self.desc.append(desc)
 
     def css(self, *classes):
-        if self.figure:
-            add_css(self.figure, *classes)
-        add_css(self.value, *classes)
-        return self
+        stat = self.thaw()
+        if stat.figure:
+            add_css(stat.figure, *classes)
+        add_css(stat.value, *classes)
+        return stat
 
 
 class PUIStatus(PUIComponentABC, PUIVariantMixin):
@@ -317,48 +334,146 @@ class PUIStatus(PUIComponentABC, PUIVariantMixin):
     _variant_prefix = "status"
 
 
+def slice_rows(
+    source: TableSource, offset: int, limit: int
+) -> Tuple[List[Sequence[Any]], bool, Optional[int]]:
+    """Returns the rows of `source` in the window, whether there are rows after it, and the total (if known)
+
+    A callable source is called as `source(offset, limit + 1)`, the extra row only tells if there is a next page
+    """
+    if offset < 0 or limit <= 0:
+        raise ValueError(f"Invalid window (offset={offset}, limit={limit})")
+    if callable(source):
+        rows = list(source(offset, limit + 1))
+        return rows[:limit], len(rows) > limit, None
+    total = len(source)
+    return list(source[offset : offset + limit]), offset + limit < total, total
+
+
+class PUITableBody(PUIComponentABC):
+    """<tbody>[[content]]</tbody>"""
+
+    _row_classes = ("hover:bg-base-300", "transition-all", "ease-in-out")
+
+    def __init__(
+        self,
+        *classes,
+        rows: Optional[Iterable[Sequence[Any]]] = None,
+        formatters: Optional[Sequence[Optional[CellFormatter]]] = None,
+        source: Optional[TableSource] = None,
+        offset: int = 0,
+        limit: int = 50,
+        **attributes,
+    ):
+        """Rows from `rows` (any iterable) or from the `source` window, e.g. to serve a table page as a fragment"""
+        super().__init__(*classes, **attributes)
+        self.has_next = False
+        self.total: Optional[int] = None
+        self.row_count = 0
+        if source is not None:
+            rows, self.has_next, self.total = slice_rows(source, offset, limit)
+        self.__build_rows(rows or (), formatters)
+
+    def __build_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        formatters: Optional[Sequence[Optional[CellFormatter]]],
+    ) -> None:
+        # Rows are consumed one at a time, generators are never materialized
+        append_row = self.wrapper.children.append
+        for row in rows:
+            if formatters is not None:
+                row = [
+                    value if formatter is None else formatter(value)
+                    for value, formatter in zip_longest(row, formatters[: len(row)])
+                ]
+            self.row_count += 1
+            append_row(
+                PUIElement(
+                    "tr",
+                    classes=self._row_classes,
+                    children=[
+                        PUIElement("td", children=[format_child(value, text_wrapper=None)])
+                        for value in row
+                    ],
+                )
+            )
+
+
 class PUITable(PUIComponentABC):
-    """<div class="overflow-x-auto rounded-box card-border shadow-sm"><table class="table table-zebra">[[content]]</tabe></div>"""
-
-    def __build_thead(self, columns: List[Union[str, PUIComponentABC]]) -> Tag:
-        thead, _ = parse_html("<thead></thead>")
-        for col in columns:
-            _col, _ = parse_html("<th></th>")
-            if isinstance(col, PUIComponentABC):
-                _col.append(col.tag)
-            else:
-                _col.append(col)
-            thead.append(_col)
-        return thead
-
-    def __build_tbody(self, rows: List[List[Union[str, PUIComponentABC]]]) -> Tag:
-        tbody, _ = parse_html("<tbody></tbody>")
-        for columns in rows:
-            row, _ = parse_html(
-                '<tr class="hover:bg-base-300 transition-all ease-in-out"></tr>'
+    """<div class="overflow-x-auto rounded-box card-border shadow-sm"><table class="table table-zebra">[[content]]</table></div>"""
+
+    def __build_thead(self, columns: Sequence[TableCell]) -> PUIElement:
+        return PUIElement(
+            "thead",
+            children=[
+                PUIElement("th", children=[format_child(col, text_wrapper=None)])
+                for col in columns
+            ],
+        )
+
+    def __build_pagination(
+        self, tbody: PUITableBody, offset: int, limit: int, page_href: str
+    ) -> PUIElement:
+        def link(content: str, page_offset: Optional[int]) -> PUIElement:
+            if page_offset is None:
+                return PUIElement(
+                    "button",
+                    {"disabled": ""},
+                    ["join-item", "btn", "btn-sm"],
+                    [PUITextNode(content)],
+                )
+            return PUIElement(
+                "a",
+                {"href": page_href.format(offset=page_offset, limit=limit)},
+                ["join-item", "btn", "btn-sm"],
+                [PUITextNode(content)],
             )
-            for col in columns:
-                _col, _ = parse_html("<td></td>")
-                if isinstance(col, PUIComponentABC):
-                    _col.append(col.tag)
-                else:
-                    _col.append(col)
-                row.append(_col)
-            tbody.append(row)
-        return tbody
+
+        shown = tbody.row_count
+        status = f"{offset + 1 if shown else offset}-{offset + shown}"
+        if tbody.total is not None:
+            status += f" of {tbody.total}"
+        return PUIElement(
+            "div",
+            classes=["join", "p-2"],
+            children=[
+                link("«", max(offset - limit, 0) if offset else None),
+                PUIElement(
+                    "span",
+                    classes=["join-item", "btn", "btn-sm", "btn-ghost"],
+                    children=[PUITextNode(status)],
+                ),
+                link("»", offset + limit if tbody.has_next else None),
+            ],
+        )
 
     def __init__(
         self,
         *classes,
-        columns: List[Union[str, PUIComponentABC]],
-        rows: List[List[Union[str, PUIComponentABC]]],
+        columns: Sequence[TableCell],
+        rows: Optional[Iterable[Sequence[Any]]] = None,
+        formatters: Optional[Sequence[Optional[CellFormatter]]] = None,
+        source: Optional[TableSource] = None,
+        offset: int = 0,
+        limit: int = 50,
+        page_href: str = "?offset={offset}&limit={limit}",
         **attributes,
     ):
+        """`rows` can be any iterable (e.g. a generator), `formatters` holds a callable (or None) per column
+
+        With a `source` (sequence or `callable(offset, limit)`) only the `offset`/`limit` window is rendered,
+        followed by pagination links built from `page_href`
+        """
         super().__init__(*classes, **attributes)
         thead = self.__build_thead(columns=columns)
-        tbody = self.__build_tbody(rows=rows)
+        tbody = PUITableBody(
+            rows=rows, formatters=formatters, source=source, offset=offset, limit=limit
+        )
         self.wrapper.append(thead)
-        self.wrapper.append(tbody)
+        self.wrapper.append(tbody.node)
+        if source is not None:
+            self.node.append(self.__build_pagination(tbody, offset, limit, page_href))
 
 
 class PUITextRotate(PUIComponentABC, PUITextColorMixin):
@@ -2,7 +2,7 @@ from typing import List, Optional
 
 from ..core import PUIComponentABC
 from ..mixins import PUIVariantMixin
-from ..utils import add_css, parse_html
+from ..utils import add_css, parse_nodes
 
 
 class PUIInputABC(PUIComponentABC):
@@ -14,23 +14,24 @@ class PUIInputABC(PUIComponentABC):
 
     @property
     def legend(self):
-        _legend = self.find("legend")
+        _legend = self.find("legend", anchor="legend")
         return _legend
 
     @property
     def input(self):
-        _input = self.find("input")
+        _input = self.find("input", anchor="input")
         return _input
 
     @property
     def label(self):
-        _label = self.find("label")
+        _label = self.find("label", anchor="label")
         return _label
 
     @property
     def disabled(self):
-        self.input.attrs.update(disabled="true")
-        return self
+        component = self.thaw()
+        component.input.attrs.update(disabled="true")
+        return component
 
     def __init__(
         self,
@@ -45,13 +46,14 @@ class PUIInputABC(PUIComponentABC):
     ):
         super().__init__(*classes)
         if legend:
-            _legend, _ = parse_html(
+            _legend, _ = parse_nodes(
                 f'<legend class="fieldset-legend">{legend}</legend>'
             )
-            self.tag.append(_legend)
+            self.node.append(_legend)
+            self.set_anchor("legend", _legend)
 
-        _input, _ = parse_html("<input/>")
-        _label, _ = parse_html(f"<label></label>")
+        _input, _ = parse_nodes("<input/>")
+        _label, _ = parse_nodes(f"<label></label>")
         _label.append(_input)
 
         if label:
@@ -63,11 +65,13 @@ class PUIInputABC(PUIComponentABC):
         if self._input_type not in ("range", "checkbox", "radio", "file"):
             add_css(_input if label else _label, "input")
 
-        self.tag.append(_label)
+        self.node.append(_label)
+        self.set_anchor("input", _input)
+        self.set_anchor("label", _label)
 
         if validator_hint:
-            _hint, _ = parse_html(f'<p class="validator-hint">{validator_hint}</p>')
-            self.tag.append(_hint)
+            _hint, _ = parse_nodes(f'<p class="validator-hint">{validator_hint}</p>')
+            self.node.append(_hint)
         self.input.attrs.update(name=name, id=id, type=self._input_type, **attributes)
         if pattern:
             self.input.attrs.update(pattern=pattern)
@@ -96,48 +100,53 @@ class PUIFileInput(PUIInputABC, PUIVariantMixin):
 
     @property
     def xs(self):
-        add_css(self.input, "file-input-xs")
-        return self
+        file_input = self.thaw()
+        add_css(file_input.input, "file-input-xs")
+        return file_input
 
     @property
     def sm(self):
-        add_css(self.input, "file-input-sm")
-        return self
+        file_input = self.thaw()
+        add_css(file_input.input, "file-input-sm")
+        return file_input
 
     @property
     def md(self):
-        add_css(self.input, "file-input-md")
-        return self
+        file_input = self.thaw()
+        add_css(file_input.input, "file-input-md")
+        return file_input
 
     @property
     def lg(self):
-        add_css(self.input, "file-input-lg")
-        return self
+        file_input = self.thaw()
+        add_css(file_input.input, "file-input-lg")
+        return file_input
 
     @property
     def xl(self):
-        add_css(self.input, "file-input-xl")
-        return self
+        file_input = self.thaw()
+        add_css(file_input.input, "file-input-xl")
+        return file_input
 
 
 class PUIFilter(PUIComponentABC):
     """
     <div class="filter">
-        <input class="btn filter-reset" type="radio" aria-label="x"/>
+        <input class="btn filter-reset" type="radio" aria-label="x" pui-anchor="reset"/>
         [[content]]
     </div>
     """
 
     @property
     def reset_input(self):
-        _input = self.find("input", {"class": "filter-reset"})
+        _input = self.find("input", {"class": "filter-reset"}, anchor="reset")
         return _input
 
     def __init__(self, *classes, name: str, id: str, options: List[str], **attributes):
         super().__init__(*classes, **attributes)
         self.reset_input.attrs.update(name=name, id=id)
         for option in options:
-            _input, _ = parse_html(
+            _input, _ = parse_nodes(
                 f'<input class="btn" type="radio" name="{name}" aria-label="{option}"/>'
             )
             self.wrapper.append(_input)
@@ -192,34 +201,39 @@ class PUISelect(PUIComponentABC):
     ):
         super().__init__(*classes, **attributes)
         if legend:
-            _legend, _ = parse_html(
+            _legend, _ = parse_nodes(
                 f'<legend class="fieldset-legend">{legend}</legend>'
             )
-            self.tag.append(_legend)
+            self.node.append(_legend)
+            self.set_anchor("legend", _legend)
 
         if label:
-            _label, _ = parse_html(
+            _label, _ = parse_nodes(
                 f'<label class="label"><select class="select w-full"></select>{label}</label>'
             )
-            self.tag.append(_label)
+            self.node.append(_label)
+            self.set_anchor("label", _label)
+            self.set_anchor("input", _label.children[0])
         else:
-            _input, _ = parse_html('<select class="select w-full"></select>')
-            self.tag.append(_input)
+            _input, _ = parse_nodes('<select class="select w-full"></select>')
+            self.node.append(_input)
+            self.set_anchor("input", _input)
 
         self.input.attrs.update(name=name, id=id)
         for option in options:
-            _option, _ = parse_html(f"<option>{option}</option>")
+            _option, _ = parse_nodes(f"<option>{option}</option>")
             self.input.append(_option)
 
     @property
     def input(self):
-        _input = self.find("select")
+        _input = self.find("select", anchor="input")
         return _input
 
     @property
     def disabled(self):
-        self.input.attrs.update(disabled="true")
-        return self
+        component = self.thaw()
+        component.input.attrs.update(disabled="true")
+        return component
 
 
 class PUITextInput(PUIInputABC, PUIVariantMixin):
@@ -251,11 +265,11 @@ class PUITextInput(PUIInputABC, PUIVariantMixin):
         )
         if datalist:
             _datalist_id = f"{id}-datalist"
-            _datalist, _ = parse_html(f'<datalist id="{_datalist_id}"></datalist>')
+            _datalist, _ = parse_nodes(f'<datalist id="{_datalist_id}"></datalist>')
             for option in datalist:
-                _option, _ = parse_html(f'<option value="{option}"></option>')
+                _option, _ = parse_nodes(f'<option value="{option}"></option>')
                 _datalist.append(_option)
-            self.tag.append(_datalist)
+            self.node.append(_datalist)
             self.input.attrs.update(list=_datalist_id)
 
 
@@ -3,7 +3,7 @@ from typing import List, Literal, Optional
 
 from ..core import PUIComponentABC
 from ..mixins import PUILayoutMixin, PUIVariantMixin
-from ..utils import parse_html
+from ..utils import parse_nodes
 from .base import PUISymbol
 
 
@@ -22,15 +22,15 @@ class PUIAlert(PUIComponentABC, PUIVariantMixin):
     ):
         super().__init__(*classes, **attributes)
         if symbol:
-            self.tag.append(PUISymbol(symbol=symbol).text_2xl.tag)
-        span, _ = parse_html(f"<span>{message}</span>")
-        self.tag.append(span)
+            self.node.append(PUISymbol(symbol=symbol).text_2xl.node)
+        span, _ = parse_nodes(f"<span>{message}</span>")
+        self.node.append(span)
 
         if close_button:
-            btn, _ = parse_html(
+            btn, _ = parse_nodes(
                 '<button class="btn btn-neutral btn-sm btn-ghost" onclick=""><span class="material-symbols-outlined text-lg">close</span></button>'
             )
-            self.tag.append(btn)
+            self.node.append(btn)
 
 
 class PUILoading(PUIComponentABC, PUIVariantMixin):
@@ -40,48 +40,39 @@ class PUILoading(PUIComponentABC, PUIVariantMixin):
 
     @property
     def spinner(self):
-        self.css("loading-spinner")
-        return self
+        return self.css("loading-spinner")
 
     @property
     def bars(self):
-        self.css("loading-bars")
-        return self
+        return self.css("loading-bars")
 
     @property
     def ball(self):
-        self.css("loading-ball")
-        return self
+        return self.css("loading-ball")
 
     @property
     def ring(self):
-        self.css("loading-ring")
-        return self
+        return self.css("loading-ring")
 
     @property
     def dots(self):
-        self.css("loading-dots")
-        return self
+        return self.css("loading-dots")
 
     @property
     def sm(self):
-        self.css("loading-sm")
-        return self
+        return self.css("loading-sm")
 
     @property
     def md(self):
-        self.css("loading-md")
-        return self
+        return self.css("loading-md")
 
     @property
     def lg(self):
-        self.css("loading-lg")
-        return self
+        return self.css("loading-lg")
 
     @property
     def xl(self):
-        self.css("loading-xl")
-        return self
+        return self.css("loading-xl")
 
 
 class PUIProgress(PUIComponentABC, PUILayoutMixin, PUIVariantMixin):
@@ -98,9 +89,9 @@ class PUIProgress(PUIComponentABC, PUILayoutMixin, PUIVariantMixin):
     ):
         super().__init__(*classes, **attributes)
         if value:
-            self.tag.attrs.update(value=str(value))
+            self.node.attrs.update(value=str(value))
         if max:
-            self.tag.attrs.update(max=str(max))
+            self.node.attrs.update(max=str(max))
 
 
 class PUIRadialProgress(PUIComponentABC, PUIVariantMixin):
@@ -115,8 +106,8 @@ class PUIRadialProgress(PUIComponentABC, PUIVariantMixin):
             "style": f"--value:{_value}",
             "aria-valuenow": _value,
         }
-        self.tag.attrs.update(**attrs)
-        self.tag.append(f"{_value}%")
+        self.node.attrs.update(**attrs)
+        self.node.append(f"{_value}%")
 
 
 # TODO: Make disapear and able to close
@@ -133,32 +124,27 @@ class PUIToast(PUIComponentABC):
     def __init__(self, *classes, messages: List[Message], **attributes):
         super().__init__(*classes, **attributes)
         for message in messages:
-            span, _ = parse_html(
+            span, _ = parse_nodes(
                 f"""<div class="alert alert-{message.variant}"><span>{message.content}</span></div>"""
             )
-            self.tag.append(span)
+            self.node.append(span)
 
     @property
     def toast_top(self):
-        self.css("toast-top")
-        return self
+        return self.css("toast-top")
 
     @property
     def toast_start(self):
-        self.css("toast-start")
-        return self
+        return self.css("toast-start")
 
     @property
     def toast_end(self):
-        self.css("toast-end")
-        return self
+        return self.css("toast-end")
 
     @property
     def toast_middle(self):
-        self.css("toast-middle")
-        return self
+        return self.css("toast-middle")
 
     @property
     def toast_center(self):
-        self.css("toast-center")
-        return self
+        return self.css("toast-center")
@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from ..core import PUIComponentABC
 from ..mixins import PUIVariantMixin
-from ..utils import parse_html
+from ..nodes import PUIElement, PUITextNode
 from .base import PUISymbol
 
 
@@ -15,22 +15,19 @@ class PUIDivider(PUIComponentABC, PUIVariantMixin):
     def __init__(self, *classes, content: Optional[str] = None, **attributes):
         super().__init__(*classes, **attributes)
         if content:
-            self.tag.append(content)
+            self.node.append(content)
 
     @property
     def divider_horizontal(self):
-        self.css("divider-horizontal")
-        return self
+        return self.css("divider-horizontal")
 
     @property
     def divider_start(self):
-        self.css("divider-start")
-        return self
+        return self.css("divider-start")
 
     @property
     def divider_end(self):
-        self.css("divider-end")
-        return self
+        return self.css("divider-end")
 
 
 class PUISidebarLayout(PUIComponentABC):
@@ -57,9 +54,10 @@ class PUISidebarLayout(PUIComponentABC):
               </svg>
             </label>
           </div>
-          <div class="mx-2 flex-1 px-2" id="navbar-title"></div>
+          <div class="mx-2 flex-1 px-2" id="navbar-title">[[title]]</div>
           <div class="hidden flex-none lg:block">
             <ul class="menu menu-horizontal">
+              [[navbar-menu]]
             </ul>
           </div>
         </div>
@@ -68,11 +66,14 @@ class PUISidebarLayout(PUIComponentABC):
       <div class="drawer-side">
         <label for="my-drawer-2" aria-label="close sidebar" class="drawer-overlay"></label>
         <ul class="menu bg-base-200 min-h-full w-80 p-4">
+          [[sidebar-menu]]
         </ul>
       </div>
     </div>
     """
 
+    layout_shell = True
+
     @dataclass
     class MenuItem:
         href: str
@@ -81,18 +82,18 @@ class PUISidebarLayout(PUIComponentABC):
 
     def __init__(self, *classes, title: str, menu_items: List[MenuItem], **attributes):
         super().__init__(*classes, **attributes)
-        _title = self.find("div", {"id": "navbar-title"})
-        _title.append(title)
+        self.slot("title").append(PUITextNode(title))
 
-        uls = self.tag.find_all("ul")
         for item in menu_items:
-            for ul in uls:
-                li, _ = parse_html(
-                    f"""<li class="display-flex flex-row items-center gap-2"></li>"""
-                )
-                a, _ = parse_html(f"<a href={item.href}></a>")
+            for menu in ("navbar-menu", "sidebar-menu"):
+                a = PUIElement("a", {"href": item.href})
                 if item.symbol:
-                    a.append(PUISymbol(symbol=item.symbol).tag)
+                    a.append(PUISymbol(symbol=item.symbol).node)
                 a.append(item.content)
-                li.append(a)
-                ul.append(li)
+                self.slot(menu).append(
+                    PUIElement(
+                        "li",
+                        classes=["display-flex", "flex-row", "items-center", "gap-2"],
+                        children=[a],
+                    )
+                )
@@ -1,46 +1,281 @@
-from abc import ABC, abstractmethod
-from typing import Optional, Union
+import warnings
+from abc import ABC, ABCMeta, abstractmethod
+from time import perf_counter
+from typing import IO, TYPE_CHECKING, Dict, Iterator, Optional, Tuple, Union
 
-from bs4 import Tag
+from . import profiling
+from .exceptions import PUIBuildError, PUIFindError, PUIFrozenError
+from .http import content_etag
+from .nodes import PUIElement, PUILayoutElement, PUINode, PUITextNode, freeze_tree, thaw_paths
+from .render import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_GZIP_LEVEL,
+    PUIRenderMemo,
+    encode_chunks,
+    gzip_chunks,
+    iter_render,
+    iter_render_shell,
+    write_pieces,
+)
+from .template import PUITemplate
+from .utils import add_css, parse_attributes_dict
 
-from .exceptions import PUIBuildError, PUIFindError
-from .utils import add_css, parse_attributes_dict, parse_html
+if TYPE_CHECKING:
+    from bs4 import Tag
 
+    from .aio import PUIRenderPool
 
-class PUIComponentABC(ABC):
-    tag: Tag
-    _wrapper: Optional[Tag] = None
+
+class PUIComponentMeta(ABCMeta):
+    """Times the construction of components while a `profiling.profile()` block is active"""
+
+    def __call__(cls, *args, **kwargs):
+        report = profiling.active()
+        if report is None:
+            return super().__call__(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            return super().__call__(*args, **kwargs)
+        finally:
+            report.add_build(cls.__name__, perf_counter() - start)
+
+
+class PUIComponentABC(ABC, metaclass=PUIComponentMeta):
+    node: PUIElement
+    _wrapper: Optional[PUIElement] = None
+    _template: Optional[PUITemplate] = None
+    # Default render mode, set `PUIComponentABC.pretty_render = False` to emit compact html everywhere
+    pretty_render: bool = True
+    # Element wrapping plain text children, `None` appends the text as-is
+    text_wrapper: Optional[str] = "span"
+    # Layouts render everything around their appended children once, see `render.iter_render_shell`
+    layout_shell: bool = False
+    # Render repeated subtrees once per render pass, see `render.PUIRenderMemo`
+    memoize_render: bool = False
+    # Number of wrapper children that came from the component itself, the rest were appended
+    _static_children: Optional[int] = None
+    # Elements looked up by name: the `pui-anchor`s of the template and those given to `set_anchor`
+    _anchors: Dict[str, PUIElement]
+    # (parent, placeholder) of every `[[name]]` slot of the template
+    _slots: Dict[str, Tuple[PUIElement, PUITextNode]]
+    # Set on the snapshots returned by `freeze()`, changing them changes a private copy instead
+    _frozen: bool = False
 
     def __init__(self, *classes, **attributes):
-        raw_html = self.__doc__
-        if not raw_html:
-            raise NotImplementedError(
-                f"{self.__class__.__name__} without __doc__ defined"
-            )
-        tag, wrapper = parse_html(raw_html)
-        self.tag = tag
+        template = self.template()
+        node, wrapper = template.build()
+        if self.layout_shell:
+            # Parents render the layout from its shell too, see `render.iter_render_children`
+            node, wrapper = _layout_root(node, wrapper, None)
+        self.node = node
         self._wrapper = wrapper
+        self._anchors = template.anchors(node)
+        self._slots = template.slots(node)
         attrs = parse_attributes_dict(attributes=attributes)
-        self.tag.attrs.update(**attrs)
+        if "class" in attrs:
+            self.node["class"] = attrs.pop("class")
+        self.node.attrs.update(**attrs)
         self.css(*classes)
 
+    @classmethod
+    def template(cls) -> PUITemplate:
+        """Returns the class template, parsing `__doc__` only on the first call"""
+        template = cls.__dict__.get("_template")
+        if template is None:
+            raw_html = cls.__doc__
+            if not raw_html:
+                raise NotImplementedError(f"{cls.__name__} without __doc__ defined")
+            template = PUITemplate(raw_html)
+            cls._template = template
+        return template
+
+    @property
+    def tag(self) -> "Tag":
+        """A `bs4.Tag` copy of the component, changes made to it are not reflected back
+
+        Deprecated: read and change the component through `node` instead
+        """
+        warnings.warn(
+            f"{self.__class__.__name__}.tag is a detached bs4 copy, changes made to it are lost: use .node instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.node.to_tag()
+
     def __str__(self) -> str:
-        return self.tag.prettify(formatter="html5")
+        return self.render()
+
+    def render(
+        self, pretty: Optional[bool] = None, memo: Optional[PUIRenderMemo] = None
+    ) -> str:
+        """Returns the html of the component, indented unless `pretty` (default `pretty_render`) is False"""
+        return "".join(self.iter_render(pretty=pretty, memo=memo))
+
+    def render_with_etag(
+        self, pretty: Optional[bool] = None, memo: Optional[PUIRenderMemo] = None
+    ) -> Tuple[str, str]:
+        """Returns the html of the component and its content hash, a strong `ETag` value (see `http.html_response`)"""
+        html = self.render(pretty=pretty, memo=memo)
+        return html, content_etag(html)
+
+    def iter_render(
+        self, pretty: Optional[bool] = None, memo: Optional[PUIRenderMemo] = None
+    ) -> Iterator[str]:
+        """Yields the html of the component piece by piece, in document order
+
+        Repeated subtrees are rendered once when given a `memo` (or with `memoize_render`), its stats tell the hit rate
+        """
+        pretty = self.pretty_render if pretty is None else pretty
+        if memo is None and self.memoize_render:
+            memo = PUIRenderMemo()
+        if memo is not None:
+            memo.reset()
+        if self.layout_shell and self._wrapper is not None:
+            static_children = self._static_children
+            if static_children is None:
+                static_children = len(self._wrapper.children)
+            pieces = iter_render_shell(
+                self.node, self._wrapper, static_children, pretty=pretty, memo=memo
+            )
+        else:
+            pieces = iter_render(self.node, pretty=pretty, memo=memo)
+
+        report = profiling.active()
+        if report is None:
+            return pieces
+        report.nodes_rendered += 1 + sum(1 for _ in self.node.descendants)
+        return profiling.timed_render(pieces, report)
+
+    def render_chunks(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        pretty: Optional[bool] = None,
+        memo: Optional[PUIRenderMemo] = None,
+    ) -> Iterator[bytes]:
+        """Yields the utf-8 html of the component in chunks of `chunk_size` bytes, e.g. for a `StreamingResponse`"""
+        return encode_chunks(
+            self.iter_render(pretty=pretty, memo=memo), chunk_size=chunk_size
+        )
+
+    def render_to(
+        self,
+        fp: IO[bytes],
+        pretty: Optional[bool] = None,
+        memo: Optional[PUIRenderMemo] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Writes the utf-8 html of the component to the binary file `fp` as it renders, returns the bytes written"""
+        return write_pieces(self.iter_render(pretty=pretty, memo=memo), fp, chunk_size=chunk_size)
+
+    def render_gzip(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        pretty: Optional[bool] = None,
+        memo: Optional[PUIRenderMemo] = None,
+        level: int = DEFAULT_GZIP_LEVEL,
+    ) -> Iterator[bytes]:
+        """Yields the gzipped html of the component in sync flushed chunks, the layout shell is compressed only once"""
+        return gzip_chunks(
+            self.iter_render(pretty=pretty, memo=memo), chunk_size=chunk_size, level=level
+        )
+
+    async def render_async(
+        self,
+        pretty: Optional[bool] = None,
+        memo: Optional[PUIRenderMemo] = None,
+        cooperative: bool = False,
+        yield_every: Optional[int] = None,
+        pool: Optional["PUIRenderPool"] = None,
+    ) -> str:
+        """Returns the html of the component without blocking the event loop
+
+        Renders on a `pool` thread (default `aio.get_pool()`), or on the loop yielding every `yield_every` pieces when `cooperative`
+        """
+        from . import aio
+
+        if yield_every is None:
+            yield_every = aio.DEFAULT_YIELD_EVERY
+        if cooperative:
+            return await aio.join_cooperatively(
+                self.iter_render(pretty=pretty, memo=memo), yield_every=yield_every
+            )
+        pool = pool or aio.get_pool()
+        return await pool.run(lambda: self.render(pretty=pretty, memo=memo))
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self) -> "PUIComponentABC":
+        """Returns an immutable snapshot of the component, any number of parents and threads can share it
 
-    def _append(self, child: Union[str, "Tag"]) -> None:
+        Changing the snapshot (`css`, the mixin properties, `[...]`, `slot`) returns a private copy, see `thaw`
+        """
+        if self._frozen:
+            return self
+        copies: Dict[int, PUINode] = {}
+        return self._copy(freeze_tree(self.node, copies), copies, frozen=True)
+
+    def thaw(self) -> "PUIComponentABC":
+        """Returns the component itself, or a mutable copy of it when it is frozen
+
+        Only the elements on the way to the wrapper, the slots and the anchors are copied, the rest stays shared
+        """
+        if not self._frozen:
+            return self
+        targets = {id(self.node), *(id(element) for element in self._anchors.values())}
+        if self._wrapper is not None:
+            targets.add(id(self._wrapper))
+        targets.update(id(parent) for parent, _ in self._slots.values())
+        copies: Dict[int, PUINode] = {}
+        node = thaw_paths(self.node, targets, copies)
+        if self.layout_shell and node.__class__ is not PUILayoutElement:
+            # Frozen roots are plain elements
+            wrapper = copies.get(id(self._wrapper), self._wrapper)
+            node, _ = _layout_root(node, wrapper, self._static_children)
+            copies[id(self.node)] = node
+        return self._copy(node, copies, frozen=False)
+
+    def _copy(
+        self, node: PUIElement, copies: Dict[int, PUINode], frozen: bool
+    ) -> "PUIComponentABC":
+        component = object.__new__(self.__class__)
+        component.__dict__.update(self.__dict__)
+        component.node = node
         if self._wrapper is not None:
+            component._wrapper = copies.get(id(self._wrapper), self._wrapper)
+        component._anchors = {
+            name: copies.get(id(element), element) for name, element in self._anchors.items()
+        }
+        component._slots = {
+            name: (copies.get(id(parent), parent), copies.get(id(placeholder), placeholder))
+            for name, (parent, placeholder) in self._slots.items()
+        }
+        component._frozen = frozen
+        return component
+
+    def _append(self, child: Union[str, PUINode]) -> None:
+        if self._frozen:
+            raise PUIFrozenError(f"Can not append to a frozen {self.__class__.__name__}, thaw() it first")
+        if self._wrapper is not None:
+            if self._static_children is None:
+                self._set_static_children(len(self._wrapper.children))
             self._wrapper.append(child)
         else:
-            self.tag.append(child)
-
-    def _format_child(self, child: Union[str, int, float, "PUIComponentABC"]) -> Tag:
-        if isinstance(child, PUIComponentABC):
-            return child.tag
-        elif isinstance(child, (str, int, float)):
-            tag, _ = parse_html(f"<span>{child}</span>")
-            return tag
-        else:
+            self.node.append(child)
+
+    def _set_static_children(self, count: int) -> None:
+        self._static_children = count
+        node = self.node
+        if node.__class__ is PUILayoutElement:
+            node.wrapper = self._wrapper
+            node.split = count
+
+    def _format_child(self, child: Union[str, int, float, "PUIComponentABC"]) -> PUINode:
+        if not isinstance(child, (str, int, float, PUIComponentABC)):
             raise ValueError(f"Can not append {child} to {self}")
+        return format_child(child, text_wrapper=self.text_wrapper)
 
     def append(self, child: Union[str, int, float, "PUIComponentABC"]):
         self._append(self._format_child(child=child))
@@ -51,43 +286,137 @@ class PUIComponentABC(ABC):
         else:
             _children = (children,)
 
+        component = self.thaw()
         for child in _children:
-            self.append(child)
-        return self
+            component.append(child)
+        return component
 
     def css(self, *classes: str) -> "PUIComponentABC":
-        add_css(self.tag, *classes)
-        return self
+        # Every mixin property lands here, straight to the node's class set
+        component = self.thaw()
+        component.node.add_class(*classes)
+        return component
+
+    def anchor(self, name: str) -> Optional[PUIElement]:
+        """Returns the element anchored as `name`, without searching the tree"""
+        return self._anchors.get(name)
+
+    def set_anchor(self, name: str, element: PUIElement) -> None:
+        """Anchors an element built after the template, e.g. in `__init__`"""
+        if self._frozen:
+            raise PUIFrozenError(f"Can not anchor to a frozen {self.__class__.__name__}, thaw() it first")
+        self._anchors[name] = element
+
+    def slot(self, name: str) -> "PUISlot":
+        """Returns the `[[name]]` slot of the template, `slot(name)[...]` appends there and returns the component"""
+        if name not in self._slots:
+            raise PUIFindError(f"{self.__class__.__name__} has no slot {name}")
+        component = self.thaw()
+        return PUISlot(component, *component._slots[name])
+
+    def find(
+        self,
+        tag_name: Optional[str] = None,
+        attrs: Optional[dict] = None,
+        anchor: Optional[str] = None,
+    ) -> PUIElement:
+        """Returns the first element below the component matching `tag_name` and `attrs`
 
-    def find(self, tag_name: Optional[str] = None, attrs: Optional[dict] = None) -> Tag:
-        tag = self.tag.find(name=tag_name, attrs=attrs if attrs else {})
-        if not tag:
+        The element anchored as `anchor` is returned right away when there is one, the search is the fallback
+        """
+        if anchor is not None:
+            node = self._anchors.get(anchor)
+            if node is not None:
+                return node
+
+        report = profiling.active()
+        if report is None:
+            node = self.node.find(name=tag_name, attrs=attrs)
+        else:
+            start = perf_counter()
+            node = self.node.find(name=tag_name, attrs=attrs)
+            report.find.add(perf_counter() - start)
+        if node is None:
             raise PUIFindError(f"{self} - {tag_name} ({attrs})")
-        return tag
+        return node
 
     @property
-    def wrapper(self) -> Tag:
+    def wrapper(self) -> PUIElement:
         if self._wrapper is None:
             raise PUIBuildError(f"{self}.wrapper")
         return self._wrapper
 
     @property
     def skeleton(self) -> "PUIComponentABC":
-        self.css("skeleton")
-        return self
+        return self.css("skeleton")
 
     @property
     def skeleton_text(self) -> "PUIComponentABC":
-        self.css("skeleton", "skeleton-text")
-        return self
+        return self.css("skeleton", "skeleton-text")
 
     def tooltip(self, content: str) -> "PUIComponentABC":
-        add_css(self.tag, "tooltip")
-        self.tag.attrs.update(**{"data-tip": content})
-        return self
+        component = self.thaw()
+        add_css(component.node, "tooltip")
+        component.node.attrs.update(**{"data-tip": content})
+        return component
+
+
+class PUISlot:
+    """A named position of a component template, children are appended in order where the `[[name]]` marker was"""
+
+    __slots__ = ("component", "parent", "placeholder")
+
+    def __init__(
+        self, component: PUIComponentABC, parent: PUIElement, placeholder: PUITextNode
+    ):
+        self.component = component
+        self.parent = parent
+        self.placeholder = placeholder
+
+    def append(self, child: Union[str, int, float, PUIComponentABC, PUINode]) -> None:
+        node = child if isinstance(child, PUINode) else self.component._format_child(child)
+        children = self.parent.children
+        index = children.index(self.placeholder)
+        children.insert(index, node)
+        component = self.component
+        # A slot inside the wrapper sits among the static children of a layout shell
+        if self.parent is component._wrapper and component._static_children is not None:
+            component._set_static_children(component._static_children + 1)
+
+    def __getitem__(
+        self, children: Union[tuple, str, int, float, PUIComponentABC, PUINode]
+    ) -> PUIComponentABC:
+        for child in children if isinstance(children, tuple) else (children,):
+            self.append(child)
+        return self.component
 
 
 class PUIStyleMixinABC(ABC):
     @abstractmethod
     def css(self, *classes):
         pass
+
+
+def _layout_root(
+    node: PUIElement, wrapper: Optional[PUIElement], split: Optional[int]
+) -> Tuple[PUILayoutElement, Optional[PUIElement]]:
+    """Returns `node` as a `PUILayoutElement` sharing its attrs and children, and the wrapper (`node` may be it)"""
+    layout = PUILayoutElement(node.name, node.attrs, node.classes, node.children, wrapper, split)
+    if wrapper is node:
+        layout.wrapper = wrapper = layout
+    return layout, wrapper
+
+
+def format_child(
+    child: Union[str, int, float, PUIComponentABC], text_wrapper: Optional[str] = "span"
+) -> PUINode:
+    """Converts a component child to a node, text is wrapped in a `text_wrapper` element (if any) and escaped on render"""
+    if isinstance(child, PUIComponentABC):
+        return child.node
+    elif isinstance(child, (str, int, float)):
+        text = PUITextNode(str(child))
+        if text_wrapper is None:
+            return text
+        return PUIElement(text_wrapper, children=[text])
+    else:
+        raise ValueError(f"Can not convert {child} to a node")
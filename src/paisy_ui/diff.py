@@ -0,0 +1,184 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .nodes import PUIElement, PUITextNode
+from .render import attrs_key, iter_render
+
+if TYPE_CHECKING:
+    from .core import PUIComponentABC
+
+# htmx swaps an element of the response into the page element with the same id when it carries this attribute
+OOB_ATTRIBUTE = "hx-swap-oob"
+
+# (hash, structure) of a subtree: different hashes tell a change right away, equal ones are confirmed by the structure
+Fingerprint = Tuple[int, Tuple[Any, ...]]
+
+
+@dataclass
+class PUIDiff:
+    """Elements of the new tree to send again, the rest of the page is unchanged
+
+    `full` means a change outside of any keyed element: the whole `root` has to be rendered again
+    """
+
+    root: PUIElement
+    # Fingerprints of the new tree, to diff the next render against
+    snapshot: "PUISnapshot" = field(repr=False)
+    fragments: List[PUIElement] = field(default_factory=list)
+    full: bool = False
+
+    @property
+    def changed(self) -> bool:
+        return self.full or bool(self.fragments)
+
+    def iter_render_oob(self, pretty: bool = False) -> Iterator[str]:
+        """Yields the changed fragments as out-of-band swaps (`hx-swap-oob="true"`), or the whole root when `full`"""
+        for fragment in [self.root] if self.full else self.fragments:
+            # Shallow copy, the attribute must not end up in the component tree
+            oob = PUIElement(
+                fragment.name,
+                {**fragment.attrs, OOB_ATTRIBUTE: "true"},
+                fragment.classes,
+                fragment.children,
+            )
+            yield from iter_render(oob, pretty=pretty)
+
+    def render_oob(self, pretty: bool = False) -> str:
+        return "".join(self.iter_render_oob(pretty=pretty))
+
+
+class PUISnapshot:
+    """Fingerprints of a rendered tree, keep it to diff the next render against without hashing this one again
+
+    Fingerprints of every element: `full` covers the whole subtree, `shallow` only the keys of its keyed descendants.
+    Attribute values are compared as rendered, so two fingerprints are equal only when the subtrees render the same
+    """
+
+    def __init__(self, tree: Union["PUIComponentABC", PUIElement], key: str = "id"):
+        root = tree if isinstance(tree, PUIElement) else tree.node
+        self.root = root
+        self.key = key
+        self.full: Dict[int, Fingerprint] = {}
+        self.shallow: Dict[int, Fingerprint] = {}
+        self.keyed: Dict[str, PUIElement] = {}
+
+        elements = []
+        duplicated = set()
+        stack = [root]
+        while stack:
+            element = stack.pop()
+            elements.append(element)
+            value = _key_value(element, key)
+            if value is not None:
+                if value in self.keyed:
+                    duplicated.add(value)
+                self.keyed[value] = element
+            for child in element.children:
+                if isinstance(child, PUIElement):
+                    stack.append(child)
+        # Duplicated keys can not be told apart, their elements are part of the enclosing one
+        for value in duplicated:
+            del self.keyed[value]
+
+        full_hashes = self.full
+        shallow_hashes = self.shallow
+        keyed_ids = {id(element): value for value, element in self.keyed.items()}
+        # In reversed preorder every element comes after its descendants
+        for element in reversed(elements):
+            full: List[Any] = []
+            hashes: List[Any] = []
+            shallow = None
+            for child in element.children:
+                if child.__class__ is PUITextNode:
+                    entry = hashed = child.text
+                elif isinstance(child, PUIElement):
+                    child_id = id(child)
+                    entry = full_hashes[child_id]
+                    hashed = entry[0]
+                    child_key = keyed_ids.get(child_id)
+                    if child_key is not None:
+                        shallow = shallow or {}
+                        shallow[len(full)] = ((key, child_key), (key, child_key))
+                    elif child_id in shallow_hashes:
+                        shallow = shallow or {}
+                        child_shallow = shallow_hashes[child_id]
+                        shallow[len(full)] = (child_shallow, child_shallow[0])
+                else:
+                    entry = hashed = (child.__class__, child.text)
+                full.append(entry)
+                hashes.append(hashed)
+            own = (element.name, attrs_key(element.attrs), tuple(element.classes))
+            full_hashes[id(element)] = (hash((*own, *hashes)), (*own, *full))
+            # Only elements with keyed descendants have a distinct shallow fingerprint
+            if shallow is not None:
+                for index, (entry, hashed) in shallow.items():
+                    full[index] = entry
+                    hashes[index] = hashed
+                shallow_hashes[id(element)] = (hash((*own, *hashes)), (*own, *full))
+
+    def shallow_hash(self, element: PUIElement) -> Fingerprint:
+        return self.shallow.get(id(element), self.full[id(element)])
+
+
+def diff(
+    old: Union["PUIComponentABC", PUIElement, PUISnapshot],
+    new: Union["PUIComponentABC", PUIElement],
+    key: str = "id",
+) -> PUIDiff:
+    """Compares two renders of a component tree, returning the outermost changed elements of `new` with a `key`
+
+    Elements are matched by their `key` attribute (unique in each tree), `render_oob()` of the result updates a page
+    showing `old` into `new`. A change that no keyed element encloses makes the diff `full`.
+    `old` may be the `snapshot` of the previous diff, so that each render is only fingerprinted once.
+    """
+    if not isinstance(old, PUISnapshot):
+        before = PUISnapshot(old, key)
+    elif old.key != key:
+        before = PUISnapshot(old.root, key)
+    else:
+        before = old
+    after = PUISnapshot(new, key)
+    old_root, new_root = before.root, after.root
+    result = PUIDiff(root=new_root, snapshot=after)
+    if before.full[id(old_root)] == after.full[id(new_root)]:
+        return result
+    if before.shallow_hash(old_root) != after.shallow_hash(new_root):
+        result.full = True
+        return result
+
+    _collect(new_root, before, after, result.fragments)
+    return result
+
+
+def _key_value(element: PUIElement, key: str) -> Optional[str]:
+    """The `key` attribute of `element` as rendered (`1` and `True` are different keys), `None` without one"""
+    value = element.attrs.get(key)
+    return None if value is None else str(value)
+
+
+def _collect(
+    region: PUIElement,
+    before: PUISnapshot,
+    after: PUISnapshot,
+    fragments: List[PUIElement],
+) -> None:
+    """Adds the changed keyed elements of `region`, whose own content (keys of the keyed descendants aside) is unchanged"""
+    for element in _keyed_descendants(region, after):
+        previous = before.keyed.get(_key_value(element, after.key))
+        if previous is None or before.shallow_hash(previous) != after.shallow_hash(element):
+            fragments.append(element)
+        elif before.full[id(previous)] != after.full[id(element)]:
+            _collect(element, before, after, fragments)
+
+
+def _keyed_descendants(region: PUIElement, snapshot: PUISnapshot) -> Iterator[PUIElement]:
+    """Yields the keyed elements below `region` that no other keyed element encloses"""
+    stack = [child for child in reversed(region.children) if isinstance(child, PUIElement)]
+    while stack:
+        element = stack.pop()
+        value = _key_value(element, snapshot.key)
+        if value is not None and snapshot.keyed.get(value) is element:
+            yield element
+            continue
+        stack.extend(child for child in reversed(element.children) if isinstance(child, PUIElement))
+
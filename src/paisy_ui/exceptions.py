@@ -8,3 +8,7 @@ class PUIBuildError(PUIException):
 
 class PUIFindError(PUIException):
     pass
+
+
+class PUIFrozenError(PUIException):
+    pass
@@ -0,0 +1,79 @@
+from functools import wraps
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
+
+from .exceptions import PUIBuildError, PUIFindError
+
+if TYPE_CHECKING:
+    from .core import PUIComponentABC
+
+FragmentFactory = Callable[..., "PUIComponentABC"]
+
+
+class PUIFragments:
+    """Registry of the parts of a page that can be served on their own, e.g. to answer an htmx request
+
+    The page factory calls the decorated factories to build the full page, `render(name, ...)` only calls one of them:
+    the layout around it and its siblings are never built
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, FragmentFactory] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def fragment(self, name: str) -> Callable[[FragmentFactory], FragmentFactory]:
+        """Registers the decorated factory as `name`, the `id` of the component it returns (set when missing)"""
+        if name in self._factories:
+            raise PUIBuildError(f"Fragment {name} already registered")
+
+        def decorator(factory: FragmentFactory) -> FragmentFactory:
+            @wraps(factory)
+            def build(*args, **kwargs) -> "PUIComponentABC":
+                component = factory(*args, **kwargs)
+                attrs = component.node.attrs
+                if "id" not in attrs:
+                    # A frozen component is shared, the id goes on a copy of it
+                    component = component.thaw()
+                    component.node.attrs["id"] = name
+                elif attrs["id"] != name:
+                    raise PUIBuildError(
+                        f"Fragment {name} built a component with id {attrs['id']}"
+                    )
+                return component
+
+            self._factories[name] = build
+            return build
+
+        return decorator
+
+    def build(self, name: str, *args, **kwargs) -> "PUIComponentABC":
+        """Builds the fragment `name` alone, the arguments are those of its factory"""
+        factory = self._factories.get(name)
+        if factory is None:
+            raise PUIFindError(f"Fragment {name} is not registered")
+        return factory(*args, **kwargs)
+
+    def render(self, name: str, *args, pretty: Optional[bool] = None, **kwargs) -> str:
+        """Returns the html of the fragment `name` alone, the other arguments are those of its factory"""
+        return self.build(name, *args, **kwargs).render(pretty=pretty)
+
+
+_default = PUIFragments()
+
+
+def fragment(name: str) -> Callable[[FragmentFactory], FragmentFactory]:
+    """Registers the decorated factory in the default registry, see `PUIFragments.fragment`"""
+    return _default.fragment(name)
+
+
+def build_fragment(name: str, *args, **kwargs) -> "PUIComponentABC":
+    return _default.build(name, *args, **kwargs)
+
+
+def render_fragment(name: str, *args, pretty: Optional[bool] = None, **kwargs) -> str:
+    """Returns the html of a fragment of the default registry, see `PUIFragments.render`"""
+    return _default.render(name, *args, pretty=pretty, **kwargs)
@@ -0,0 +1,158 @@
+from hashlib import blake2b
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+    from .core import PUIComponentABC
+
+from .render import DEFAULT_CHUNK_SIZE
+
+PageFactory = Callable[[], "PUIComponentABC"]
+
+DEFAULT_CACHE_SIZE = 256
+
+
+def content_etag(html: Union[str, bytes]) -> str:
+    """Returns a strong `ETag` value hashing the rendered html, the same page always gets the same one"""
+    data = html.encode("utf-8") if isinstance(html, str) else html
+    return f'"{blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def version_etag(version: Hashable) -> str:
+    """Returns the `ETag` value of a page version key (e.g. the last update of the data it shows), stable across processes"""
+    return f'"v-{blake2b(repr(version).encode("utf-8"), digest_size=16).hexdigest()}"'
+
+
+def if_none_match(header: Optional[str], etag: str) -> bool:
+    """Whether an `If-None-Match` header matches `etag`, i.e. the client copy is fresh (weak comparison, RFC 9110)"""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def accepts_gzip(header: Optional[str]) -> bool:
+    """Whether an `Accept-Encoding` header allows a gzip response (`gzip` or `*` without `q=0`)"""
+    for coding in (header or "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "x-gzip", "*"):
+            continue
+        quality = params.strip().lower()
+        if not quality.startswith("q="):
+            return True
+        try:
+            return float(quality[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
+
+class PUIRenderCache:
+    """Rendered pages by key and `pretty`, reused while the version given by the page factory does not change
+
+    Keeps the last `maxsize` of them, the oldest one is dropped first. Safe to share between the threads serving sync
+    routes, a page missing in several of them at once may be rendered more than once
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._pages: Dict[Hashable, Tuple[Hashable, bytes, str]] = {}
+        self._lock = Lock()
+
+    def get(
+        self,
+        key: Hashable,
+        version: Hashable,
+        page: Union["PUIComponentABC", PageFactory],
+        pretty: Optional[bool] = None,
+    ) -> Tuple[bytes, str]:
+        """Returns the utf-8 html and `ETag` of `page` (a component or a factory), rendered only when `version` changed"""
+        key = (key, pretty)
+        with self._lock:
+            cached = self._pages.get(key)
+            if cached is not None and cached[0] == version:
+                self.hits += 1
+                return cached[1], cached[2]
+            self.misses += 1
+
+        # Rendered outside of the lock, other pages are served meanwhile
+        component = page() if callable(page) else page
+        body = component.render(pretty=pretty).encode("utf-8")
+        etag = version_etag(version)
+        with self._lock:
+            self._pages.pop(key, None)
+            while self._pages and len(self._pages) >= self.maxsize:
+                self._pages.pop(next(iter(self._pages)))
+            if self.maxsize > 0:
+                self._pages[key] = (version, body, etag)
+        return body, etag
+
+
+def html_response(
+    request: "Request",
+    page: Union["PUIComponentABC", PageFactory],
+    version: Optional[Hashable] = None,
+    cache: Optional[PUIRenderCache] = None,
+    pretty: Optional[bool] = None,
+    headers: Optional[Dict[str, str]] = None,
+    key: Optional[Hashable] = None,
+) -> "Response":
+    """Returns an `HTMLResponse` with an `ETag`, or a 304 when the `If-None-Match` of `request` is still fresh
+
+    With a `version` (cheap to compute, it changes whenever the page does) a fresh client gets its 304 before `page`
+    (a component or a factory) is called, and a `cache` serves the other ones without rendering. Pages are cached by
+    `key`, the request path and query string by default, pass one when the page also depends on e.g. a header or the
+    user. Without a `version` the page is rendered and its content hash is the `ETag`.
+    """
+    from starlette.responses import HTMLResponse, Response
+
+    header = request.headers.get("if-none-match")
+    if version is not None:
+        etag = version_etag(version)
+        if if_none_match(header, etag):
+            return Response(status_code=304, headers={**(headers or {}), "ETag": etag})
+        if cache is not None:
+            if key is None:
+                key = (request.url.path, request.url.query)
+            body, etag = cache.get(key, version, page, pretty=pretty)
+        else:
+            component = page() if callable(page) else page
+            body = component.render(pretty=pretty).encode("utf-8")
+    else:
+        component = page() if callable(page) else page
+        body = component.render(pretty=pretty).encode("utf-8")
+        etag = content_etag(body)
+        if if_none_match(header, etag):
+            return Response(status_code=304, headers={**(headers or {}), "ETag": etag})
+    return HTMLResponse(body, headers={**(headers or {}), "ETag": etag})
+
+
+def streaming_response(
+    request: "Request",
+    page: Union["PUIComponentABC", PageFactory],
+    pretty: Optional[bool] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    headers: Optional[Dict[str, str]] = None,
+) -> "Response":
+    """Returns a `StreamingResponse` of `page` (a component or a factory), gzipped when the `request` accepts it
+
+    The gzip stream is produced while rendering (see `PUIComponentABC.render_gzip`), exclude the route from any
+    compression middleware.
+    """
+    from starlette.responses import StreamingResponse
+
+    component = page() if callable(page) else page
+    headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+    if accepts_gzip(request.headers.get("accept-encoding")):
+        headers["Content-Encoding"] = "gzip"
+        body = component.render_gzip(chunk_size=chunk_size, pretty=pretty)
+    else:
+        body = component.render_chunks(chunk_size=chunk_size, pretty=pretty)
+    return StreamingResponse(body, media_type="text/html", headers=headers)
@@ -6,90 +6,72 @@ class PUIBackgroundColorMixin(PUIStyleMixinABC):
 
     @property
     def bg_base(self):
-        self.css(f"{self._bg_color_mixin_prefix}-base-300")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-base-300")
 
     @property
     def bg_base_content(self):
-        self.css(f"{self._bg_color_mixin_prefix}-base-300-content")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-base-300-content")
 
     @property
     def bg_neutral(self):
-        self.css(f"{self._bg_color_mixin_prefix}-neutral")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-neutral")
 
     @property
     def bg_neutral_content(self):
-        self.css(f"{self._bg_color_mixin_prefix}-neutral-content")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-neutral-content")
 
     @property
     def bg_primary(self):
-        self.css(f"{self._bg_color_mixin_prefix}-primary")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-primary")
 
     @property
     def bg_primary_content(self):
-        self.css(f"{self._bg_color_mixin_prefix}-primary-content")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-primary-content")
 
     @property
     def bg_secondary(self):
-        self.css(f"{self._bg_color_mixin_prefix}-secondary")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-secondary")
 
     @property
     def bg_secondary_content(self):
-        self.css(f"{self._bg_color_mixin_prefix}-secondary-content")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-secondary-content")
 
     @property
     def bg_accent(self):
-        self.css(f"{self._bg_color_mixin_prefix}-accent")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-accent")
 
     @property
     def bg_accent_content(self):
-        self.css(f"{self._bg_color_mixin_prefix}-accent-content")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-accent-content")
 
     @property
     def bg_success(self):
-        self.css(f"{self._bg_color_mixin_prefix}-success")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-success")
 
     @property
     def bg_success_content(self):
-        self.css(f"{self._bg_color_mixin_prefix}-success-content")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-success-content")
 
     @property
     def bg_info(self):
-        self.css(f"{self._bg_color_mixin_prefix}-info")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-info")
 
     @property
     def bg_info_content(self):
-        self.css(f"{self._bg_color_mixin_prefix}-info-content")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-info-content")
 
     @property
     def bg_warning(self):
-        self.css(f"{self._bg_color_mixin_prefix}-warning")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-warning")
 
     @property
     def bg_warning_content(self):
-        self.css(f"{self._bg_color_mixin_prefix}-warning-content")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-warning-content")
 
     @property
     def bg_error(self):
-        self.css(f"{self._bg_color_mixin_prefix}-error")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-error")
 
     @property
     def bg_error_content(self):
-        self.css(f"{self._bg_color_mixin_prefix}-error-content")
-        return self
+        return self.css(f"{self._bg_color_mixin_prefix}-error-content")
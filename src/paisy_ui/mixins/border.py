@@ -4,25 +4,20 @@ from ..core import PUIStyleMixinABC
 class PUIRoundedMixin(PUIStyleMixinABC):
     @property
     def rounded_sm(self):
-        self.css("rounded-sm")
-        return self
+        return self.css("rounded-sm")
 
     @property
     def rounded_md(self):
-        self.css("rounded-md")
-        return self
+        return self.css("rounded-md")
 
     @property
     def rounded_lg(self):
-        self.css("rounded-lg")
-        return self
+        return self.css("rounded-lg")
 
     @property
     def rounded_xl(self):
-        self.css("rounded-xl")
-        return self
+        return self.css("rounded-xl")
 
     @property
     def rounded_full(self):
-        self.css("rounded-full")
-        return self
+        return self.css("rounded-full")
@@ -4,110 +4,88 @@ from ..core import PUIStyleMixinABC
 class PUIDisplayMixin(PUIStyleMixinABC):
     @property
     def display_hidden(self):
-        self.css("hidden")
-        return self
+        return self.css("hidden")
 
     @property
     def sm__hidden(self):
-        self.css("sm:hidden")
-        return self
+        return self.css("sm:hidden")
 
     @property
     def md__hidden(self):
-        self.css("md:hidden")
-        return self
+        return self.css("md:hidden")
 
     @property
     def lg__hidden(self):
-        self.css("lg:hidden")
-        return self
+        return self.css("lg:hidden")
 
     @property
     def display_flex_col(self):
-        self.css("flex flex-col")
-        return self
+        return self.css("flex flex-col")
 
     @property
     def display_flex_row(self):
-        self.css("flex flex-row")
-        return self
+        return self.css("flex flex-row")
 
     @property
     def items_center(self):
-        self.css("items-center")
-        return self
+        return self.css("items-center")
 
     @property
     def justify_center(self):
-        self.css("justify-center")
-        return self
+        return self.css("justify-center")
 
     @property
     def justify_between(self):
-        self.css("justify-between")
-        return self
+        return self.css("justify-between")
 
     @property
     def items_start(self):
-        self.css("items-start")
-        return self
+        return self.css("items-start")
 
     @property
     def justify_start(self):
-        self.css("justify-start")
-        return self
+        return self.css("justify-start")
 
     @property
     def items_end(self):
-        self.css("items-end")
-        return self
+        return self.css("items-end")
 
     @property
     def justify_end(self):
-        self.css("justify-end")
-        return self
+        return self.css("justify-end")
 
     @property
     def display_grid(self):
-        self.css("grid")
-        return self
+        return self.css("grid")
 
     @property
     def grid_cols_auto(self):
-        self.css("grid-cols-auto")
-        return self
+        return self.css("grid-cols-auto")
 
     @property
     def grid_cols_2(self):
-        self.css("grid-cols-2")
-        return self
+        return self.css("grid-cols-2")
 
     @property
     def grid_cols_3(self):
-        self.css("grid-cols-3")
-        return self
+        return self.css("grid-cols-3")
 
     @property
     def grid_cols_4(self):
-        self.css("grid-cols-4")
-        return self
+        return self.css("grid-cols-4")
 
     @property
     def gap_sm(self):
-        self.css("gap-2")
-        return self
+        return self.css("gap-2")
 
     @property
     def gap_md(self):
-        self.css("gap-4")
-        return self
+        return self.css("gap-4")
 
     @property
     def gap_lg(self):
-        self.css("gap-8")
-        return self
+        return self.css("gap-8")
 
     @property
     def gap_xl(self):
-        self.css("gap-12")
-        return self
+        return self.css("gap-12")
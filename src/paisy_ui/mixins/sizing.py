@@ -4,72 +4,58 @@ from ..core import PUIStyleMixinABC
 class PUIWidthMixin(PUIStyleMixinABC):
     @property
     def width_sm(self):
-        self.css("w-12")
-        return self
+        return self.css("w-12")
 
     @property
     def width_md(self):
-        self.css("w-36")
-        return self
+        return self.css("w-36")
 
     @property
     def width_lg(self):
-        self.css("w-64")
-        return self
+        return self.css("w-64")
 
     @property
     def width_xl(self):
-        self.css("w-128")
-        return self
+        return self.css("w-128")
 
     @property
     def width_full(self):
-        self.css("w-full")
-        return self
+        return self.css("w-full")
 
     @property
     def width_min(self):
-        self.css("w-min")
-        return self
+        return self.css("w-min")
 
     @property
     def width_half(self):
-        self.css("w-1/2")
-        return self
+        return self.css("w-1/2")
 
 
 class PUIHeightMixin(PUIStyleMixinABC):
     @property
     def height_sm(self):
-        self.css("h-12")
-        return self
+        return self.css("h-12")
 
     @property
     def height_md(self):
-        self.css("h-36")
-        return self
+        return self.css("h-36")
 
     @property
     def height_lg(self):
-        self.css("h-64")
-        return self
+        return self.css("h-64")
 
     @property
     def height_xl(self):
-        self.css("h-128")
-        return self
+        return self.css("h-128")
 
     @property
     def height_full(self):
-        self.css("h-full")
-        return self
+        return self.css("h-full")
 
     @property
     def height_min(self):
-        self.css("h-min")
-        return self
+        return self.css("h-min")
 
     @property
     def height_half(self):
-        self.css("h-1/2")
-        return self
+        return self.css("h-1/2")
@@ -4,42 +4,34 @@ from ..core import PUIStyleMixinABC
 class PUIPaddingMixin(PUIStyleMixinABC):
     @property
     def padding_sm(self):
-        self.css("p-2")
-        return self
+        return self.css("p-2")
 
     @property
     def padding_md(self):
-        self.css("p-4")
-        return self
+        return self.css("p-4")
 
     @property
     def padding_lg(self):
-        self.css("p-8")
-        return self
+        return self.css("p-8")
 
     @property
     def padding_xl(self):
-        self.css("p-12")
-        return self
+        return self.css("p-12")
 
 
 class PUIMarginMixin(PUIStyleMixinABC):
     @property
     def margin_sm(self):
-        self.css("m-2")
-        return self
+        return self.css("m-2")
 
     @property
     def margin_md(self):
-        self.css("m-4")
-        return self
+        return self.css("m-4")
 
     @property
     def margin_lg(self):
-        self.css("m-8")
-        return self
+        return self.css("m-8")
 
     @property
     def margin_xl(self):
-        self.css("m-12")
-        return self
+        return self.css("m-12")
@@ -4,80 +4,64 @@ from ..core import PUIStyleMixinABC
 class PUITextColorMixin(PUIStyleMixinABC):
     @property
     def text_neutral(self):
-        self.css("text-neutral")
-        return self
+        return self.css("text-neutral")
 
     @property
     def text_neutral_content(self):
-        self.css("text-neutral-content")
-        return self
+        return self.css("text-neutral-content")
 
     @property
     def text_primary(self):
-        self.css("text-primary")
-        return self
+        return self.css("text-primary")
 
     @property
     def text_primary_content(self):
-        self.css("text-primary-content")
-        return self
+        return self.css("text-primary-content")
 
     @property
     def text_secondary(self):
-        self.css("text-secondary")
-        return self
+        return self.css("text-secondary")
 
     @property
     def text_secondary_content(self):
-        self.css("text-secondary-content")
-        return self
+        return self.css("text-secondary-content")
 
     @property
     def text_content(self):
-        self.css("text-accent")
-        return self
+        return self.css("text-accent")
 
     @property
     def text_accent_content(self):
-        self.css("text-accent-content")
-        return self
+        return self.css("text-accent-content")
 
     @property
     def text_success(self):
-        self.css("text-success")
-        return self
+        return self.css("text-success")
 
     @property
     def text_success_content(self):
-        self.css("text-success-content")
-        return self
+        return self.css("text-success-content")
 
     @property
     def text_info(self):
-        self.css("text-info")
-        return self
+        return self.css("text-info")
 
     @property
     def text_info_content(self):
-        self.css("text-info-content")
-        return self
+        return self.css("text-info-content")
 
     @property
     def text_warning(self):
-        self.css("text-warning")
-        return self
+        return self.css("text-warning")
 
     @property
     def text_warning_content(self):
-        self.css("text-warning-content")
-        return self
+        return self.css("text-warning-content")
 
     @property
     def text_error(self):
-        self.css("text-error")
-        return self
+        return self.css("text-error")
 
     @property
     def text_error_content(self):
-        self.css("text-error-content")
-        return self
+        return self.css("text-error-content")
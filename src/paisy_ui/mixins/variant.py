@@ -6,60 +6,48 @@ class PUIVariantMixin(PUIStyleMixinABC):
 
     @property
     def dash(self):
-        self.css(f"{self._variant_prefix}-dash")
-        return self
+        return self.css(f"{self._variant_prefix}-dash")
 
     @property
     def soft(self):
-        self.css(f"{self._variant_prefix}-soft")
-        return self
+        return self.css(f"{self._variant_prefix}-soft")
 
     @property
     def ghost(self):
-        self.css(f"{self._variant_prefix}-ghost")
-        return self
+        return self.css(f"{self._variant_prefix}-ghost")
 
     @property
     def base(self):
-        self.css(f"{self._variant_prefix}-base-300")
-        return self
+        return self.css(f"{self._variant_prefix}-base-300")
 
     @property
     def neutral(self):
-        self.css(f"{self._variant_prefix}-neutral")
-        return self
+        return self.css(f"{self._variant_prefix}-neutral")
 
     @property
     def primary(self):
-        self.css(f"{self._variant_prefix}-primary")
-        return self
+        return self.css(f"{self._variant_prefix}-primary")
 
     @property
     def secondary(self):
-        self.css(f"{self._variant_prefix}-secondary")
-        return self
+        return self.css(f"{self._variant_prefix}-secondary")
 
     @property
     def accent(self):
-        self.css(f"{self._variant_prefix}-accent")
-        return self
+        return self.css(f"{self._variant_prefix}-accent")
 
     @property
     def success(self):
-        self.css(f"{self._variant_prefix}-success")
-        return self
+        return self.css(f"{self._variant_prefix}-success")
 
     @property
     def info(self):
-        self.css(f"{self._variant_prefix}-info")
-        return self
+        return self.css(f"{self._variant_prefix}-info")
 
     @property
     def warning(self):
-        self.css(f"{self._variant_prefix}-warning")
-        return self
+        return self.css(f"{self._variant_prefix}-warning")
 
     @property
     def error(self):
-        self.css(f"{self._variant_prefix}-error")
-        return self
+        return self.css(f"{self._variant_prefix}-error")
@@ -0,0 +1,359 @@
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NoReturn, Optional, Set, Union
+
+from .exceptions import PUIFrozenError
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+    from bs4.element import PageElement
+
+
+class PUINode:
+    """Base of the lightweight tree the components are built on (see `PUIElement`)"""
+
+    __slots__ = ()
+
+    def clone(self) -> "PUINode":
+        raise NotImplementedError
+
+    def to_bs4(self, soup: "BeautifulSoup") -> "PageElement":
+        raise NotImplementedError
+
+
+class PUITextNode(PUINode):
+    """Text content, escaped on render unless inside `<script>` or `<style>`"""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.text!r})"
+
+    def clone(self) -> "PUITextNode":
+        return self.__class__(self.text)
+
+    def to_bs4(self, soup: "BeautifulSoup") -> "PageElement":
+        return soup.new_string(self.text)
+
+
+class PUICommentNode(PUITextNode):
+    """An html comment, rendered as-is"""
+
+    __slots__ = ()
+
+    def to_bs4(self, soup: "BeautifulSoup") -> "PageElement":
+        from bs4 import Comment
+
+        return soup.new_string(self.text, Comment)
+
+
+class PUIElement(PUINode):
+    """An html element
+
+    Mirrors the parts of the `bs4.Tag` API used by the components (`attrs`, `append`, `find`, ...),
+    except that the class attribute lives in `classes` instead of `attrs`, an ordered set (a `dict` with the
+    classes as keys): adding a class is O(1), duplicates are ignored and it is only joined on render
+    """
+
+    __slots__ = ("name", "attrs", "classes", "children")
+
+    name: str
+    attrs: Dict[str, Any]
+    classes: Dict[str, None]
+    children: List[PUINode]
+
+    def __init__(
+        self,
+        name: str,
+        attrs: Optional[Dict[str, Any]] = None,
+        classes: Optional[Iterable[str]] = None,
+        children: Optional[List[PUINode]] = None,
+    ):
+        self.name = name
+        self.attrs = {} if attrs is None else attrs
+        if classes is None:
+            classes = {}
+        elif classes.__class__ is not dict:
+            classes = dict.fromkeys(classes)
+        self.classes = classes
+        self.children = [] if children is None else children
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r})"
+
+    def __str__(self) -> str:
+        from .render import iter_render
+
+        return "".join(iter_render(self, pretty=False))
+
+    @property
+    def contents(self) -> List[PUINode]:
+        """Alias of `children`, as named by `bs4.Tag`"""
+        return self.children
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "class":
+            return self.classes or default
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "class":
+            return self.classes
+        return self.attrs[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "class":
+            self.classes = dict.fromkeys(value.split() if isinstance(value, str) else value)
+        else:
+            self.attrs[key] = value
+
+    def add_class(self, *classes: str) -> None:
+        _classes = self.classes
+        for _class in classes:
+            for name in _class.split():
+                _classes[name] = None
+
+    def append(self, child: Union[str, PUINode, "PageElement"]) -> None:
+        self.children.append(to_node(child))
+
+    def extend(self, children) -> None:
+        self.children.extend(to_node(child) for child in children)
+
+    def insert(self, index: int, child: Union[str, PUINode, "PageElement"]) -> None:
+        self.children.insert(index, to_node(child))
+
+    @property
+    def descendants(self) -> Iterator[PUINode]:
+        """Every node below this element, in document order"""
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            yield node
+            if isinstance(node, PUIElement):
+                stack.extend(node.children[::-1])
+
+    def matches(self, name: Optional[str] = None, attrs: Optional[dict] = None) -> bool:
+        """Same matching rules as `bs4.Tag.find` for plain values: a class matches any single class"""
+        if name is not None and name != self.name:
+            return False
+        for key, value in (attrs or {}).items():
+            actual = self.get(key)
+            if value is True or value is None:
+                if (actual is not None) != (value is True):
+                    return False
+            elif key == "class":
+                if value not in self.classes and value != " ".join(self.classes):
+                    return False
+            elif actual != value:
+                return False
+        return True
+
+    def find(
+        self, name: Optional[str] = None, attrs: Optional[dict] = None
+    ) -> Optional["PUIElement"]:
+        """Returns the first descendant element matching `name` and `attrs`"""
+        for node in self.descendants:
+            if isinstance(node, PUIElement) and node.matches(name, attrs):
+                return node
+        return None
+
+    def find_all(
+        self, name: Optional[str] = None, attrs: Optional[dict] = None
+    ) -> List["PUIElement"]:
+        """Returns every descendant element matching `name` and `attrs`"""
+        return [
+            node
+            for node in self.descendants
+            if isinstance(node, PUIElement) and node.matches(name, attrs)
+        ]
+
+    def clone(self) -> "PUIElement":
+        return self.__class__(
+            self.name,
+            self.attrs.copy(),
+            self.classes.copy(),
+            [child.clone() for child in self.children],
+        )
+
+    def to_bs4(self, soup: "BeautifulSoup") -> "Tag":
+        attrs = dict(self.attrs)
+        if self.classes:
+            attrs["class"] = " ".join(self.classes)
+        tag = soup.new_tag(self.name, attrs=attrs)
+        for child in self.children:
+            tag.append(child.to_bs4(soup))
+        return tag
+
+    def to_tag(self) -> "Tag":
+        """Returns a `bs4.Tag` copy of this element"""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup("", "html.parser")
+        tag = self.to_bs4(soup)
+        soup.append(tag)
+        return tag
+
+    @classmethod
+    def from_tag(cls, tag: "Tag") -> "PUIElement":
+        """Returns a copy of a `bs4.Tag`"""
+        attrs = {}
+        classes = []
+        for key, value in tag.attrs.items():
+            if key == "class":
+                classes = value.split() if isinstance(value, str) else list(value)
+            elif isinstance(value, (list, tuple)):
+                attrs[key] = " ".join(value)
+            else:
+                attrs[key] = value
+        return cls(tag.name, attrs, classes, [from_bs4(c) for c in tag.contents])
+
+
+class PUILayoutElement(PUIElement):
+    """The root element of a layout component, rendered from its cached shell wherever it is nested
+
+    `wrapper` holds the appended children, the first `split` of them (all when `None`) belong to the layout itself
+    """
+
+    __slots__ = ("wrapper", "split")
+
+    wrapper: Optional[PUIElement]
+    split: Optional[int]
+
+    def __init__(
+        self,
+        name: str,
+        attrs: Optional[Dict[str, Any]] = None,
+        classes: Optional[Iterable[str]] = None,
+        children: Optional[List[PUINode]] = None,
+        wrapper: Optional[PUIElement] = None,
+        split: Optional[int] = None,
+    ):
+        super().__init__(name, attrs, classes, children)
+        self.wrapper = wrapper
+        self.split = split
+
+    def clone(self) -> PUIElement:
+        # The wrapper of the copy is not known here, it renders as a plain element
+        return PUIElement(
+            self.name,
+            self.attrs.copy(),
+            self.classes.copy(),
+            [child.clone() for child in self.children],
+        )
+
+
+def _frozen(self, *args, **kwargs) -> NoReturn:
+    raise PUIFrozenError("Frozen elements can not be changed, thaw() the component first")
+
+
+class PUIFrozenDict(dict):
+    """Read-only `attrs` and `classes` of a `PUIFrozenElement`"""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _frozen
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+class PUIFrozenElement(PUIElement):
+    """An element that never changes, so any number of trees (and threads) can share it
+
+    Its attributes and classes are read-only and its children a tuple, `clone()` returns a mutable copy
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        name: str,
+        attrs: Dict[str, Any],
+        classes: Dict[str, None],
+        children: Iterable[PUINode],
+    ):
+        set_slot = object.__setattr__
+        set_slot(self, "name", name)
+        set_slot(self, "attrs", PUIFrozenDict(attrs))
+        set_slot(self, "classes", PUIFrozenDict(classes))
+        set_slot(self, "children", tuple(children))
+
+    __setattr__ = __setitem__ = add_class = append = extend = insert = _frozen
+
+    def __reduce__(self):
+        return self.__class__, (self.name, dict(self.attrs), dict(self.classes), self.children)
+
+    def clone(self) -> PUIElement:
+        return PUIElement(
+            self.name,
+            dict(self.attrs),
+            dict(self.classes),
+            [child.clone() for child in self.children],
+        )
+
+
+def freeze_tree(node: PUINode, copies: Dict[int, PUINode]) -> PUINode:
+    """Returns a frozen copy of `node`, `copies` maps the id of every copied node to its copy
+
+    Frozen elements are shared as they are
+    """
+    if isinstance(node, PUIFrozenElement):
+        return node
+    if isinstance(node, PUIElement):
+        copy: PUINode = PUIFrozenElement(
+            node.name,
+            node.attrs,
+            node.classes,
+            [freeze_tree(child, copies) for child in node.children],
+        )
+    else:
+        copy = node.clone()
+    copies[id(node)] = copy
+    return copy
+
+
+def thaw_paths(node: PUINode, targets: Set[int], copies: Dict[int, PUINode]) -> PUINode:
+    """Returns `node` with mutable copies of the `targets` (element ids) and of the elements above them
+
+    Copy-on-write: every other subtree is shared, `copies` maps the id of every copied element to its copy
+    """
+    if not isinstance(node, PUIElement):
+        return node
+    children = [thaw_paths(child, targets, copies) for child in node.children]
+    if id(node) not in targets and all(new is old for new, old in zip(children, node.children)):
+        return node
+    if node.__class__ is PUILayoutElement:
+        copy = PUILayoutElement(node.name, dict(node.attrs), dict(node.classes), children, split=node.split)
+        # The wrapper is below the layout, already copied when it was a target
+        copy.wrapper = copy if node.wrapper is node else copies.get(id(node.wrapper), node.wrapper)
+    else:
+        copy = PUIElement(node.name, dict(node.attrs), dict(node.classes), children)
+    copies[id(node)] = copy
+    return copy
+
+
+def from_bs4(element: "PageElement") -> PUINode:
+    """Returns a copy of a `bs4` element as a `PUINode`"""
+    from bs4 import Comment, Tag
+
+    if isinstance(element, Tag):
+        return PUIElement.from_tag(element)
+    if isinstance(element, Comment):
+        return PUICommentNode(str(element))
+    return PUITextNode(str(element))
+
+
+def to_node(child: Union[str, PUINode, "PageElement"]) -> PUINode:
+    if isinstance(child, PUINode):
+        return child
+    if child.__class__ is str:
+        return PUITextNode(child)
+
+    # Anything else may come from bs4 (`NavigableString` is also a `str`)
+    from bs4.element import PageElement
+
+    if isinstance(child, PageElement):
+        return from_bs4(child)
+    if isinstance(child, str):
+        return PUITextNode(child)
+    raise ValueError(f"Can not convert {child!r} to a node")
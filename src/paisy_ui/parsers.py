@@ -0,0 +1,181 @@
+import re
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+from .exceptions import PUIBuildError
+from .nodes import PUICommentNode, PUIElement, PUINode, PUITextNode
+from .render import PRESERVE_WHITESPACE_ELEMENTS, VOID_ELEMENTS
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+NodeParser = Callable[[str], List[PUINode]]
+
+DEFAULT_PARSER = "html.parser"
+# bs4 tree builders, their tree is converted to nodes afterwards
+BS4_PARSERS = ("html.parser", "lxml")
+# Parses straight to nodes, without bs4, see `PUIMinimalParser`
+MINIMAL_PARSER = "paisy"
+
+# Whitespace separated attributes, kept as a list by bs4 and joined back with single spaces (`HTMLTreeBuilder` defaults)
+LIST_ATTRIBUTES = {
+    "*": frozenset(("class", "accesskey", "dropzone")),
+    "a": frozenset(("rel", "rev")),
+    "link": frozenset(("rel", "rev")),
+    "td": frozenset(("headers",)),
+    "th": frozenset(("headers",)),
+    "form": frozenset(("accept-charset",)),
+    "object": frozenset(("archive",)),
+    "area": frozenset(("rel",)),
+    "icon": frozenset(("sizes",)),
+    "iframe": frozenset(("sandbox",)),
+    "output": frozenset(("for",)),
+}
+# Top level elements lxml moves into the `<head>` it adds around fragments
+_DOCUMENT_ELEMENTS = frozenset(("html", "head", "body"))
+_FIRST_TAG = re.compile(r"<\s*([a-zA-Z][^\s/>]*)")
+
+
+class PUIMinimalParser(HTMLParser):
+    """Builds nodes straight from trusted markup such as the component docstrings
+
+    Matches the `html.parser` tree of bs4 for well formed html, without the bs4 tree (and its conversion) in between.
+    Doctypes and processing instructions are dropped, unmatched end tags are ignored.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = PUIElement("[document]")
+        self._stack = [self.root]
+        self._data: List[str] = []
+
+    def _flush(self) -> None:
+        if not self._data:
+            return
+        text = "".join(self._data)
+        self._data = []
+        # Same as bs4: whitespace-only strings collapse to a single space or line break
+        if not text.strip(" \t\n\r\f") and not any(
+            element.name in PRESERVE_WHITESPACE_ELEMENTS for element in self._stack
+        ):
+            text = "\n" if "\n" in text else " "
+        self._stack[-1].children.append(PUITextNode(text))
+
+    def handle_starttag(self, tag, attrs) -> None:
+        self._flush()
+        element = PUIElement(tag)
+        list_attributes = LIST_ATTRIBUTES["*"] | LIST_ATTRIBUTES.get(tag, frozenset())
+        for key, value in attrs:
+            value = "" if value is None else value
+            if key == "class":
+                element.classes = dict.fromkeys(value.split())
+            elif key in list_attributes:
+                element.attrs[key] = " ".join(value.split())
+            else:
+                element.attrs[key] = value
+        self._stack[-1].children.append(element)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(element)
+
+    def handle_endtag(self, tag) -> None:
+        self._flush()
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].name == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data) -> None:
+        self._data.append(data)
+
+    def handle_comment(self, data) -> None:
+        self._flush()
+        self._stack[-1].children.append(PUICommentNode(data))
+
+    def parse(self, raw_html: str) -> List[PUINode]:
+        self.feed(raw_html)
+        self.close()
+        self._flush()
+        return self.root.children
+
+
+def parse_minimal(raw_html: str) -> List[PUINode]:
+    """Returns the top level nodes of `raw_html`, see `PUIMinimalParser`"""
+    return PUIMinimalParser().parse(raw_html)
+
+
+_node_parsers: Dict[str, NodeParser] = {MINIMAL_PARSER: parse_minimal}
+_parser = DEFAULT_PARSER
+
+
+def register_parser(name: str, parse: NodeParser) -> None:
+    """Makes `parse` (markup to top level nodes) available to `set_parser` as `name`"""
+    if name in BS4_PARSERS:
+        raise ValueError(f"{name} is a bs4 parser")
+    _node_parsers[name] = parse
+
+
+def get_parser() -> str:
+    return _parser
+
+
+def set_parser(name: str) -> None:
+    """Selects the backend used by `parse_html` and `parse_nodes` when none is given
+
+    Templates compiled before the switch are kept, so this is best called on startup, before any component is built
+    """
+    global _parser
+    check_parser(name)
+    _parser = name
+
+
+def check_parser(name: str) -> None:
+    """Raises `PUIBuildError` when `name` is not registered or its library is not installed"""
+    if name in _node_parsers:
+        return
+    if name not in BS4_PARSERS:
+        raise PUIBuildError(
+            f"Unknown parser {name} (expected one of {', '.join(available_parsers())})"
+        )
+    from bs4.builder import builder_registry
+
+    if builder_registry.lookup(name) is None:
+        raise PUIBuildError(f"Parser {name} is not installed")
+
+
+def available_parsers() -> List[str]:
+    """Returns the registered parsers, bs4 builders included"""
+    return [*BS4_PARSERS, *_node_parsers]
+
+
+def is_node_parser(name: str) -> bool:
+    return name in _node_parsers
+
+
+def parse_node_list(raw_html: str, parser: str) -> List[PUINode]:
+    return _node_parsers[parser](raw_html)
+
+
+def parse_tag_list(raw_html: str, parser: str) -> list:
+    """Returns the top level elements of `raw_html` parsed by the bs4 builder `parser`"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(raw_html, parser)
+    if parser != "lxml":
+        return soup.contents
+    return _unwrap_lxml(soup, raw_html)
+
+
+def _unwrap_lxml(soup, raw_html: str) -> list:
+    # lxml always completes a document, fragments end up in its `<head>` (metadata) or `<body>`
+    match = _FIRST_TAG.match(raw_html)
+    if match and match.group(1).lower() in _DOCUMENT_ELEMENTS:
+        tag: "Tag" = soup.find(match.group(1).lower())
+        return [tag] if tag is not None else []
+    if soup.html is None:
+        return soup.contents
+    contents = []
+    for name in ("head", "body"):
+        tag = soup.html.find(name, recursive=False)
+        if tag is not None:
+            contents.extend(tag.contents)
+    return contents
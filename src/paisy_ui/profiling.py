@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import Dict, Iterator, Optional
+
+
+@dataclass
+class PUITimings:
+    count: int = 0
+    seconds: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+
+
+@dataclass
+class PUIProfile:
+    """What happened while a `profile()` block was active, `as_dict()` is ready to be logged"""
+
+    parse_html: PUITimings = field(default_factory=PUITimings)
+    # Construction time per component class, including the components built inside it
+    builds: Dict[str, PUITimings] = field(default_factory=dict)
+    find: PUITimings = field(default_factory=PUITimings)
+    render: PUITimings = field(default_factory=PUITimings)
+    nodes_rendered: int = 0
+
+    def add_build(self, class_name: str, seconds: float) -> None:
+        timings = self.builds.get(class_name)
+        if timings is None:
+            timings = self.builds[class_name] = PUITimings()
+        timings.add(seconds)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+_current: ContextVar[Optional[PUIProfile]] = ContextVar("paisy_ui_profile", default=None)
+
+
+def active() -> Optional[PUIProfile]:
+    """Returns the profile collecting in the current context, if any"""
+    return _current.get()
+
+
+@contextmanager
+def profile() -> Iterator[PUIProfile]:
+    """Collects parse, build, `find()` and render timings of the current context (thread or task)
+
+    Nothing is recorded outside of this block, the library only checks whether a profile is active
+    """
+    report = PUIProfile()
+    token = _current.set(report)
+    try:
+        yield report
+    finally:
+        _current.reset(token)
+
+
+def timed_render(pieces: Iterator[str], report: PUIProfile) -> Iterator[str]:
+    """Yields `pieces`, adding the time spent producing them to `report.render`"""
+    seconds = 0.0
+    iterator = iter(pieces)
+    while True:
+        start = perf_counter()
+        try:
+            piece = next(iterator)
+        except StopIteration:
+            seconds += perf_counter() - start
+            break
+        seconds += perf_counter() - start
+        yield piece
+    report.render.add(seconds)
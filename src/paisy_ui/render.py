@@ -0,0 +1,672 @@
+import struct
+import threading
+import zlib
+from functools import lru_cache
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .nodes import PUICommentNode, PUIElement, PUILayoutElement, PUINode, PUITextNode
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+DEFAULT_GZIP_LEVEL = 6
+# No file name nor modification time, so the same html always gzips to the same bytes
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+# Distance a deflate block can refer back to
+DEFLATE_WINDOW = 32 * 1024
+# Last deflate block of a stream, fixed Huffman codes and no data
+EMPTY_FINAL_BLOCK = b"\x03\x00"
+
+# Same html5 rules as `Tag.prettify(formatter="html5")`, these sets are bs4's `HTMLTreeBuilder` defaults
+INDENT = " "
+VOID_ELEMENTS = frozenset(
+    "area base basefont bgsound br col command embed frame hr image img input isindex keygen link menuitem "
+    "meta nextid param source spacer track wbr".split()
+)
+PRESERVE_WHITESPACE_ELEMENTS = frozenset(("pre", "textarea"))
+CDATA_ELEMENTS = frozenset(("script", "style"))
+
+
+@lru_cache(maxsize=None)
+def _formatter():
+    # bs4 is only needed once something is rendered
+    from bs4.formatter import HTMLFormatter
+
+    return HTMLFormatter.REGISTRY["html5"]
+
+
+# Attribute values and texts repeat a lot across a page, and entity substitution is the costliest step
+@lru_cache(maxsize=8192)
+def _substitute(text: str) -> str:
+    return _formatter().substitute(text)
+
+
+@lru_cache(maxsize=8192)
+def _format_attribute(key: str, value: str) -> str:
+    return f"{key}={_formatter().quoted_attribute_value(_substitute(value))}"
+
+
+_START_ELEMENT = 0
+_END_ELEMENT = 1
+_EMPTY_ELEMENT = 2
+_STRING = 3
+# A repeated subtree, rendered through `PUIRenderMemo` instead of being walked
+_MEMOIZED = 4
+# A nested layout, rendered from its shell instead of being walked
+_LAYOUT = 5
+
+
+def _event_stream(
+    root: PUIElement, memo: Optional["PUIRenderMemo"] = None
+) -> Iterator[Tuple[int, PUINode, Optional[PUIElement]]]:
+    """Walks `root` in document order without recursion, yielding (event, node, parent)"""
+    repeated = memo.repeated if memo is not None else None
+    if root.name in VOID_ELEMENTS and not root.children:
+        yield _EMPTY_ELEMENT, root, None
+        return
+
+    yield _START_ELEMENT, root, None
+    stack = [(root, iter(root.children))]
+    while stack:
+        element, children = stack[-1]
+        for child in children:
+            if not isinstance(child, PUIElement):
+                yield _STRING, child, element
+            elif child.name in VOID_ELEMENTS and not child.children:
+                yield _EMPTY_ELEMENT, child, element
+            elif repeated and id(child) in repeated:
+                yield _MEMOIZED, child, element
+            elif child.__class__ is PUILayoutElement and child.wrapper is not None:
+                yield _LAYOUT, child, element
+            else:
+                yield _START_ELEMENT, child, element
+                stack.append((child, iter(child.children)))
+                break
+        else:
+            stack.pop()
+            yield _END_ELEMENT, element, None
+
+
+def _format_start(element: PUIElement) -> str:
+    if not element.attrs and not element.classes:
+        return f"<{element.name}>"
+
+    items = list(element.attrs.items())
+    if element.classes:
+        items.append(("class", " ".join(element.classes)))
+    items.sort()
+
+    attrs = []
+    for key, value in items:
+        if value is None or value == "":
+            attrs.append(key)
+            continue
+        if isinstance(value, (list, tuple)):
+            value = " ".join(value)
+        elif not isinstance(value, str):
+            value = str(value)
+        attrs.append(_format_attribute(key, value))
+    return f"<{element.name} {' '.join(attrs)}>"
+
+
+def attrs_key(attrs: Dict[str, Any]) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """The attributes as `_format_start` writes them (`None` for a bare one), equal keys render the same
+
+    Plain values would not do: `1`, `1.0` and `True` are equal in python but render differently
+    """
+    if not attrs:
+        return None
+    items = []
+    for key, value in attrs.items():
+        if value is None or value == "":
+            value = None
+        elif isinstance(value, (list, tuple)):
+            value = " ".join(value)
+        elif not isinstance(value, str):
+            value = str(value)
+        items.append((key, value))
+    return tuple(items)
+
+
+def _format_string(node: PUINode, parent: PUIElement) -> str:
+    if isinstance(node, PUICommentNode):
+        return f"<!--{node.text}-->"
+    if parent.name in CDATA_ELEMENTS:
+        return node.text
+    return _substitute(node.text)
+
+
+def _iter_compact(root: PUIElement, memo: Optional["PUIRenderMemo"] = None) -> Iterator[str]:
+    """Yields the html of `root` without any added whitespace, matching `Tag.decode(formatter="html5")`"""
+    for event, node, parent in _event_stream(root, memo):
+        if event is _MEMOIZED:
+            yield memo.render(node, None, lambda: "".join(_iter_compact(node)))
+        elif event is _LAYOUT:
+            yield from _iter_layout(node, False, 0, memo)
+        elif event is _STRING:
+            piece = _format_string(node, parent)
+            if piece:
+                yield piece
+        elif event is _END_ELEMENT:
+            yield f"</{node.name}>"
+        else:
+            yield _format_start(node)
+
+
+def iter_render(
+    root: PUIElement,
+    pretty: bool = True,
+    indent_level: int = 0,
+    memo: Optional["PUIRenderMemo"] = None,
+) -> Iterator[str]:
+    """Yields the html of `root` piece by piece, repeated subtrees are rendered once when given a `memo`
+
+    Prettified output matches `Tag.prettify(formatter="html5")`, compact output matches `Tag.decode(formatter="html5")`
+    """
+    if memo is not None:
+        memo.prepare(root)
+    yield from _iter_tree(root, pretty, indent_level, memo)
+
+
+def _iter_tree(
+    root: PUIElement, pretty: bool, indent_level: int, memo: Optional["PUIRenderMemo"]
+) -> Iterator[str]:
+    # `iter_render` once `memo` is prepared
+    if not pretty:
+        yield from _iter_compact(root, memo)
+        return
+
+    indent = INDENT
+    # Element (e.g. <pre>) whose contents must be written as-is, see `Tag.decode`
+    string_literal_element = None
+
+    for event, node, parent in _event_stream(root, memo):
+        if event is _MEMOIZED:
+            if string_literal_element is None:
+                level = indent_level
+                yield memo.render(
+                    node, level, lambda: "".join(iter_render(node, indent_level=level))
+                )
+            else:
+                # Nothing is indented inside a string literal element, same as compact output
+                yield memo.render(node, None, lambda: "".join(_iter_compact(node)))
+            continue
+        if event is _LAYOUT:
+            if string_literal_element is None:
+                yield from _iter_layout(node, True, indent_level, memo)
+            else:
+                yield from _iter_layout(node, False, 0, memo)
+            continue
+
+        if event is _STRING:
+            piece = _format_string(node, parent)
+        elif event is _END_ELEMENT:
+            piece = f"</{node.name}>"
+            indent_level -= 1
+        else:
+            piece = _format_start(node)
+
+        indent_before = indent_after = string_literal_element is None
+        if (
+            event is _START_ELEMENT
+            and string_literal_element is None
+            and node.name in PRESERVE_WHITESPACE_ELEMENTS
+        ):
+            indent_after = False
+            string_literal_element = node
+        elif event is _END_ELEMENT and node is string_literal_element:
+            indent_before = False
+            indent_after = True
+            string_literal_element = None
+
+        if indent_before or indent_after:
+            if event is _STRING:
+                piece = piece.strip()
+            if piece:
+                if indent_before and indent_level:
+                    piece = indent * indent_level + piece
+                if indent_after:
+                    piece += "\n"
+        if event is _START_ELEMENT:
+            indent_level += 1
+
+        if piece:
+            yield piece
+
+
+class PUIRenderMemo:
+    """Renders every repeated subtree once per render pass, keeping at most `maxsize` of them
+
+    Subtrees are fingerprinted by numbering every distinct (name, attrs, classes, children fingerprints) structure of
+    the pass, equal fingerprints always render the same. `hits` and `misses` accumulate across passes while the
+    rendered subtrees are dropped by `reset`
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # id() of every repeated element of the prepared trees -> fingerprint
+        self.repeated: Dict[int, int] = {}
+        self._prepared: Dict[int, PUIElement] = {}
+        # Structure of every distinct subtree of the pass -> its fingerprint
+        self._structures: Dict[Tuple[Any, ...], int] = {}
+        self._rendered: Dict[Tuple[int, Optional[int]], str] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.2f})"
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        """Starts a new render pass, must be called before rendering a tree that changed"""
+        self.repeated.clear()
+        self._prepared.clear()
+        self._structures.clear()
+        self._rendered.clear()
+
+    def prepare(self, *roots: PUIElement) -> None:
+        """Fingerprints the subtrees of `roots` (unless already done in this pass) to find the repeated ones"""
+        elements: List[PUIElement] = []
+        for root in roots:
+            if id(root) in self._prepared:
+                continue
+            # Keeps the tree alive so that its id()s stay unique during the pass
+            self._prepared[id(root)] = root
+            stack = [root]
+            while stack:
+                element = stack.pop()
+                elements.append(element)
+                for child in element.children:
+                    if isinstance(child, PUIElement):
+                        stack.append(child)
+
+        # In reversed preorder every element comes after its descendants
+        fingerprints: Dict[int, int] = {}
+        counts: Dict[int, int] = {}
+        structures = self._structures
+        for element in reversed(elements):
+            children = []
+            for child in element.children:
+                if child.__class__ is PUITextNode:
+                    children.append(child.text)
+                elif isinstance(child, PUIElement):
+                    children.append(fingerprints[id(child)])
+                else:
+                    children.append((child.__class__, child.text))
+            structure = (element.name, attrs_key(element.attrs), tuple(element.classes), *children)
+            fingerprint = structures.setdefault(structure, len(structures))
+            fingerprints[id(element)] = fingerprint
+            counts[fingerprint] = counts.get(fingerprint, 0) + 1
+
+        repeated = self.repeated
+        for key, fingerprint in fingerprints.items():
+            if counts[fingerprint] > 1:
+                repeated[key] = fingerprint
+
+    def render(self, element: PUIElement, indent_level: Optional[int], render: Callable[[], str]) -> str:
+        """Returns the html of a repeated `element`, calling `render` only for the first one"""
+        key = (self.repeated[id(element)], indent_level)
+        html = self._rendered.get(key)
+        if html is not None:
+            self.hits += 1
+            return html
+
+        self.misses += 1
+        html = render()
+        if len(self._rendered) >= self.maxsize:
+            self._rendered.pop(next(iter(self._rendered)))
+        self._rendered[key] = html
+        return html
+
+
+def render_chunks(
+    root: PUIElement,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+    pretty: bool = True,
+) -> Iterator[bytes]:
+    """Yields the encoded html of `root` in chunks of `chunk_size` bytes (the last one may be shorter)"""
+    return encode_chunks(
+        iter_render(root, pretty=pretty), chunk_size=chunk_size, encoding=encoding
+    )
+
+
+def encode_chunks(
+    pieces: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> Iterator[bytes]:
+    """Encodes html pieces into chunks of `chunk_size` bytes, reusing the bytes of `StaticSegment`s"""
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive (received {chunk_size})")
+
+    pending: List[str] = []
+    size = 0
+    buffer = b""
+    for piece in pieces:
+        if isinstance(piece, StaticSegment) and encoding == "utf-8":
+            buffer += "".join(pending).encode(encoding) + piece.encoded
+            pending.clear()
+            size = 0
+        else:
+            pending.append(piece)
+            size += len(piece)
+            if size < chunk_size:
+                continue
+            buffer += "".join(pending).encode(encoding)
+            pending.clear()
+            size = 0
+
+        while len(buffer) >= chunk_size:
+            yield buffer[:chunk_size]
+            buffer = buffer[chunk_size:]
+
+    buffer += "".join(pending).encode(encoding)
+    if buffer:
+        yield buffer
+
+
+def write_pieces(
+    pieces: Iterable[str],
+    fp: IO[bytes],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Writes html pieces to the binary file `fp` in utf-8, about `chunk_size` characters per write, returns the bytes written
+
+    The html is never joined into one string, `StaticSegment`s are written with the bytes they keep
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive (received {chunk_size})")
+
+    written = 0
+    pending: List[str] = []
+    size = 0
+    for piece in pieces:
+        if isinstance(piece, StaticSegment):
+            if pending:
+                written += fp.write("".join(pending).encode("utf-8"))
+                pending.clear()
+                size = 0
+            written += fp.write(piece.encoded)
+            continue
+        pending.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            written += fp.write("".join(pending).encode("utf-8"))
+            pending.clear()
+            size = 0
+    if pending:
+        written += fp.write("".join(pending).encode("utf-8"))
+    return written
+
+
+def gzip_chunks(
+    pieces: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    level: int = DEFAULT_GZIP_LEVEL,
+) -> Iterator[bytes]:
+    """Gzips html pieces, every chunk covers about `chunk_size` bytes of html and ends on a sync flush
+
+    `StaticSegment`s are compressed once and spliced into the stream as they are, only the html between them is
+    compressed here. The chunks joined are a single gzip member, e.g. for a `Content-Encoding: gzip` response.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive (received {chunk_size})")
+
+    yield GZIP_HEADER
+    # Created once html between segments shows up, deflate streams are costly to set up
+    compressor = None
+    window = b""
+    crc = 0
+    size = 0
+    pending: List[str] = []
+    pending_size = 0
+    for piece in pieces:
+        static = isinstance(piece, StaticSegment)
+        if not static:
+            pending.append(piece)
+            pending_size += len(piece)
+            if pending_size < chunk_size:
+                continue
+
+        compressed = b""
+        if pending:
+            data = "".join(pending).encode("utf-8")
+            pending.clear()
+            pending_size = 0
+            if compressor is None:
+                compressor = _compressor(level, window)
+            crc = zlib.crc32(data, crc)
+            size += len(data)
+            compressed = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if static and piece:
+            window = piece.encoded[-DEFLATE_WINDOW:]
+            crc = zlib.crc32(piece.encoded, crc)
+            size += len(piece.encoded)
+            compressed += piece.deflated(level)
+            # The html that follows may refer back to the segment, a new stream starts with it as dictionary
+            compressor = None
+        if compressed:
+            yield compressed
+
+    if pending or compressor is not None:
+        data = "".join(pending).encode("utf-8")
+        crc = zlib.crc32(data, crc)
+        size += len(data)
+        compressor = compressor or _compressor(level, window)
+        last = compressor.compress(data) + compressor.flush()
+    else:
+        last = EMPTY_FINAL_BLOCK
+    yield last + struct.pack("<II", crc, size & 0xFFFFFFFF)
+
+
+def _compressor(level: int, window: bytes) -> "zlib._Compress":
+    if window:
+        return zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=window)
+    return zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+
+class StaticSegment(str):
+    """Pre-rendered html that also keeps its utf-8 bytes, so streaming does not encode it again"""
+
+    encoded: bytes
+    _deflated: Dict[int, bytes]
+
+    def __new__(cls, html: str) -> "StaticSegment":
+        segment = super().__new__(cls, html)
+        segment.encoded = html.encode("utf-8")
+        segment._deflated = {}
+        return segment
+
+    def deflated(self, level: int = DEFAULT_GZIP_LEVEL) -> bytes:
+        """Raw deflate blocks of the segment, compressed once per level and sync flushed so any stream can splice them in"""
+        blocks = self._deflated.get(level)
+        if blocks is None:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+            blocks = compressor.compress(self.encoded) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._deflated[level] = blocks
+        return blocks
+
+
+class PUIShell:
+    """The html before and after the dynamic children of a layout wrapper, rendered once"""
+
+    __slots__ = ("prefix", "suffix", "indent_level")
+
+    def __init__(self, prefix: str, suffix: str, indent_level: int):
+        self.prefix = StaticSegment(prefix)
+        self.suffix = StaticSegment(suffix)
+        # Indentation of the wrapper children in prettified output
+        self.indent_level = indent_level
+
+
+SHELL_CACHE_SIZE = 64
+_shells: Dict[Tuple[Any, ...], PUIShell] = {}
+# Renders run on threads too (see `aio.PUIRenderPool`)
+_shells_lock = threading.Lock()
+_SPLICE_MARKER = "\x00"
+
+
+def _path_to(root: PUIElement, target: PUIElement) -> Optional[List[PUIElement]]:
+    """Returns the elements from `root` down to `target` (compared by identity)"""
+    stack = [(root, [root])]
+    while stack:
+        element, path = stack.pop()
+        if element is target:
+            return path
+        for child in element.children:
+            if isinstance(child, PUIElement):
+                stack.append((child, [*path, child]))
+    return None
+
+
+def _shell_key(
+    root: PUIElement, wrapper: PUIElement, split: int, pretty: bool, indent_level: int
+) -> Tuple[Any, ...]:
+    """Describes the whole tree except the wrapper children after `split`, two trees with the same key render the same shell"""
+    key: List[Any] = [pretty, indent_level if pretty else 0]
+    stack: List[PUINode] = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, PUIElement):
+            children = node.children[:split] if node is wrapper else node.children
+            key.append((node.name, attrs_key(node.attrs), tuple(node.classes), len(children)))
+            stack.extend(reversed(children))
+        else:
+            key.append((type(node), node.text))
+    return tuple(key)
+
+
+def _build_shell(
+    root: PUIElement, path: List[PUIElement], split: int, pretty: bool, indent_level: int
+) -> PUIShell:
+    # Copies only the elements leading to the wrapper, every other node is shared with `root`
+    copies = [
+        PUIElement(element.name, element.attrs, element.classes, list(element.children))
+        for element in path
+    ]
+    for parent, element, copy in zip(copies, path[1:], copies[1:]):
+        parent.children[next(i for i, c in enumerate(parent.children) if c is element)] = copy
+    wrapper = copies[-1]
+    wrapper.children = [*wrapper.children[:split], PUITextNode(_SPLICE_MARKER)]
+
+    html = "".join(iter_render(copies[0], pretty=pretty, indent_level=indent_level))
+    prefix, suffix = html.split(_SPLICE_MARKER)
+    if pretty:
+        # Drops the indentation and line break added around the marker
+        prefix = prefix.rstrip(INDENT)
+        suffix = suffix[1:]
+    return PUIShell(prefix, suffix, indent_level=indent_level + len(path))
+
+
+def get_shell(
+    root: PUIElement, wrapper: PUIElement, split: int, pretty: bool = True, indent_level: int = 0
+) -> Optional[PUIShell]:
+    """Returns the cached shell of `root` around the `wrapper` children after `split`, `None` if it can not have one
+
+    Prettified shells are indented by `indent_level`, as `root` is when nested that deep
+    """
+    path = _path_to(root, wrapper)
+    if path is None or any(
+        element.name in PRESERVE_WHITESPACE_ELEMENTS or element.name in CDATA_ELEMENTS
+        for element in path
+    ):
+        return None
+
+    key = _shell_key(root, wrapper, split, pretty, indent_level)
+    with _shells_lock:
+        shell = _shells.get(key)
+    if shell is None:
+        # Built outside of the lock, two threads may both build a new shell
+        shell = _build_shell(root, path, split, pretty, indent_level)
+        with _shells_lock:
+            while _shells and len(_shells) >= SHELL_CACHE_SIZE:
+                _shells.pop(next(iter(_shells)))
+            _shells[key] = shell
+    return shell
+
+
+def iter_render_children(
+    parent: PUIElement,
+    children: List[PUINode],
+    pretty: bool = True,
+    indent_level: int = 0,
+    memo: Optional[PUIRenderMemo] = None,
+) -> Iterator[str]:
+    """Yields the html of `children` of `parent` as they would render inside it"""
+    if memo is not None:
+        memo.prepare(*(child for child in children if isinstance(child, PUIElement)))
+    yield from _iter_children(parent, children, pretty, indent_level, memo)
+
+
+def _iter_children(
+    parent: PUIElement,
+    children: List[PUINode],
+    pretty: bool,
+    indent_level: int,
+    memo: Optional[PUIRenderMemo],
+) -> Iterator[str]:
+    # `iter_render_children` once `memo` is prepared
+    indent = INDENT * indent_level
+    for child in children:
+        if isinstance(child, PUIElement):
+            if memo is not None and id(child) in memo.repeated:
+                yield memo.render(
+                    child,
+                    indent_level if pretty else None,
+                    lambda: "".join(iter_render(child, pretty=pretty, indent_level=indent_level)),
+                )
+            elif child.__class__ is PUILayoutElement and child.wrapper is not None:
+                yield from _iter_layout(child, pretty, indent_level, memo)
+            else:
+                yield from _iter_tree(child, pretty, indent_level, memo)
+            continue
+        piece = _format_string(child, parent)
+        if pretty:
+            piece = piece.strip()
+            if piece:
+                piece = f"{indent}{piece}\n"
+        if piece:
+            yield piece
+
+
+def iter_render_shell(
+    root: PUIElement,
+    wrapper: PUIElement,
+    split: int,
+    pretty: bool = True,
+    memo: Optional[PUIRenderMemo] = None,
+) -> Iterator[str]:
+    """Same output as `iter_render(root)`, with everything but the `wrapper` children after `split` from the cached shell"""
+    shell = get_shell(root, wrapper, split, pretty=pretty)
+    if shell is None:
+        yield from iter_render(root, pretty=pretty, memo=memo)
+        return
+
+    yield shell.prefix
+    yield from iter_render_children(
+        wrapper,
+        wrapper.children[split:],
+        pretty=pretty,
+        indent_level=shell.indent_level,
+        memo=memo,
+    )
+    yield shell.suffix
+
+
+def _iter_layout(
+    root: PUILayoutElement, pretty: bool, indent_level: int, memo: Optional[PUIRenderMemo]
+) -> Iterator[str]:
+    """A nested layout (its tree already prepared in `memo`), from its shell when it can have one"""
+    wrapper = root.wrapper
+    split = len(wrapper.children) if root.split is None else root.split
+    shell = get_shell(root, wrapper, split, pretty=pretty, indent_level=indent_level)
+    if shell is None:
+        yield from _iter_tree(root, pretty, indent_level, memo)
+        return
+
+    yield shell.prefix
+    yield from _iter_children(wrapper, wrapper.children[split:], pretty, shell.indent_level, memo)
+    yield shell.suffix
@@ -0,0 +1,283 @@
+import ast
+import json
+import os
+import runpy
+import sys
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .batch import PUIBatchReport, render_batch
+from .core import PUIComponentABC
+from .exceptions import PUIBuildError
+
+MANIFEST_NAME = ".paisy-ui-manifest.json"
+MANIFEST_VERSION = 1
+# Module level name holding the page, a component or a function building it
+PAGE_NAME = "page"
+# Fewer stale pages are rendered in the current process, starting a pool costs more
+PARALLEL_THRESHOLD = 4
+
+# (source file, directories it may import its modules from)
+PageTask = Tuple[str, Tuple[str, ...]]
+
+
+@dataclass
+class PUISiteReport:
+    """Pages of a `build_site` call, as paths relative to the output directory"""
+
+    built: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    batch: Optional[PUIBatchReport] = None
+    seconds: float = 0.0
+
+
+@dataclass
+class _Module:
+    is_page: bool
+    imports: List[str]
+
+
+class _Sources:
+    """Hashes and imports of the python files read by one build, each file is read once"""
+
+    def __init__(self):
+        self._hashes: Dict[Path, Optional[str]] = {}
+        self._modules: Dict[Path, _Module] = {}
+
+    def hash(self, path: Path) -> Optional[str]:
+        if path not in self._hashes:
+            try:
+                self._hashes[path] = blake2b(path.read_bytes(), digest_size=16).hexdigest()
+            except OSError:
+                self._hashes[path] = None
+        return self._hashes[path]
+
+    def module(self, path: Path) -> _Module:
+        module = self._modules.get(path)
+        if module is None:
+            module = self._modules[path] = _parse_module(path)
+        return module
+
+    def dependencies(self, path: Path, roots: Tuple[Path, ...]) -> Set[Path]:
+        """The files below `roots` that `path` imports, directly or not"""
+        found: Set[Path] = set()
+        stack = [path]
+        while stack:
+            for name in self.module(stack.pop()).imports:
+                for dependency in _resolve_import(name, roots):
+                    if dependency != path and dependency not in found:
+                        found.add(dependency)
+                        stack.append(dependency)
+        return found
+
+
+def _defines_page(statement: ast.stmt) -> bool:
+    if isinstance(statement, ast.FunctionDef):
+        return statement.name == PAGE_NAME
+    if isinstance(statement, ast.Assign):
+        targets = statement.targets
+    elif isinstance(statement, ast.AnnAssign):
+        targets = [statement.target]
+    else:
+        return False
+    return any(isinstance(target, ast.Name) and target.id == PAGE_NAME for target in targets)
+
+
+def _parse_module(path: Path) -> _Module:
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    imports: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imports.append(node.module)
+            # `from package import module` imports a submodule
+            imports.extend(f"{node.module}.{alias.name}" for alias in node.names)
+    return _Module(is_page=any(_defines_page(statement) for statement in tree.body), imports=imports)
+
+
+def _resolve_import(name: str, roots: Tuple[Path, ...]) -> List[Path]:
+    """Files of the module `name` and of its packages, from the first root that has it"""
+    for root in roots:
+        files = []
+        directory = root
+        for part in name.split("."):
+            if (directory / part / "__init__.py").is_file():
+                directory = directory / part
+                files.append(directory / "__init__.py")
+            else:
+                if (directory / f"{part}.py").is_file():
+                    files.append(directory / f"{part}.py")
+                # The rest are attributes of the module
+                break
+        if files:
+            return files
+    return []
+
+
+def _toolchain_hash(pretty: Optional[bool]) -> str:
+    """Changes with the paisy_ui sources and the render options, every page is rebuilt then"""
+    digest = blake2b(f"{MANIFEST_VERSION}:{pretty}".encode(), digest_size=16)
+    package = Path(__file__).parent
+    for path in sorted(package.rglob("*.py")):
+        digest.update(path.relative_to(package).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def discover_pages(sources: Iterable[Union[str, Path]]) -> List[Tuple[Path, Path]]:
+    """(root, file) of every python file of `sources` (files or directories), skipping `_` prefixed names"""
+    found = []
+    for source in sources:
+        source = Path(source).resolve()
+        if source.is_file():
+            found.append((source.parent, source))
+            continue
+        if not source.is_dir():
+            raise PUIBuildError(f"Source {source} does not exist")
+        for path in sorted(source.rglob("*.py")):
+            relative = path.relative_to(source).parts
+            if not any(part.startswith((".", "_")) for part in relative):
+                found.append((source, path))
+    return found
+
+
+def load_page(task: PageTask) -> PUIComponentABC:
+    """Runs the page module (not as `__main__`) and returns its `page`, calling it when it is a function"""
+    source, search_path = task
+    modules = set(sys.modules)
+    sys.path[:0] = search_path
+    try:
+        namespace = runpy.run_path(source, run_name=f"paisy_ui_page_{Path(source).stem}")
+    finally:
+        del sys.path[: len(search_path)]
+        # Modules of the site are imported again by the next build, they may have changed
+        directories = tuple(os.path.join(directory, "") for directory in search_path)
+        for name in set(sys.modules) - modules:
+            file = getattr(sys.modules[name], "__file__", None) or ""
+            if file.startswith(directories):
+                del sys.modules[name]
+
+    page = namespace.get(PAGE_NAME)
+    if page is not None and not isinstance(page, PUIComponentABC) and callable(page):
+        page = page()
+    if not isinstance(page, PUIComponentABC):
+        raise PUIBuildError(f"{source} has no `{PAGE_NAME}` component")
+    return page
+
+
+def _output_name(index: int, task: Tuple[PageTask, str]) -> str:
+    return task[1]
+
+
+def _load_task(task: Tuple[PageTask, str]) -> PUIComponentABC:
+    return load_page(task[0])
+
+
+def _read_manifest(path: Path, toolchain: str) -> Dict[str, dict]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("toolchain") != toolchain:
+        return {}
+    return manifest.get("pages", {})
+
+
+def _write_manifest(path: Path, toolchain: str, pages: Dict[str, dict]) -> None:
+    manifest = {"version": MANIFEST_VERSION, "toolchain": toolchain, "pages": pages}
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+    temporary.replace(path)
+
+
+def build_site(
+    sources: Iterable[Union[str, Path]],
+    output_dir: Union[str, Path],
+    processes: Optional[int] = None,
+    pretty: Optional[bool] = None,
+    force: bool = False,
+) -> PUISiteReport:
+    """Writes the `page` of every module of `sources` as html to `output_dir`, e.g. `pages/blog.py` to `blog.html`
+
+    Pages whose module, the site modules it imports, paisy_ui and `pretty` did not change since the last build
+    (see the manifest in `output_dir`) are skipped, the others are rendered on a process pool of `processes`.
+    """
+    start = perf_counter()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / MANIFEST_NAME
+    toolchain = _toolchain_hash(pretty)
+    previous = {} if force else _read_manifest(manifest_path, toolchain)
+
+    files = _Sources()
+    report = PUISiteReport()
+    pages: Dict[str, dict] = {}
+    stale: List[Tuple[Tuple[PageTask, str], str, dict]] = []
+    for root, path in discover_pages(sources):
+        key = path.as_posix()
+        roots = (path.parent,) if path.parent == root else (path.parent, root)
+        digest = files.hash(path)
+        entry = previous.get(key)
+        if (
+            entry is not None
+            and entry["hash"] == digest
+            and all(files.hash(Path(dependency)) == hashed for dependency, hashed in entry["dependencies"].items())
+            and (entry["output"] is None or (output_dir / entry["output"]).is_file())
+        ):
+            pages[key] = entry
+            if entry["output"] is not None:
+                report.unchanged.append(entry["output"])
+            continue
+
+        module = files.module(path)
+        dependencies = {
+            dependency.as_posix(): files.hash(dependency)
+            for dependency in sorted(files.dependencies(path, roots))
+        }
+        output = path.relative_to(root).with_suffix(".html").as_posix() if module.is_page else None
+        entry = {"hash": digest, "dependencies": dependencies, "output": output}
+        if output is None:
+            pages[key] = entry
+            continue
+        (output_dir / output).parent.mkdir(parents=True, exist_ok=True)
+        task = ((str(path), tuple(str(directory) for directory in roots)), output)
+        stale.append((task, key, entry))
+
+    outputs = {entry["output"] for entry in pages.values()} | {task[1] for task, _, _ in stale}
+    for entry in previous.values():
+        if entry["output"] is not None and entry["output"] not in outputs:
+            (output_dir / entry["output"]).unlink(missing_ok=True)
+            report.removed.append(entry["output"])
+
+    try:
+        if processes == 1 or len(stale) < PARALLEL_THRESHOLD:
+            for (task, output), key, entry in stale:
+                page = load_page(task)
+                with open(output_dir / output, "wb") as file:
+                    page.render_to(file, pretty=pretty)
+                pages[key] = entry
+                report.built.append(output)
+        elif stale:
+            report.batch = PUIBatchReport()
+            written = render_batch(
+                _load_task,
+                [task for task, _, _ in stale],
+                processes=processes,
+                pretty=pretty,
+                output_dir=output_dir,
+                filename=_output_name,
+                report=report.batch,
+            )
+            for (_, key, entry), _ in zip(stale, written):
+                pages[key] = entry
+                report.built.append(entry["output"])
+    finally:
+        # Pages built before an error are kept
+        _write_manifest(manifest_path, toolchain, pages)
+        report.seconds = perf_counter() - start
+    return report
@@ -0,0 +1,134 @@
+import re
+from typing import Dict, Optional, Tuple
+
+from .exceptions import PUIBuildError
+from .nodes import PUIElement, PUITextNode
+from .utils import find_path, parse_nodes, take_wrapper
+
+# Names an element of the template, see `PUIComponentABC.anchor`. Removed from the markup when the template is compiled
+ANCHOR_ATTRIBUTE = "pui-anchor"
+# A `[[name]]` text marks a named slot, see `PUIComponentABC.slot`
+SLOT_MARKER = re.compile(r"\[\[([\w-]+)\]\]")
+# Same, keeping the marker when splitting a text around it
+SLOT_SPLIT = re.compile(r"(\[\[[\w-]+\]\])")
+
+
+class PUITemplate:
+    """Component markup parsed once and cloned for every new instance"""
+
+    node: PUIElement
+    wrapper_path: Optional[Tuple[int, ...]]
+    anchor_paths: Dict[str, Tuple[int, ...]]
+    slot_paths: Dict[str, Tuple[int, ...]]
+
+    def __init__(
+        self,
+        raw_html: str,
+        wrapper_content_indicator="[[content]]",
+        parser: Optional[str] = None,
+    ):
+        node, wrapper = parse_nodes(
+            raw_html, wrapper_content_indicator=wrapper_content_indicator, parser=parser
+        )
+        # Markers on consecutive lines are parsed as one text, e.g. `[[actions]][[content]]`
+        if split_markers(node) and wrapper is None:
+            wrapper = take_wrapper(node, wrapper_content_indicator)
+        self.node = node
+        self.wrapper_path = find_path(node, wrapper) if wrapper is not None else None
+        self.anchor_paths = index_anchors(node)
+        self.slot_paths = index_slots(node)
+
+    def build(self) -> Tuple[PUIElement, Optional[PUIElement]]:
+        """Returns a fresh copy of the root element and of its wrapper, same as `parse_nodes`"""
+        node = self.node.clone()
+        if self.wrapper_path is None:
+            return node, None
+
+        wrapper = node
+        for index in self.wrapper_path:
+            wrapper = wrapper.children[index]
+        return node, wrapper
+
+    def anchors(self, node: PUIElement) -> Dict[str, PUIElement]:
+        """Returns the anchored elements of `node`, a copy returned by `build()` that was not changed since"""
+        anchors = {}
+        if not self.anchor_paths:
+            return anchors
+        for name, path in self.anchor_paths.items():
+            element = node
+            for index in path:
+                element = element.children[index]
+            anchors[name] = element
+        return anchors
+
+    def slots(self, node: PUIElement) -> Dict[str, Tuple[PUIElement, PUITextNode]]:
+        """Returns the (parent, placeholder) of every named slot of `node`, a copy returned by `build()`"""
+        slots = {}
+        if not self.slot_paths:
+            return slots
+        for name, path in self.slot_paths.items():
+            parent = node
+            for index in path[:-1]:
+                parent = parent.children[index]
+            slots[name] = (parent, parent.children[path[-1]])
+        return slots
+
+
+def index_anchors(root: PUIElement) -> Dict[str, Tuple[int, ...]]:
+    """Removes the `pui-anchor` attributes below `root` (included), returning the path to each anchored element"""
+    paths = {}
+    stack = [(root, ())]
+    while stack:
+        element, path = stack.pop()
+        name = element.attrs.pop(ANCHOR_ATTRIBUTE, None)
+        if name is not None:
+            if name in paths:
+                raise PUIBuildError(f"Duplicated {ANCHOR_ATTRIBUTE} {name}")
+            paths[name] = path
+        for index, child in enumerate(element.children):
+            if isinstance(child, PUIElement):
+                stack.append((child, (*path, index)))
+    return paths
+
+
+def split_markers(root: PUIElement) -> bool:
+    """Gives every `[[name]]` marker below `root` a text of its own, returns whether some text was split"""
+    split = False
+    stack = [root]
+    while stack:
+        element = stack.pop()
+        children = []
+        changed = False
+        for child in element.children:
+            if isinstance(child, PUIElement):
+                stack.append(child)
+            elif child.__class__ is PUITextNode and not SLOT_MARKER.fullmatch(child.text):
+                parts = SLOT_SPLIT.split(child.text)
+                if len(parts) > 1:
+                    changed = True
+                    children.extend(PUITextNode(part) for part in parts if part)
+                    continue
+            children.append(child)
+        if changed:
+            element.children = children
+            split = True
+    return split
+
+
+def index_slots(root: PUIElement) -> Dict[str, Tuple[int, ...]]:
+    """Replaces the `[[name]]` markers below `root` with empty placeholder texts, returning the path to each one"""
+    paths = {}
+    stack = [(root, ())]
+    while stack:
+        element, path = stack.pop()
+        for index, child in enumerate(element.children):
+            if isinstance(child, PUIElement):
+                stack.append((child, (*path, index)))
+            elif child.__class__ is PUITextNode and (match := SLOT_MARKER.fullmatch(child.text)):
+                name = match.group(1)
+                if name in paths:
+                    raise PUIBuildError(f"Duplicated slot {name}")
+                # Slotted children are inserted before the placeholder, which renders nothing
+                element.children[index] = PUITextNode("")
+                paths[name] = (*path, index)
+    return paths
@@ -1,10 +1,13 @@
-from typing import Optional, Tuple
+from time import perf_counter
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 from uuid import NAMESPACE_DNS, uuid4, uuid5
 
-from bs4 import BeautifulSoup, Tag
-from bs4.element import NavigableString
-
+from . import parsers, profiling
 from .exceptions import PUIBuildError
+from .nodes import PUIElement, PUINode, PUITextNode
+
+if TYPE_CHECKING:
+    from bs4 import Tag
 
 
 def generate_unique_id(name: Optional[str] = None):
@@ -13,18 +16,53 @@ def generate_unique_id(name: Optional[str] = None):
 
 
 def parse_html(
-    raw_html: str, wrapper_content_indicator="[[content]]"
-) -> Tuple[Tag, Optional[Tag]]:
-    """Returns a `Tag` representing the root element, also returns a secondary `Tag` if there is a wrapper inside the html"""
+    raw_html: str, wrapper_content_indicator="[[content]]", parser: Optional[str] = None
+) -> Tuple["Tag", Optional["Tag"]]:
+    """Returns a `Tag` representing the root element, also returns a secondary `Tag` if there is a wrapper inside the html
+
+    `parser` names the backend (default `parsers.get_parser()`), see `parsers.available_parsers()`
+    """
+    report = profiling.active()
+    if report is None:
+        return _parse_html(raw_html, wrapper_content_indicator, parser)
+
+    start = perf_counter()
+    try:
+        return _parse_html(raw_html, wrapper_content_indicator, parser)
+    finally:
+        report.parse_html.add(perf_counter() - start)
+
+
+def _normalize_html(raw_html: str) -> str:
     use_line_break = "script" in raw_html
-    raw_html = "".join(
+    return "".join(
         f"{'\n' if use_line_break else ''}{s.strip()}" for s in raw_html.split("\n")
     ).strip()
-    soup = BeautifulSoup(raw_html.strip("\n"), "html.parser")
-    if not soup.contents:
+
+
+def _parse_html(
+    raw_html: str, wrapper_content_indicator: str, parser: Optional[str]
+) -> Tuple["Tag", Optional["Tag"]]:
+    from bs4 import Tag
+    from bs4.element import NavigableString
+
+    parser = parser or parsers.get_parser()
+    if parsers.is_node_parser(parser):
+        # Same result as a bs4 builder, through nodes
+        node, wrapper_node = _parse_nodes(raw_html, wrapper_content_indicator, parser)
+        tag = node.to_tag()
+        if wrapper_node is None:
+            return tag, None
+        wrapper = tag
+        for index in find_path(node, wrapper_node):
+            wrapper = wrapper.contents[index]
+        return tag, wrapper
+
+    contents = parsers.parse_tag_list(_normalize_html(raw_html), parser)
+    if not contents:
         raise PUIBuildError("Empty HTML")
 
-    first_element = soup.contents[0]
+    first_element = contents[0]
     if not isinstance(first_element, Tag):
         raise PUIBuildError(f"Tag expected (reveiced {type(first_element)})")
 
@@ -45,13 +83,116 @@ def parse_html(
     return tag, wrapper
 
 
-def add_css(tag: Tag, *classes) -> Tag:
-    """Includes a list o classes in the Tag css without replacing it"""
+def _parse_nodes(
+    raw_html: str, wrapper_content_indicator: str, parser: str
+) -> Tuple[PUIElement, Optional[PUIElement]]:
+    contents = parsers.parse_node_list(_normalize_html(raw_html), parser)
+    if not contents:
+        raise PUIBuildError("Empty HTML")
+
+    node = contents[0]
+    if not isinstance(node, PUIElement):
+        raise PUIBuildError(f"PUIElement expected (reveiced {type(node)})")
+    return node, take_wrapper(node, wrapper_content_indicator)
+
+
+def take_wrapper(root: PUIElement, wrapper_content_indicator: str) -> Optional[PUIElement]:
+    """Empties the first text below `root` equal to the indicator, returning its parent (the wrapper) if any"""
+    # Same lookup as `Tag.find(string=...)`, the first text equal to the indicator in document order
+    stack = [(root, iter(enumerate(root.children)))]
+    while stack:
+        element, children = stack[-1]
+        for index, child in children:
+            if isinstance(child, PUIElement):
+                stack.append((child, iter(enumerate(child.children))))
+                break
+            if child.__class__ is PUITextNode and child.text == wrapper_content_indicator:
+                element.children[index] = PUITextNode("")
+                return element
+        else:
+            stack.pop()
+    return None
+
+
+def find_path(
+    root: Union["Tag", PUIElement], tag: Union["Tag", PUIElement]
+) -> Tuple[int, ...]:
+    """Returns the `contents` indexes leading from `root` to `tag`"""
+    if isinstance(root, PUIElement):
+        return _find_node_path(root, tag)
+
+    path = []
+    while tag is not root:
+        parent = tag.parent
+        # `Tag.__eq__` compares markup, so equal siblings must be told apart by identity
+        path.append(next(i for i, c in enumerate(parent.contents) if c is tag))
+        tag = parent
+    return tuple(reversed(path))
+
+
+def _find_node_path(root: PUIElement, node: PUIElement) -> Tuple[int, ...]:
+    # Nodes have no parent pointer, the path is searched from the root
+    stack = [(root, ())]
+    while stack:
+        element, path = stack.pop()
+        if element is node:
+            return path
+        for index, child in enumerate(element.children):
+            if isinstance(child, PUIElement):
+                stack.append((child, (*path, index)))
+    raise PUIBuildError(f"{node} is not inside {root}")
+
+
+def parse_nodes(
+    raw_html: str, wrapper_content_indicator="[[content]]", parser: Optional[str] = None
+) -> Tuple[PUIElement, Optional[PUIElement]]:
+    """Same as `parse_html`, returning `PUIElement`s instead of `Tag`s"""
+    parser = parser or parsers.get_parser()
+    if parsers.is_node_parser(parser):
+        report = profiling.active()
+        if report is None:
+            return _parse_nodes(raw_html, wrapper_content_indicator, parser)
+
+        start = perf_counter()
+        try:
+            return _parse_nodes(raw_html, wrapper_content_indicator, parser)
+        finally:
+            report.parse_html.add(perf_counter() - start)
+
+    tag, wrapper = parse_html(
+        raw_html, wrapper_content_indicator=wrapper_content_indicator, parser=parser
+    )
+    node = PUIElement.from_tag(tag)
+    if wrapper is None:
+        return node, None
+
+    node_wrapper = node
+    for index in find_path(tag, wrapper):
+        node_wrapper = node_wrapper.children[index]
+    return node, node_wrapper
+
+
+def parse_markup(raw_html: str, parser: Optional[str] = None) -> List[PUINode]:
+    """Returns the nodes of an html fragment, e.g. a title given as markup. Plain text skips the parser"""
+    if "<" not in raw_html and "&" not in raw_html and "\n" not in raw_html:
+        return [PUITextNode(raw_html)] if raw_html else []
+    node, _ = parse_nodes(f"<div>{raw_html}</div>", parser=parser)
+    return list(node.children)
+
+
+def add_css(tag: Union["Tag", PUIElement], *classes) -> Union["Tag", PUIElement]:
+    """Includes a list o classes in the Tag css without replacing it, classes already there are not repeated"""
+    if isinstance(tag, PUIElement):
+        tag.add_class(*classes)
+        return tag
+
     _class = tag.attrs.get("class", "")
     if isinstance(_class, list):
         _class = " ".join(_class)
-    _classes = [_class, *classes]
-    tag.attrs["class"] = " ".join(_classes).strip()
+    _classes = dict.fromkeys(_class.split())
+    for _new_class in classes:
+        _classes.update(dict.fromkeys(_new_class.split()))
+    tag.attrs["class"] = " ".join(_classes)
     return tag
 
 